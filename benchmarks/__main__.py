@@ -0,0 +1,59 @@
+import argparse
+import itertools
+import time
+
+from .bench_execute import (Execute,
+                            is_supported)
+
+
+def main() -> None:
+    engines_names, workloads_names, operations_names, vertices_counts = (
+        Execute.params)
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description='Times engines '
+                                                 'on deterministic workloads.')
+    parser.add_argument('--engine',
+                        choices=engines_names,
+                        action='append',
+                        dest='engines_names')
+    parser.add_argument('--workload',
+                        choices=workloads_names,
+                        action='append',
+                        dest='workloads_names')
+    parser.add_argument('--operation',
+                        choices=operations_names,
+                        action='append',
+                        dest='operations_names')
+    parser.add_argument('--max-vertices-count',
+                        type=int,
+                        default=max(vertices_counts))
+    parser.add_argument('--repeat',
+                        type=int,
+                        default=3)
+    arguments = parser.parse_args()
+    benchmark = Execute()
+    print('engine', 'workload', 'operation', 'vertices_count', 'seconds',
+          sep='\t')
+    for parameters in itertools.product(
+            arguments.engines_names or engines_names,
+            arguments.workloads_names or workloads_names,
+            arguments.operations_names or operations_names,
+            [vertices_count
+             for vertices_count in vertices_counts
+             if vertices_count <= arguments.max_vertices_count]):
+        engine_name, workload_name, _, vertices_count = parameters
+        if not is_supported(engine_name, workload_name, vertices_count):
+            continue
+        benchmark.setup(*parameters)
+        times = []
+        for _ in range(arguments.repeat):
+            start = time.perf_counter()
+            benchmark.time_execute(*parameters)
+            times.append(time.perf_counter() - start)
+        print(*parameters, '{:.6f}'.format(min(times)),
+              sep='\t',
+              flush=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+from .engines import (engines,
+                      to_wagyu)
+from .workloads import workloads
+
+operations_names = ['DIFFERENCE', 'INTERSECTION', 'UNION', 'XOR']
+vertices_counts = [10, 100, 1000, 10000]
+# the Python engine is roughly two orders of magnitude slower,
+# self-intersecting workloads grow quadratically with vertices count
+max_vertices_counts = {'_wagyu': {'scribble': 100},
+                       'wagyu': {'scribble': 100}}
+default_max_vertices_counts = {'_wagyu': 10000,
+                               'wagyu': 1000}
+
+
+def is_supported(engine_name: str,
+                 workload_name: str,
+                 vertices_count: int) -> bool:
+    return vertices_count <= max_vertices_counts[engine_name].get(
+            workload_name, default_max_vertices_counts[engine_name])
+
+
+class Execute:
+    params = (sorted(engines), sorted(workloads), operations_names,
+              vertices_counts)
+    param_names = ('engine', 'workload', 'operation', 'vertices_count')
+    timeout = 600
+
+    def setup(self,
+              engine_name: str,
+              workload_name: str,
+              operation_name: str,
+              vertices_count: int) -> None:
+        if not is_supported(engine_name, workload_name, vertices_count):
+            raise NotImplementedError
+        self.engine = engines[engine_name]
+        self.subject, self.clip = workloads[workload_name](vertices_count)
+        self.operation_kind = getattr(self.engine.OperationKind,
+                                      operation_name)
+
+    def time_execute(self,
+                     engine_name: str,
+                     workload_name: str,
+                     operation_name: str,
+                     vertices_count: int) -> None:
+        (to_wagyu(self.engine, self.subject, self.clip)
+         .execute(self.operation_kind, self.engine.FillKind.EVEN_ODD,
+                  self.engine.FillKind.EVEN_ODD))
@@ -0,0 +1,55 @@
+import platform
+from types import ModuleType
+from typing import (Any,
+                    Dict,
+                    NamedTuple)
+
+import wagyu
+from wagyu import (enums,
+                   linear_ring,
+                   point,
+                   wagyu as ported_wagyu)
+
+from .workloads import (RawContour,
+                        RawContours)
+
+Engine = NamedTuple('Engine', [('name', str),
+                               ('Wagyu', Any),
+                               ('LinearRing', Any),
+                               ('Point', Any),
+                               ('OperationKind', Any),
+                               ('FillKind', Any),
+                               ('PolygonKind', Any)])
+
+
+def to_wagyu(engine: Engine,
+             subject: RawContours,
+             clip: RawContours) -> Any:
+    result = engine.Wagyu()
+    for contour in subject:
+        result.add_linear_ring(_to_linear_ring(engine, contour),
+                               engine.PolygonKind.SUBJECT)
+    for contour in clip:
+        result.add_linear_ring(_to_linear_ring(engine, contour),
+                               engine.PolygonKind.CLIP)
+    return result
+
+
+def _to_engine(name: str, module: ModuleType) -> Engine:
+    return Engine(name, module.Wagyu, module.LinearRing, module.Point,
+                  module.OperationKind, module.FillKind, module.PolygonKind)
+
+
+def _to_linear_ring(engine: Engine, contour: RawContour) -> Any:
+    points = [engine.Point(x, y) for x, y in contour]
+    return engine.LinearRing(points + points[:1])
+
+
+engines = {wagyu.__name__: Engine(wagyu.__name__, ported_wagyu.Wagyu,
+                                  linear_ring.LinearRing, point.Point,
+                                  enums.OperationKind, enums.FillKind,
+                                  enums.PolygonKind)}  # type: Dict[str, Engine]
+if platform.python_implementation() == 'CPython':
+    import _wagyu
+
+    engines[_wagyu.__name__] = _to_engine(_wagyu.__name__, _wagyu)
@@ -0,0 +1,93 @@
+import math
+from random import Random
+from typing import (Callable,
+                    Dict,
+                    List,
+                    Tuple)
+
+RawPoint = Tuple[int, int]
+RawContour = List[RawPoint]
+RawContours = List[RawContour]
+Workload = Callable[[int], Tuple[RawContours, RawContours]]
+
+
+def grid(vertices_count: int) -> Tuple[RawContours, RawContours]:
+    """Grid of small squares against the same grid shifted by half a cell."""
+    side = max(int(math.sqrt(vertices_count // 4)), 1)
+    subject = [_to_square(column * 10, row * 10, 8)
+               for row in range(side)
+               for column in range(side)]
+    clip = [_translate(contour, 5, 5) for contour in subject]
+    return subject, clip
+
+
+def near_collinear(vertices_count: int) -> Tuple[RawContours, RawContours]:
+    """Sawtooth strips with unit amplitude along the x-axis."""
+    half_count = max(vertices_count // 2, 2)
+    bottom = [(index * 7, index % 2) for index in range(half_count)]
+    top = [(index * 7, 10 + (index + 1) % 2)
+           for index in reversed(range(half_count))]
+    subject = [bottom + top]
+    clip = [_translate(subject[0], 3, 1)]
+    return subject, clip
+
+
+def nested_holes(vertices_count: int) -> Tuple[RawContours, RawContours]:
+    """Concentric squares, every second one oriented as a hole."""
+    count = max(vertices_count // 4, 1)
+    subject = []  # type: RawContours
+    for index in range(count):
+        contour = _to_square(-10 * (index + 1), -10 * (index + 1),
+                             20 * (index + 1))
+        subject.append(contour[::-1] if index % 2 else contour)
+    clip = [_translate(contour, 5, 5) for contour in subject]
+    return subject, clip
+
+
+def scribble(vertices_count: int) -> Tuple[RawContours, RawContours]:
+    """Self-intersecting contours through pseudo-random points."""
+    random = Random(vertices_count)
+    limit = 10 * max(vertices_count, 3)
+    subject = [[(random.randint(0, limit), random.randint(0, limit))
+                for _ in range(max(vertices_count, 3))]]
+    clip = [[(random.randint(0, limit), random.randint(0, limit))
+             for _ in range(max(vertices_count, 3))]]
+    return subject, clip
+
+
+def star(vertices_count: int) -> Tuple[RawContours, RawContours]:
+    """Many-vertex star against the same star rotated by half a spike."""
+    spikes_count = max(vertices_count // 2, 3)
+    inner_radius, outer_radius = 100 * spikes_count, 1000 * spikes_count
+    subject = [_to_star(spikes_count, inner_radius, outer_radius, 0.)]
+    clip = [_to_star(spikes_count, inner_radius, outer_radius,
+                     math.pi / (2 * spikes_count))]
+    return subject, clip
+
+
+workloads = {'grid': grid,
+             'near_collinear': near_collinear,
+             'nested_holes': nested_holes,
+             'scribble': scribble,
+             'star': star}  # type: Dict[str, Workload]
+
+
+def _to_square(x: int, y: int, side: int) -> RawContour:
+    return [(x, y), (x + side, y), (x + side, y + side), (x, y + side)]
+
+
+def _to_star(spikes_count: int,
+             inner_radius: int,
+             outer_radius: int,
+             angle_offset: float) -> RawContour:
+    result = []
+    for index in range(2 * spikes_count):
+        radius = outer_radius if index % 2 else inner_radius
+        angle = angle_offset + math.pi * index / spikes_count
+        result.append((round(radius * math.cos(angle)),
+                       round(radius * math.sin(angle))))
+    return result
+
+
+def _translate(contour: RawContour, step_x: int, step_y: int) -> RawContour:
+    return [(x + step_x, y + step_y) for x, y in contour]
@@ -15,7 +15,8 @@ def read_file(path_string: str) -> str:
 
 parameters = dict(
         name=wagyu.__name__,
-        packages=find_packages(exclude=('tests', 'tests.*')),
+        packages=find_packages(exclude=('benchmarks', 'benchmarks.*',
+                                         'tests', 'tests.*')),
         version=wagyu.__version__,
         description=wagyu.__doc__,
         long_description=read_file('README.md'),
@@ -105,7 +106,8 @@ if platform.python_implementation() == 'CPython':
             for extension in self.extensions:
                 extension.extra_compile_args = compile_args
                 extension.extra_link_args = link_args
-                extension.define_macros = define_macros
+                extension.define_macros = (define_macros
+                                           + extension.define_macros)
             super().build_extensions()
 
 
@@ -115,12 +117,20 @@ if platform.python_implementation() == 'CPython':
             return pybind11.get_include()
 
 
+    def to_extension(coordinate_type: str, suffix: str = '') -> Extension:
+        name = '_' + wagyu.__name__ + suffix
+        return Extension(name, glob('src/*.cpp'),
+                         include_dirs=[LazyPybindInclude(),
+                                       Path.cwd() / 'include'],
+                         define_macros=[('MODULE_NAME', name),
+                                        ('COORDINATE_TYPE', coordinate_type)],
+                         language='c++')
+
+
     parameters.update(
             cmdclass={'build_ext': BuildExt},
-            ext_modules=[Extension('_' + wagyu.__name__,
-                                   glob('src/*.cpp'),
-                                   include_dirs=[LazyPybindInclude(),
-                                                 Path.cwd() / 'include'],
-                                   language='c++')],
+            ext_modules=[to_extension('double'),
+                         to_extension('std::int64_t', '_int64'),
+                         to_extension('std::int32_t', '_int32')],
             zip_safe=False)
 setup(**parameters)
@@ -1,9 +1,13 @@
+#define USE_WAGYU_INTERRUPT
+
 #include <pybind11/functional.h>
 #include <pybind11/operators.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
 #include <algorithm>
+#include <atomic>
+#include <chrono>
 #include <mapbox/geometry/box.hpp>
 #include <mapbox/geometry/multi_polygon.hpp>
 #include <mapbox/geometry/point.hpp>
@@ -14,6 +18,7 @@
 #include <mapbox/geometry/wagyu/edge.hpp>
 #include <mapbox/geometry/wagyu/local_minimum.hpp>
 #include <mapbox/geometry/wagyu/point.hpp>
+#include <mapbox/geometry/wagyu/quick_clip.hpp>
 #include <mapbox/geometry/wagyu/ring.hpp>
 #include <mapbox/geometry/wagyu/wagyu.hpp>
 #include <sstream>
@@ -21,15 +26,24 @@
 
 namespace py = pybind11;
 
+#ifndef MODULE_NAME
 #define MODULE_NAME _wagyu
+#endif
+#ifndef COORDINATE_TYPE
+#define COORDINATE_TYPE double
+#endif
 #define C_STR_HELPER(a) #a
 #define C_STR(a) C_STR_HELPER(a)
 #define BOUND_NAME "Bound"
 #define BOX_NAME "Box"
 #define EDGE_NAME "Edge"
 #define EDGE_SIDE_NAME "EdgeSide"
+#define EXECUTE_STATS_NAME "ExecuteStats"
 #define FILL_KIND_NAME "FillKind"
 #define INTERSECT_NODE_NAME "IntersectNode"
+#define INTERRUPTED_NAME "Interrupted"
+#define INTERRUPTER_NAME "Interrupter"
+#define INTERSECTION_POINT_NAME "IntersectionPoint"
 #define LINEAR_RING_NAME "LinearRing"
 #define MULTIPOLYGON_NAME "Multipolygon"
 #define LOCAL_MINIMUM_NAME "LocalMinimum"
@@ -42,7 +56,7 @@ namespace py = pybind11;
 #define RING_MANAGER_NAME "RingManager"
 #define WAGYU_NAME "Wagyu"
 
-using coordinate_t = double;
+using coordinate_t = COORDINATE_TYPE;
 using ActiveBoundList =
     mapbox::geometry::wagyu::active_bound_list<coordinate_t>;
 using Box = mapbox::geometry::box<coordinate_t>;
@@ -55,6 +69,8 @@ using FillKind = mapbox::geometry::wagyu::fill_type;
 using HotPixelVector = mapbox::geometry::wagyu::hot_pixel_vector<coordinate_t>;
 using IntersectList = mapbox::geometry::wagyu::intersect_list<coordinate_t>;
 using IntersectNode = mapbox::geometry::wagyu::intersect_node<coordinate_t>;
+using IntersectionPoint = mapbox::geometry::point<double>;
+using HasFloatingCoordinates = std::is_same<coordinate_t, double>;
 using LinearRing = mapbox::geometry::linear_ring<coordinate_t>;
 using LocalMinimum = mapbox::geometry::wagyu::local_minimum<coordinate_t>;
 using LocalMinimumList =
@@ -146,6 +162,47 @@ static PointNode* points_to_point_node(RingPtr ring,
   return result;
 };
 
+static std::vector<Point> buffer_to_points(const py::buffer& buffer) {
+  const auto info = buffer.request();
+  const bool is_flat = info.ndim == 1 && info.shape[0] % 2 == 0;
+  if (!is_flat && !(info.ndim == 2 && info.shape[1] == 2)) {
+    std::ostringstream stream;
+    stream << "Array should have shape (N, 2) or (2 * N,), but found (";
+    for (std::size_t index = 0; index < info.shape.size(); ++index)
+      stream << (index ? ", " : "") << info.shape[index];
+    stream << (info.shape.size() == 1 ? ",)." : ").");
+    throw std::invalid_argument(stream.str());
+  }
+  std::vector<Point> result;
+  const py::ssize_t size = is_flat ? info.shape[0] / 2 : info.shape[0];
+  result.reserve(size);
+  if (info.format != py::format_descriptor<coordinate_t>::format() ||
+      info.itemsize != sizeof(coordinate_t)) {
+    py::list values = py::memoryview(buffer).attr("tolist")();
+    for (py::ssize_t index = 0; index < size; ++index) {
+      if (is_flat) {
+        result.emplace_back(values[2 * index].cast<coordinate_t>(),
+                            values[2 * index + 1].cast<coordinate_t>());
+      } else {
+        py::sequence row = values[index];
+        result.emplace_back(row[0].cast<coordinate_t>(),
+                            row[1].cast<coordinate_t>());
+      }
+    }
+    return result;
+  }
+  const auto* data = static_cast<const char*>(info.ptr);
+  const auto column_stride = is_flat ? info.strides[0] : info.strides[1];
+  const auto row_stride = is_flat ? 2 * column_stride : info.strides[0];
+  for (py::ssize_t index = 0; index < size; ++index) {
+    const auto* x = data + index * row_stride;
+    const auto* y = x + column_stride;
+    result.emplace_back(*reinterpret_cast<const coordinate_t*>(x),
+                        *reinterpret_cast<const coordinate_t*>(y));
+  }
+  return result;
+}
+
 static std::size_t get_bound_current_edge_index(const Bound& self) {
   std::size_t index = self.current_edge - self.edges.begin();
   return std::min(index, self.edges.size());
@@ -177,6 +234,379 @@ static void set_ring_manager_current_hot_pixel_index(RingManager& manager,
       manager.hot_pixels.begin() + std::min(value, manager.hot_pixels.size());
 }
 
+static void push_ring_to_arrays(RingPtr ring, bool reverse_output,
+                                std::vector<coordinate_t>& coordinates,
+                                std::vector<std::int64_t>& rings_offsets) {
+  const auto* first_node = ring->points;
+  const auto* cursor = first_node;
+  do {
+    coordinates.push_back(cursor->x);
+    coordinates.push_back(cursor->y);
+    cursor = reverse_output ? cursor->next : cursor->prev;
+  } while (cursor != first_node);
+  // close the ring
+  coordinates.push_back(first_node->x);
+  coordinates.push_back(first_node->y);
+  rings_offsets.push_back(coordinates.size() / 2);
+}
+
+static void build_result_arrays(const RingVector& rings, bool reverse_output,
+                                std::vector<coordinate_t>& coordinates,
+                                std::vector<std::int64_t>& rings_offsets,
+                                std::vector<std::int64_t>& polygons_offsets) {
+  for (auto* ring : rings) {
+    if (ring == nullptr) continue;
+    push_ring_to_arrays(ring, reverse_output, coordinates, rings_offsets);
+    for (auto* child : ring->children)
+      if (child != nullptr)
+        push_ring_to_arrays(child, reverse_output, coordinates, rings_offsets);
+    polygons_offsets.push_back(rings_offsets.size() - 1);
+    for (auto* child : ring->children)
+      if (child != nullptr)
+        build_result_arrays(child->children, reverse_output, coordinates,
+                            rings_offsets, polygons_offsets);
+  }
+}
+
+template <class Value>
+static py::object to_array(const std::vector<Value>& values) {
+  py::object result = py::module::import("array").attr("array")(
+      py::format_descriptor<Value>::format());
+  result.attr("frombytes")(py::memoryview::from_memory(
+      values.data(), values.size() * sizeof(Value)));
+  return result;
+}
+
+class Interrupted : public std::runtime_error {
+ public:
+  Interrupted() : std::runtime_error("Wagyu interrupted") {}
+};
+
+class Interrupter {
+ public:
+  explicit Interrupter(py::object deadline = py::none(), bool requested = false)
+      : requested(requested),
+        has_deadline(!deadline.is_none()),
+        deadline(has_deadline ? deadline.cast<double>() : 0.) {}
+
+  static double monotonic() {
+    return py::module::import("time").attr("monotonic")().cast<double>();
+  }
+
+  static std::unique_ptr<Interrupter> from_timeout(double timeout) {
+    return std::make_unique<Interrupter>(py::float_(monotonic() + timeout));
+  }
+
+  void check() const {
+    if (requested || (has_deadline && monotonic() >= deadline))
+      throw Interrupted();
+  }
+
+  py::object get_deadline() const {
+    return has_deadline ? py::object(py::float_(deadline)) : py::none();
+  }
+
+  void request() { requested = true; }
+
+  std::atomic<bool> requested;
+  bool has_deadline;
+  double deadline;
+};
+
+class InterruptionScope {
+ public:
+  using Clock = std::chrono::steady_clock;
+
+  explicit InterruptionScope(const Interrupter* interrupter)
+      : interrupter(interrupter), previous(current) {
+    if (interrupter != nullptr && interrupter->has_deadline) {
+      std::chrono::duration<double> timeout(interrupter->deadline -
+                                            Interrupter::monotonic());
+      deadline =
+          Clock::now() + std::chrono::duration_cast<Clock::duration>(timeout);
+    }
+    current = this;
+  }
+
+  ~InterruptionScope() { current = previous; }
+
+  bool is_requested() {
+    if (interrupter == nullptr) return false;
+    triggered = triggered || interrupter->requested ||
+                (interrupter->has_deadline && Clock::now() >= deadline);
+    return triggered;
+  }
+
+  static thread_local InterruptionScope* current;
+  const Interrupter* interrupter;
+  InterruptionScope* previous;
+  Clock::time_point deadline;
+  bool triggered = false;
+};
+
+thread_local InterruptionScope* InterruptionScope::current = nullptr;
+
+static bool is_interruption_requested() {
+  return InterruptionScope::current != nullptr &&
+         InterruptionScope::current->is_requested();
+}
+
+static void check_interruption() {
+  if (is_interruption_requested())
+    mapbox::geometry::wagyu::interrupt_request();
+  mapbox::geometry::wagyu::interrupt_check();
+}
+
+struct ExecuteStats {
+  using Clock = std::chrono::steady_clock;
+
+  template <class Phase>
+  static void measure(ExecuteStats* stats, double ExecuteStats::*time,
+                      Phase&& phase) {
+    if (stats == nullptr) return phase();
+    auto start = Clock::now();
+    phase();
+    stats->*time +=
+        std::chrono::duration<double>(Clock::now() - start).count();
+  }
+
+  double build_hot_pixels_time = 0.;
+  double execute_vatti_time = 0.;
+  double correct_topology_time = 0.;
+  double build_result_time = 0.;
+  std::size_t scanbeams_count = 0;
+  std::size_t active_bounds_peak = 0;
+  std::size_t intersections_count = 0;
+  std::size_t hot_pixels_count = 0;
+  std::size_t rings_created_count = 0;
+  std::size_t rings_removed_count = 0;
+};
+
+static std::size_t count_intersections(
+    coordinate_t top_y,
+    const mapbox::geometry::wagyu::active_bound_list<coordinate_t>&
+        active_bounds) {
+  // replays upstream ``build_intersect_list`` on a copy
+  // counting swaps instead of collecting intersections,
+  // so the sweep itself is left to upstream ``process_intersections``
+  mapbox::geometry::wagyu::active_bound_list<coordinate_t> bounds(
+      active_bounds);
+  mapbox::geometry::wagyu::update_current_x(bounds, top_y);
+  std::size_t result = 0;
+  mapbox::geometry::wagyu::bubble_sort(
+      bounds.begin(), bounds.end(),
+      mapbox::geometry::wagyu::intersection_compare<coordinate_t>(),
+      [&result](const BoundPtr&, const BoundPtr&) { ++result; });
+  return result;
+}
+
+static void build_hot_pixels_interruptibly(LocalMinimumList& minimums,
+                                           RingManager& manager) {
+  mapbox::geometry::wagyu::active_bound_list<coordinate_t> active_bounds;
+  mapbox::geometry::wagyu::scanbeam_list<coordinate_t> scanbeams;
+  auto scanline_y = std::numeric_limits<coordinate_t>::max();
+  mapbox::geometry::wagyu::local_minimum_ptr_list<coordinate_t>
+      sorted_minimums;
+  sorted_minimums.reserve(minimums.size());
+  for (auto& minimum : minimums) sorted_minimums.push_back(&minimum);
+  std::stable_sort(
+      sorted_minimums.begin(), sorted_minimums.end(),
+      mapbox::geometry::wagyu::local_minimum_sorter<coordinate_t>());
+  auto current_minimum = sorted_minimums.begin();
+  mapbox::geometry::wagyu::setup_scanbeam(minimums, scanbeams);
+  std::size_t reserve = 0;
+  for (auto& minimum : minimums)
+    reserve += minimum.left_bound.edges.size() +
+               minimum.right_bound.edges.size() + 4;
+  manager.hot_pixels.reserve(reserve);
+  while (mapbox::geometry::wagyu::pop_from_scanbeam(scanline_y, scanbeams) ||
+         current_minimum != sorted_minimums.end()) {
+    check_interruption();
+    mapbox::geometry::wagyu::process_hot_pixel_intersections(
+        scanline_y, active_bounds, manager);
+    mapbox::geometry::wagyu::insert_local_minima_into_ABL_hot_pixel(
+        scanline_y, sorted_minimums, current_minimum, active_bounds, manager,
+        scanbeams);
+    mapbox::geometry::wagyu::process_hot_pixel_edges_at_top_of_scanbeam(
+        scanline_y, scanbeams, active_bounds, manager);
+  }
+  mapbox::geometry::wagyu::preallocate_point_memory(manager,
+                                                    manager.hot_pixels.size());
+  mapbox::geometry::wagyu::sort_hot_pixels(manager);
+}
+
+static void execute_vatti_interruptibly(LocalMinimumList& minimums,
+                                        RingManager& manager,
+                                        OperationKind operation_kind,
+                                        FillKind subject_fill_kind,
+                                        FillKind clip_fill_kind,
+                                        ExecuteStats* stats) {
+  mapbox::geometry::wagyu::active_bound_list<coordinate_t> active_bounds;
+  mapbox::geometry::wagyu::scanbeam_list<coordinate_t> scanbeams;
+  auto scanline_y = std::numeric_limits<coordinate_t>::max();
+  mapbox::geometry::wagyu::local_minimum_ptr_list<coordinate_t>
+      sorted_minimums;
+  sorted_minimums.reserve(minimums.size());
+  for (auto& minimum : minimums) sorted_minimums.push_back(&minimum);
+  std::stable_sort(
+      sorted_minimums.begin(), sorted_minimums.end(),
+      mapbox::geometry::wagyu::local_minimum_sorter<coordinate_t>());
+  auto current_minimum = sorted_minimums.begin();
+  mapbox::geometry::wagyu::setup_scanbeam(minimums, scanbeams);
+  manager.current_hp_itr = manager.hot_pixels.begin();
+  while (mapbox::geometry::wagyu::pop_from_scanbeam(scanline_y, scanbeams) ||
+         current_minimum != sorted_minimums.end()) {
+    check_interruption();
+    if (stats != nullptr)
+      stats->intersections_count +=
+          count_intersections(scanline_y, active_bounds);
+    mapbox::geometry::wagyu::process_intersections(
+        scanline_y, active_bounds, operation_kind, subject_fill_kind,
+        clip_fill_kind, manager);
+    mapbox::geometry::wagyu::update_current_hp_itr(scanline_y, manager);
+    mapbox::geometry::wagyu::process_edges_at_top_of_scanbeam(
+        scanline_y, active_bounds, scanbeams, sorted_minimums,
+        current_minimum, manager, operation_kind, subject_fill_kind,
+        clip_fill_kind);
+    mapbox::geometry::wagyu::insert_local_minima_into_ABL(
+        scanline_y, sorted_minimums, current_minimum, active_bounds, manager,
+        scanbeams, operation_kind, subject_fill_kind, clip_fill_kind);
+    if (stats == nullptr) continue;
+    ++stats->scanbeams_count;
+    // processing of edges at top of scanbeam erases removed bounds,
+    // so there are no null pointers left
+    stats->active_bounds_peak =
+        std::max(stats->active_bounds_peak, active_bounds.size());
+  }
+}
+
+static void correct_topology_interruptibly(RingManager& manager) {
+  std::stable_sort(manager.all_points.begin(), manager.all_points.end(),
+                   mapbox::geometry::wagyu::point_ptr_cmp<coordinate_t>());
+  mapbox::geometry::wagyu::correct_orientations(manager);
+  check_interruption();
+  mapbox::geometry::wagyu::correct_collinear_edges(manager);
+  check_interruption();
+  mapbox::geometry::wagyu::correct_self_intersections(manager, false);
+  check_interruption();
+  mapbox::geometry::wagyu::correct_tree(manager);
+  bool fixed_intersections = true;
+  while (fixed_intersections) {
+    check_interruption();
+    mapbox::geometry::wagyu::correct_chained_rings(manager);
+    fixed_intersections =
+        mapbox::geometry::wagyu::correct_self_intersections(manager, true);
+  }
+}
+
+static void correct_topology_with_stats(RingManager& manager,
+                                        ExecuteStats* stats) {
+  if (stats == nullptr) return correct_topology_interruptibly(manager);
+  stats->hot_pixels_count += manager.hot_pixels.size();
+  std::size_t rings_count = manager.index;
+  std::vector<bool> rings_alive(rings_count);
+  for (const auto& ring : manager.rings)
+    rings_alive[ring.ring_index] = ring.points != nullptr;
+  ExecuteStats::measure(stats, &ExecuteStats::correct_topology_time,
+                        [&] { correct_topology_interruptibly(manager); });
+  stats->rings_created_count += manager.index - rings_count;
+  for (const auto& ring : manager.rings)
+    if (ring.points == nullptr &&
+        (ring.ring_index >= rings_count || rings_alive[ring.ring_index]))
+      ++stats->rings_removed_count;
+}
+
+static void execute_interruptibly(Wagyu& self, RingManager& manager,
+                                  OperationKind operation_kind,
+                                  FillKind subject_fill_kind,
+                                  FillKind clip_fill_kind,
+                                  InterruptionScope& scope,
+                                  ExecuteStats* stats) {
+  try {
+    check_interruption();
+    ExecuteStats::measure(stats, &ExecuteStats::build_hot_pixels_time, [&] {
+      build_hot_pixels_interruptibly(self.minima_list, manager);
+    });
+    check_interruption();
+    ExecuteStats::measure(stats, &ExecuteStats::execute_vatti_time, [&] {
+      execute_vatti_interruptibly(self.minima_list, manager, operation_kind,
+                                  subject_fill_kind, clip_fill_kind, stats);
+    });
+    check_interruption();
+    correct_topology_with_stats(manager, stats);
+  } catch (const std::runtime_error&) {
+    if (scope.triggered) throw Interrupted();
+    throw;
+  }
+}
+
+static Multipolygon wagyu_execute(Wagyu& self, OperationKind operation_kind,
+                                  FillKind subject_fill_kind,
+                                  FillKind clip_fill_kind,
+                                  const Interrupter* interrupter = nullptr,
+                                  ExecuteStats* stats = nullptr) {
+  Multipolygon result;
+  if (self.minima_list.empty()) return result;
+  InterruptionScope scope(interrupter);
+  {
+    py::gil_scoped_release release;
+    RingManager manager;
+    execute_interruptibly(self, manager, operation_kind, subject_fill_kind,
+                          clip_fill_kind, scope, stats);
+    ExecuteStats::measure(stats, &ExecuteStats::build_result_time, [&] {
+      mapbox::geometry::wagyu::build_result(result, manager,
+                                            self.reverse_output);
+    });
+  }
+  return result;
+}
+
+static py::tuple wagyu_execute_to_arrays(Wagyu& self,
+                                         OperationKind operation_kind,
+                                         FillKind subject_fill_kind,
+                                         FillKind clip_fill_kind,
+                                         const Interrupter* interrupter,
+                                         ExecuteStats* stats) {
+  std::vector<coordinate_t> coordinates;
+  std::vector<std::int64_t> rings_offsets{0}, polygons_offsets{0};
+  if (!self.minima_list.empty()) {
+    InterruptionScope scope(interrupter);
+    py::gil_scoped_release release;
+    RingManager manager;
+    execute_interruptibly(self, manager, operation_kind, subject_fill_kind,
+                          clip_fill_kind, scope, stats);
+    ExecuteStats::measure(stats, &ExecuteStats::build_result_time, [&] {
+      build_result_arrays(manager.children, self.reverse_output, coordinates,
+                          rings_offsets, polygons_offsets);
+    });
+  }
+  return py::make_tuple(to_array(coordinates), to_array(rings_offsets),
+                        to_array(polygons_offsets));
+}
+
+static std::vector<Multipolygon> wagyu_execute_many(
+    const py::iterable& pairs, OperationKind operation_kind,
+    FillKind subject_fill_kind, FillKind clip_fill_kind, bool reverse_output) {
+  std::vector<std::pair<Polygon, Polygon>> polygons_pairs;
+  for (const auto& pair : pairs)
+    polygons_pairs.push_back(pair.cast<std::pair<Polygon, Polygon>>());
+  std::vector<Multipolygon> result(polygons_pairs.size());
+  {
+    py::gil_scoped_release release;
+    for (std::size_t index = 0; index < polygons_pairs.size(); ++index) {
+      Wagyu wagyu;
+      wagyu.reverse_rings(reverse_output);
+      wagyu.add_polygon(polygons_pairs[index].first,
+                        PolygonKind::polygon_type_subject);
+      wagyu.add_polygon(polygons_pairs[index].second,
+                        PolygonKind::polygon_type_clip);
+      wagyu.execute(operation_kind, result[index], subject_fill_kind,
+                    clip_fill_kind);
+    }
+  }
+  return result;
+}
+
 static std::string bool_repr(bool value) { return py::str(py::bool_(value)); }
 
 template <class Object>
@@ -332,13 +762,29 @@ static std::ostream& operator<<(std::ostream& stream, const Bound& bound) {
                 << bound.poly_type << ", " << bound.side << ")";
 }
 
+template <class Point>
+static void write_intersection_point(std::ostream& stream, const Point& point,
+                                     std::true_type) {
+  stream << point;
+}
+
+template <class Point>
+static void write_intersection_point(std::ostream& stream, const Point& point,
+                                     std::false_type) {
+  stream << C_STR(MODULE_NAME) "." INTERSECTION_POINT_NAME "("
+         << std::string(py::repr(py::float_(point.x))) << ", "
+         << std::string(py::repr(py::float_(point.y))) << ")";
+}
+
 static std::ostream& operator<<(std::ostream& stream,
                                 const IntersectNode& node) {
   stream << C_STR(MODULE_NAME) "." INTERSECT_NODE_NAME "(";
   write_pointer(stream, node.bound1);
   stream << ", ";
   write_pointer(stream, node.bound2);
-  return stream << ", " << node.pt << ")";
+  stream << ", ";
+  write_intersection_point(stream, node.pt, HasFloatingCoordinates{});
+  return stream << ")";
 }
 
 static std::ostream& operator<<(std::ostream& stream, const Edge& edge) {
@@ -425,27 +871,50 @@ static bool operator==(const Wagyu& self, const Wagyu& other) {
 
 PYBIND11_MAKE_OPAQUE(LocalMinimumList);
 
+template <class Module>
+static void register_intersection_point(Module& m, std::true_type) {
+  // intersections are computed with coordinates of the same type
+  m.attr(INTERSECTION_POINT_NAME) = m.attr(POINT_NAME);
+}
+
+template <class Module>
+static void register_intersection_point(Module& m, std::false_type) {
+  py::class_<IntersectionPoint>(m, INTERSECTION_POINT_NAME,
+                                py::module_local())
+      .def(py::init<double, double>(), py::arg("x"), py::arg("y"))
+      .def(py::self == py::self)
+      .def("__repr__",
+           [](const IntersectionPoint& self) {
+             std::ostringstream stream;
+             mapbox::geometry::wagyu::write_intersection_point(
+                 stream, self, std::false_type{});
+             return stream.str();
+           })
+      .def_readonly("x", &IntersectionPoint::x)
+      .def_readonly("y", &IntersectionPoint::y);
+}
+
 PYBIND11_MODULE(MODULE_NAME, m) {
   m.doc() = R"pbdoc(Python binding of mapbox/wagyu library.)pbdoc";
   m.attr("__version__") = C_STR(VERSION_INFO);
 
-  py::enum_<OperationKind>(m, OPERATION_KIND_NAME)
+  py::enum_<OperationKind>(m, OPERATION_KIND_NAME, py::module_local())
       .value("INTERSECTION", OperationKind::clip_type_intersection)
       .value("UNION", OperationKind::clip_type_union)
       .value("DIFFERENCE", OperationKind::clip_type_difference)
       .value("XOR", OperationKind::clip_type_x_or);
 
-  py::enum_<EdgeSide>(m, EDGE_SIDE_NAME)
+  py::enum_<EdgeSide>(m, EDGE_SIDE_NAME, py::module_local())
       .value("LEFT", EdgeSide::edge_left)
       .value("RIGHT", EdgeSide::edge_right);
 
-  py::enum_<FillKind>(m, FILL_KIND_NAME)
+  py::enum_<FillKind>(m, FILL_KIND_NAME, py::module_local())
       .value("EVEN_ODD", FillKind::fill_type_even_odd)
       .value("NON_ZERO", FillKind::fill_type_non_zero)
       .value("POSITIVE", FillKind::fill_type_positive)
       .value("NEGATIVE", FillKind::fill_type_negative);
 
-  py::enum_<PolygonKind>(m, POLYGON_KIND_NAME)
+  py::enum_<PolygonKind>(m, POLYGON_KIND_NAME, py::module_local())
       .value("SUBJECT", PolygonKind::polygon_type_subject)
       .value("CLIP", PolygonKind::polygon_type_clip);
 
@@ -469,6 +938,12 @@ PYBIND11_MODULE(MODULE_NAME, m) {
   py::class_<LinearRing>(m, LINEAR_RING_NAME)
       .def(py::init<>())
       .def(py::init<const std::vector<Point>&>())
+      .def_static(
+          "from_array",
+          [](const py::buffer& array) {
+            return LinearRing(buffer_to_points(array));
+          },
+          py::arg("array"))
       .def(py::self == py::self)
       .def(py::pickle(&sequence_get_state<LinearRing>,
                       &sequence_set_state<LinearRing>))
@@ -487,6 +962,15 @@ PYBIND11_MODULE(MODULE_NAME, m) {
   py::class_<Polygon>(m, POLYGON_NAME)
       .def(py::init<>())
       .def(py::init<const std::vector<LinearRing>&>())
+      .def_static(
+          "from_arrays",
+          [](const py::iterable& arrays) {
+            Polygon result;
+            for (const auto& array : arrays)
+              result.emplace_back(buffer_to_points(array.cast<py::buffer>()));
+            return result;
+          },
+          py::arg("arrays"))
       .def(py::self == py::self)
       .def(py::pickle(&sequence_get_state<Polygon>,
                       &sequence_set_state<Polygon>))
@@ -699,8 +1183,11 @@ PYBIND11_MODULE(MODULE_NAME, m) {
         return scanbeams;
       });
 
+  register_intersection_point(m, HasFloatingCoordinates{});
+
   py::class_<IntersectNode>(m, INTERSECT_NODE_NAME)
-      .def(py::init<const BoundPtr&, const BoundPtr&, const Point&>(),
+      .def(py::init<const BoundPtr&, const BoundPtr&,
+                    const IntersectionPoint&>(),
            py::arg("first_bound"), py::arg("second_bound"), py::arg("point"))
       .def(py::self == py::self)
       .def("__lt__",
@@ -758,6 +1245,96 @@ PYBIND11_MODULE(MODULE_NAME, m) {
         return result;
       });
 
+  py::register_local_exception<Interrupted>(m, INTERRUPTED_NAME,
+                                           PyExc_RuntimeError);
+
+  py::class_<Interrupter>(m, INTERRUPTER_NAME, py::module_local())
+      .def(py::init<py::object, bool>(), py::arg("deadline") = py::none(),
+           py::arg("requested") = false)
+      .def("__repr__",
+           [](const Interrupter& self) {
+             return std::string(C_STR(MODULE_NAME) "." INTERRUPTER_NAME "(") +
+                    std::string(py::repr(self.get_deadline())) + ", " +
+                    bool_repr(self.requested) + ")";
+           })
+      .def_static("from_timeout", &Interrupter::from_timeout,
+                  py::arg("timeout"))
+      .def("check", &Interrupter::check)
+      .def("request", &Interrupter::request)
+      .def_property_readonly("deadline", &Interrupter::get_deadline)
+      .def_property_readonly("requested", [](const Interrupter& self) {
+        return static_cast<bool>(self.requested);
+      });
+
+  py::class_<ExecuteStats>(m, EXECUTE_STATS_NAME, py::module_local())
+      .def(py::init<>([](double build_hot_pixels_time,
+                         double execute_vatti_time,
+                         double correct_topology_time,
+                         double build_result_time, std::size_t scanbeams_count,
+                         std::size_t active_bounds_peak,
+                         std::size_t intersections_count,
+                         std::size_t hot_pixels_count,
+                         std::size_t rings_created_count,
+                         std::size_t rings_removed_count) {
+             return ExecuteStats{build_hot_pixels_time,
+                                 execute_vatti_time,
+                                 correct_topology_time,
+                                 build_result_time,
+                                 scanbeams_count,
+                                 active_bounds_peak,
+                                 intersections_count,
+                                 hot_pixels_count,
+                                 rings_created_count,
+                                 rings_removed_count};
+           }),
+           py::arg("build_hot_pixels_time") = 0.,
+           py::arg("execute_vatti_time") = 0.,
+           py::arg("correct_topology_time") = 0.,
+           py::arg("build_result_time") = 0., py::arg("scanbeams_count") = 0,
+           py::arg("active_bounds_peak") = 0,
+           py::arg("intersections_count") = 0,
+           py::arg("hot_pixels_count") = 0,
+           py::arg("rings_created_count") = 0,
+           py::arg("rings_removed_count") = 0)
+      .def("__repr__",
+           [](const ExecuteStats& self) {
+             std::ostringstream stream;
+             stream << C_STR(MODULE_NAME) "." EXECUTE_STATS_NAME "("
+                    << std::string(py::repr(py::float_(
+                           self.build_hot_pixels_time)))
+                    << ", "
+                    << std::string(
+                           py::repr(py::float_(self.execute_vatti_time)))
+                    << ", "
+                    << std::string(
+                           py::repr(py::float_(self.correct_topology_time)))
+                    << ", "
+                    << std::string(
+                           py::repr(py::float_(self.build_result_time)))
+                    << ", " << self.scanbeams_count << ", "
+                    << self.active_bounds_peak << ", "
+                    << self.intersections_count << ", "
+                    << self.hot_pixels_count << ", "
+                    << self.rings_created_count << ", "
+                    << self.rings_removed_count << ")";
+             return stream.str();
+           })
+      .def_readwrite("build_hot_pixels_time",
+                     &ExecuteStats::build_hot_pixels_time)
+      .def_readwrite("execute_vatti_time", &ExecuteStats::execute_vatti_time)
+      .def_readwrite("correct_topology_time",
+                     &ExecuteStats::correct_topology_time)
+      .def_readwrite("build_result_time", &ExecuteStats::build_result_time)
+      .def_readwrite("scanbeams_count", &ExecuteStats::scanbeams_count)
+      .def_readwrite("active_bounds_peak", &ExecuteStats::active_bounds_peak)
+      .def_readwrite("intersections_count",
+                     &ExecuteStats::intersections_count)
+      .def_readwrite("hot_pixels_count", &ExecuteStats::hot_pixels_count)
+      .def_readwrite("rings_created_count",
+                     &ExecuteStats::rings_created_count)
+      .def_readwrite("rings_removed_count",
+                     &ExecuteStats::rings_removed_count);
+
   py::class_<Wagyu>(m, WAGYU_NAME)
       .def(py::init<>([](bool reverse_output) {
              auto result = std::make_unique<Wagyu>();
@@ -770,15 +1347,25 @@ PYBIND11_MODULE(MODULE_NAME, m) {
       .def("add_linear_ring", &Wagyu::add_ring<coordinate_t>)
       .def("add_polygon", &Wagyu::add_polygon<coordinate_t>)
       .def("clear", &Wagyu::clear)
+      .def("execute_to_arrays", wagyu_execute_to_arrays,
+           py::arg("operation_kind"), py::arg("subject_fill_kind"),
+           py::arg("clip_fill_kind"), py::arg("interrupter") = py::none(),
+           py::arg("stats") = py::none())
+      .def_static("execute_many", wagyu_execute_many, py::arg("pairs"),
+                  py::arg("operation_kind"),
+                  py::arg("subject_fill_kind") = FillKind::fill_type_even_odd,
+                  py::arg("clip_fill_kind") = FillKind::fill_type_even_odd,
+                  py::arg("reverse_output") = false)
+      .def("execute", wagyu_execute, py::arg("operation_kind"),
+           py::arg("subject_fill_kind"), py::arg("clip_fill_kind"),
+           py::arg("interrupter") = py::none(), py::arg("stats") = py::none())
       .def(
           "intersect",
           [](Wagyu& self,
              FillKind subject_fill_kind = FillKind::fill_type_even_odd,
              FillKind clip_fill_kind = FillKind::fill_type_even_odd) {
-            Multipolygon solution;
-            self.execute(OperationKind::clip_type_intersection, solution,
-                         subject_fill_kind, clip_fill_kind);
-            return solution;
+            return wagyu_execute(self, OperationKind::clip_type_intersection,
+                                 subject_fill_kind, clip_fill_kind);
           },
           py::arg("subject_fill_kind") = FillKind::fill_type_even_odd,
           py::arg("clip_fill_kind") = FillKind::fill_type_even_odd)
@@ -787,10 +1374,8 @@ PYBIND11_MODULE(MODULE_NAME, m) {
           [](Wagyu& self,
              FillKind subject_fill_kind = FillKind::fill_type_even_odd,
              FillKind clip_fill_kind = FillKind::fill_type_even_odd) {
-            Multipolygon solution;
-            self.execute(OperationKind::clip_type_difference, solution,
-                         subject_fill_kind, clip_fill_kind);
-            return solution;
+            return wagyu_execute(self, OperationKind::clip_type_difference,
+                                 subject_fill_kind, clip_fill_kind);
           },
           py::arg("subject_fill_kind") = FillKind::fill_type_even_odd,
           py::arg("clip_fill_kind") = FillKind::fill_type_even_odd)
@@ -799,10 +1384,8 @@ PYBIND11_MODULE(MODULE_NAME, m) {
           [](Wagyu& self,
              FillKind subject_fill_kind = FillKind::fill_type_even_odd,
              FillKind clip_fill_kind = FillKind::fill_type_even_odd) {
-            Multipolygon solution;
-            self.execute(OperationKind::clip_type_union, solution,
-                         subject_fill_kind, clip_fill_kind);
-            return solution;
+            return wagyu_execute(self, OperationKind::clip_type_union,
+                                 subject_fill_kind, clip_fill_kind);
           },
           py::arg("subject_fill_kind") = FillKind::fill_type_even_odd,
           py::arg("clip_fill_kind") = FillKind::fill_type_even_odd)
@@ -811,10 +1394,8 @@ PYBIND11_MODULE(MODULE_NAME, m) {
           [](Wagyu& self,
              FillKind subject_fill_kind = FillKind::fill_type_even_odd,
              FillKind clip_fill_kind = FillKind::fill_type_even_odd) {
-            Multipolygon solution;
-            self.execute(OperationKind::clip_type_x_or, solution,
-                         subject_fill_kind, clip_fill_kind);
-            return solution;
+            return wagyu_execute(self, OperationKind::clip_type_x_or,
+                                 subject_fill_kind, clip_fill_kind);
           },
           py::arg("subject_fill_kind") = FillKind::fill_type_even_odd,
           py::arg("clip_fill_kind") = FillKind::fill_type_even_odd)
@@ -950,10 +1531,17 @@ PYBIND11_MODULE(MODULE_NAME, m) {
              return active_bounds;
            })
       .def("build_hot_pixels",
-           [](RingManager& self, LocalMinimumList& minimums) {
-             mapbox::geometry::wagyu::build_hot_pixels<coordinate_t>(minimums,
-                                                                     self);
-           })
+           [](RingManager& self, LocalMinimumList& minimums,
+              const Interrupter* interrupter) {
+             InterruptionScope scope(interrupter);
+             try {
+               build_hot_pixels_interruptibly(minimums, self);
+             } catch (const std::runtime_error&) {
+               if (scope.triggered) throw Interrupted();
+               throw;
+             }
+           },
+           py::arg("minimums"), py::arg("interrupter") = py::none())
       .def("build_result",
            [](RingManager const& self, bool reverse_output) {
              auto* result = new Multipolygon{};
@@ -1297,6 +1885,32 @@ PYBIND11_MODULE(MODULE_NAME, m) {
   m.def("create_bound_towards_minimum",
         mapbox::geometry::wagyu::create_bound_towards_minimum<coordinate_t>);
 
+  m.def("clip_linear_ring",
+        mapbox::geometry::wagyu::quick_clip::quick_lr_clip<coordinate_t>,
+        py::arg("linear_ring"), py::arg("box"));
+
+  m.def(
+      "clip_multipolygon",
+      [](const Multipolygon& multipolygon, const Box& box,
+         FillKind subject_fill_kind) {
+        py::gil_scoped_release release;
+        return mapbox::geometry::wagyu::clip(multipolygon, box,
+                                             subject_fill_kind);
+      },
+      py::arg("multipolygon"), py::arg("box"),
+      py::arg("subject_fill_kind") = FillKind::fill_type_even_odd);
+
+  m.def(
+      "clip_polygon",
+      [](const Polygon& polygon, const Box& box, FillKind subject_fill_kind) {
+        py::gil_scoped_release release;
+        return mapbox::geometry::wagyu::clip(polygon, box, subject_fill_kind);
+      },
+      py::arg("polygon"), py::arg("box"),
+      py::arg("subject_fill_kind") = FillKind::fill_type_even_odd);
+
+  m.def("round_half_up", mapbox::geometry::wagyu::wround<std::int64_t>);
+
   m.def("round_towards_min",
         mapbox::geometry::wagyu::round_towards_min<coordinate_t>);
 
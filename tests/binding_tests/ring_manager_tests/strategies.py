@@ -1,8 +1,15 @@
-from _wagyu import (Point,
+from typing import List
+
+from _wagyu import (LinearRing,
+                    LocalMinimumList,
+                    Point,
+                    PolygonKind,
                     Ring,
                     RingManager)
 from hypothesis import strategies
+from hypothesis_geometry import planar
 
+from tests.binding_tests.utils import to_bound_polygon_linear_rings
 from tests.strategies import (coordinates,
                               sizes)
 from tests.utils import to_maybe
@@ -18,3 +25,16 @@ rings = strategies.builds(Ring, sizes, maybe_rings_lists, points_lists,
 rings_lists = strategies.lists(rings)
 ring_managers = strategies.builds(RingManager, maybe_rings_lists, points_lists,
                                   sizes, rings_lists, sizes)
+
+
+def to_local_minimum_list(linear_rings: List[LinearRing]
+                          ) -> LocalMinimumList:
+    result = LocalMinimumList()
+    for linear_ring in linear_rings:
+        result.add_linear_ring(linear_ring, PolygonKind.SUBJECT)
+    return result
+
+
+non_empty_local_minimum_lists = (planar.polygons(coordinates)
+                                 .map(to_bound_polygon_linear_rings)
+                                 .map(to_local_minimum_list))
@@ -0,0 +1,16 @@
+import pytest
+from _wagyu import (Interrupted,
+                    Interrupter,
+                    LocalMinimumList,
+                    RingManager)
+from hypothesis import given
+
+from . import strategies
+
+
+@given(strategies.ring_managers, strategies.non_empty_local_minimum_lists)
+def test_interrupted(ring_manager: RingManager,
+                     local_minimum_list: LocalMinimumList) -> None:
+    with pytest.raises(Interrupted):
+        ring_manager.build_hot_pixels(local_minimum_list,
+                                      Interrupter(requested=True))
@@ -5,8 +5,11 @@ from _wagyu import (Bound as BoundBound,
                     Box as BoundBox,
                     Edge as BoundEdge,
                     EdgeSide as BoundEdgeSide,
+                    ExecuteStats as BoundExecuteStats,
                     FillKind as BoundFillKind,
                     IntersectNode as BoundIntersectNode,
+                    Interrupted as BoundInterrupted,
+                    Interrupter as BoundInterrupter,
                     LinearRing as BoundLinearRing,
                     LocalMinimum as BoundLocalMinimum,
                     LocalMinimumList as BoundLocalMinimumList,
@@ -28,8 +31,11 @@ BoundBound = BoundBound
 BoundBox = BoundBox
 BoundEdge = BoundEdge
 BoundEdgeSide = BoundEdgeSide
+BoundExecuteStats = BoundExecuteStats
 BoundFillKind = BoundFillKind
 BoundIntersectNode = BoundIntersectNode
+BoundInterrupted = BoundInterrupted
+BoundInterrupter = BoundInterrupter
 BoundLinearRing = BoundLinearRing
 BoundLinearRingWithPolygonKind = Tuple[BoundLinearRing, BoundPolygonKind]
 BoundLocalMinimum = BoundLocalMinimum
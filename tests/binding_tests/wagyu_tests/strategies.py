@@ -4,11 +4,15 @@ from _wagyu import (LinearRing,
 from hypothesis import strategies
 from hypothesis_geometry import planar
 
-from tests.binding_tests.utils import (bound_polygon_kinds,
+from tests.binding_tests.utils import (bound_fill_kinds,
+                                       bound_operation_kinds,
+                                       bound_polygon_kinds,
                                        to_bound_points_list,
                                        to_bound_polygon_linear_rings)
 from tests.strategies import coordinates
 
+fill_kinds = strategies.sampled_from(bound_fill_kinds)
+operation_kinds = strategies.sampled_from(bound_operation_kinds)
 polygon_kinds = strategies.sampled_from(bound_polygon_kinds)
 linear_rings_points = planar.contours(coordinates).map(to_bound_points_list)
 linear_rings = strategies.builds(LinearRing, linear_rings_points)
@@ -16,3 +20,5 @@ linear_rings_lists = (planar.polygons(coordinates)
                       .map(to_bound_polygon_linear_rings))
 polygons = strategies.builds(Polygon, linear_rings_lists)
 empty_wagyus = strategies.builds(Wagyu)
+polygons_pairs_lists = strategies.lists(strategies.tuples(polygons, polygons),
+                                        max_size=5)
@@ -0,0 +1,34 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import (List,
+                    Tuple)
+
+from _wagyu import (FillKind,
+                    Multipolygon,
+                    OperationKind,
+                    Polygon,
+                    PolygonKind,
+                    Wagyu)
+from hypothesis import given
+
+from . import strategies
+
+
+@given(strategies.polygons_pairs_lists, strategies.operation_kinds,
+       strategies.fill_kinds, strategies.fill_kinds)
+def test_basic(polygons_pairs: List[Tuple[Polygon, Polygon]],
+               operation_kind: OperationKind,
+               subject_fill_kind: FillKind,
+               clip_fill_kind: FillKind) -> None:
+    def execute(polygons_pair: Tuple[Polygon, Polygon]) -> Multipolygon:
+        subject, clip = polygons_pair
+        wagyu = Wagyu()
+        wagyu.add_polygon(subject, PolygonKind.SUBJECT)
+        wagyu.add_polygon(clip, PolygonKind.CLIP)
+        return wagyu.execute(operation_kind, subject_fill_kind,
+                             clip_fill_kind)
+
+    with ThreadPoolExecutor(2) as executor:
+        result = list(executor.map(execute, polygons_pairs))
+
+    assert result == [execute(polygons_pair)
+                      for polygons_pair in polygons_pairs]
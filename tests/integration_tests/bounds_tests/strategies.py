@@ -6,14 +6,17 @@ from tests.binding_tests.utils import (bound_edges_sides,
                                        bound_fill_kinds,
                                        bound_operation_kinds,
                                        bound_polygon_kinds)
-from tests.integration_tests.utils import (BoundPortedBoundsListsPair,
-                                           BoundPortedBoundsPair,
-                                           initialize_bounds,
-                                           to_bound_with_ported_bounds_pair,
-                                           to_bound_with_ported_edges_pair,
-                                           to_bound_with_ported_points_pair,
-                                           to_bound_with_ported_rings_pair)
-from tests.port_tests.utils import (ported_edges_sides,
+from tests.integration_tests.utils import (
+    BoundPortedBoundsListsPair,
+    BoundPortedBoundsPair,
+    initialize_bounds,
+    to_bound_with_ported_active_bounds_pair,
+    to_bound_with_ported_bounds_pair,
+    to_bound_with_ported_edges_pair,
+    to_bound_with_ported_points_pair,
+    to_bound_with_ported_rings_pair)
+from tests.port_tests.utils import (PortedFillKind,
+                                    ported_edges_sides,
                                     ported_fill_kinds,
                                     ported_operation_kinds,
                                     ported_polygon_kinds)
@@ -29,7 +32,7 @@ from tests.utils import (Strategy,
 
 booleans = strategies.booleans()
 sizes = sizes
-coordinates_lists = strategies.lists(coordinates)
+scanbeams = strategies.lists(coordinates).map(sorted)
 points_pairs = strategies.builds(to_bound_with_ported_points_pair, coordinates,
                                  coordinates)
 points_lists_pairs = strategies.lists(points_pairs).map(transpose_pairs)
@@ -58,9 +61,25 @@ bounds_pairs = strategies.builds(to_bound_with_ported_bounds_pair,
                                  sizes, integers_32, integers_32, trits,
                                  polygon_kinds_pairs,
                                  edges_sides_pairs)
-non_empty_bounds_lists_pairs = (strategies.lists(bounds_pairs,
-                                                 min_size=1)
-                                .map(transpose_pairs))
+non_empty_bounds_lists_pairs = (
+    strategies.lists(bounds_pairs,
+                     min_size=1).map(to_bound_with_ported_active_bounds_pair))
+# counts at the ``std::int32_t`` limits overflow on updates,
+# the minimum winding count is excluded since its absolute value overflows
+extreme_winding_counts = strategies.sampled_from([-2147483647, 2147483647])
+extreme_opposite_winding_counts = strategies.sampled_from([-2147483648,
+                                                           2147483647])
+non_even_odd_fill_kinds_pairs = strategies.sampled_from(
+        [(bound_fill_kind, ported_fill_kind)
+         for bound_fill_kind, ported_fill_kind in zip(bound_fill_kinds,
+                                                      ported_fill_kinds)
+         if ported_fill_kind is not PortedFillKind.EVEN_ODD])
+extreme_winding_bounds_pairs = strategies.builds(
+        to_bound_with_ported_bounds_pair, non_empty_edges_lists_pairs, sizes,
+        sizes, points_pairs, maybe_rings_pairs, floats, sizes,
+        extreme_winding_counts, extreme_opposite_winding_counts,
+        strategies.sampled_from([-1, 1]), polygon_kinds_pairs,
+        edges_sides_pairs)
 
 
 def to_bounds_lists_pairs_indices(
@@ -73,6 +92,12 @@ def to_bounds_lists_pairs_indices(
 
 non_empty_bounds_lists_pairs_indices = (
     non_empty_bounds_lists_pairs.flatmap(to_bounds_lists_pairs_indices))
+extreme_winding_bounds_lists_pairs_indices = (
+    strategies.lists(extreme_winding_bounds_pairs,
+                     min_size=2,
+                     max_size=3)
+    .map(to_bound_with_ported_active_bounds_pair)
+    .flatmap(to_bounds_lists_pairs_indices))
 
 
 def to_initialized_bounds_pairs(bounds_pair: BoundPortedBoundsPair
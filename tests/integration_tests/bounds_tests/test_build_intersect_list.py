@@ -6,6 +6,7 @@ from tests.integration_tests.utils import (
     BoundPortedBoundsListsPair,
     are_bound_ported_bounds_lists_equal,
     are_bound_ported_intersect_nodes_lists_equal)
+from tests.port_tests.utils import PortedSortingKind
 from wagyu.intersect_node import build_intersect_list as ported
 from . import strategies
 
@@ -25,3 +26,21 @@ def test_basic(lists_pair: BoundPortedBoundsListsPair) -> None:
         assert are_bound_ported_bounds_lists_equal(bound_list, ported_list)
         assert are_bound_ported_intersect_nodes_lists_equal(bound_result,
                                                             ported_result)
+
+
+@given(strategies.initialized_bounds_lists_pairs)
+def test_merge_sorting(lists_pair: BoundPortedBoundsListsPair) -> None:
+    bound_list, ported_list = lists_pair
+
+    try:
+        bound_list, bound_result = bound(bound_list)
+    except RuntimeError:
+        with pytest.raises(RuntimeError):
+            ported(ported_list, PortedSortingKind.MERGE)
+    else:
+        ported_list, ported_result = ported(ported_list,
+                                            PortedSortingKind.MERGE)
+
+        assert are_bound_ported_bounds_lists_equal(bound_list, ported_list)
+        assert are_bound_ported_intersect_nodes_lists_equal(bound_result,
+                                                            ported_result)
@@ -24,3 +24,25 @@ def test_basic(lists_pair_index: Tuple[BoundPortedBoundsListsPair, int],
     ported(index, ported_list, ported_subject_fill_kind, ported_clip_fill_kind)
 
     assert are_bound_ported_bounds_lists_equal(bound_list, ported_list)
+
+
+@given(strategies.extreme_winding_bounds_lists_pairs_indices,
+       strategies.non_even_odd_fill_kinds_pairs,
+       strategies.non_even_odd_fill_kinds_pairs)
+def test_overflowing_counts(
+        lists_pair_index: Tuple[BoundPortedBoundsListsPair, int],
+        subject_fill_kinds_pair: BoundPortedFillKindsPair,
+        clip_fill_kinds_pair: BoundPortedFillKindsPair) -> None:
+    (bound_list, ported_list), index = lists_pair_index
+    bound_subject_fill_kind, ported_subject_fill_kind = subject_fill_kinds_pair
+    bound_clip_fill_kind, ported_clip_fill_kind = clip_fill_kinds_pair
+
+    bound_list = bound(index, bound_list, bound_subject_fill_kind,
+                       bound_clip_fill_kind)
+    ported(index, ported_list, ported_subject_fill_kind, ported_clip_fill_kind)
+
+    assert are_bound_ported_bounds_lists_equal(bound_list, ported_list)
+    assert all(-2147483648 <= ported_bound.winding_count <= 2147483647
+               and (-2147483648 <= ported_bound.opposite_winding_count
+                    <= 2147483647)
+               for ported_bound in ported_list)
@@ -0,0 +1,18 @@
+from hypothesis import strategies
+from hypothesis_geometry import planar
+
+from tests.port_tests.utils import (ported_fill_kinds,
+                                    ported_operation_kinds)
+from tests.strategies import coordinates
+
+booleans = strategies.booleans()
+multipolygons = planar.multipolygons(coordinates)
+polygons_pairs_lists = strategies.lists(
+        strategies.tuples(planar.polygons(coordinates),
+                          planar.polygons(coordinates)),
+        max_size=5)
+# products of coordinates differences should fit into ``std::int32_t``
+small_multipolygons = planar.multipolygons(
+        strategies.integers(-2 ** 14, 2 ** 14))
+fill_kinds = strategies.sampled_from(ported_fill_kinds)
+operation_kinds = strategies.sampled_from(ported_operation_kinds)
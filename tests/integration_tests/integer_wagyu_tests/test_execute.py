@@ -0,0 +1,90 @@
+from enum import Enum
+from typing import (List,
+                    Tuple)
+
+import _wagyu_int32
+import _wagyu_int64
+from hypothesis import given
+
+from tests.port_tests.utils import (PortedFillKind,
+                                    PortedOperationKind,
+                                    PortedWagyu)
+from tests.utils import (RawMultipolygon,
+                         RawPolygon)
+from . import strategies
+from .utils import (execute,
+                    ported_integer_namespace,
+                    to_enum,
+                    to_polygons_pairs,
+                    to_raw_multipolygon)
+
+
+@given(strategies.booleans, strategies.multipolygons,
+       strategies.multipolygons, strategies.operation_kinds,
+       strategies.fill_kinds, strategies.fill_kinds)
+def test_int64_variant(reverse_output: bool,
+                       subject: RawMultipolygon,
+                       clip: RawMultipolygon,
+                       operation_kind: Enum,
+                       subject_fill_kind: Enum,
+                       clip_fill_kind: Enum) -> None:
+    bound_result = execute(_wagyu_int64, reverse_output, subject, clip,
+                           operation_kind, subject_fill_kind, clip_fill_kind)
+    ported_result = execute(ported_integer_namespace, reverse_output, subject,
+                            clip, operation_kind, subject_fill_kind,
+                            clip_fill_kind)
+
+    assert (to_raw_multipolygon(bound_result)
+            == to_raw_multipolygon(ported_result))
+    assert all(type(point.x) is type(point.y) is int
+               for polygon in ported_result
+               for linear_ring in polygon
+               for point in linear_ring)
+
+
+@given(strategies.booleans, strategies.polygons_pairs_lists,
+       strategies.operation_kinds, strategies.fill_kinds,
+       strategies.fill_kinds)
+def test_int64_variant_many(reverse_output: bool,
+                            polygons_pairs: List[Tuple[RawPolygon,
+                                                       RawPolygon]],
+                            operation_kind: Enum,
+                            subject_fill_kind: Enum,
+                            clip_fill_kind: Enum) -> None:
+    bound_result = _wagyu_int64.Wagyu.execute_many(
+            to_polygons_pairs(_wagyu_int64, polygons_pairs),
+            to_enum(_wagyu_int64.OperationKind, operation_kind),
+            to_enum(_wagyu_int64.FillKind, subject_fill_kind),
+            to_enum(_wagyu_int64.FillKind, clip_fill_kind), reverse_output)
+    ported_result = PortedWagyu.execute_many(
+            to_polygons_pairs(ported_integer_namespace, polygons_pairs),
+            to_enum(PortedOperationKind, operation_kind),
+            to_enum(PortedFillKind, subject_fill_kind),
+            to_enum(PortedFillKind, clip_fill_kind), reverse_output, int)
+
+    assert (list(map(to_raw_multipolygon, bound_result))
+            == list(map(to_raw_multipolygon, ported_result)))
+    assert all(type(point.x) is type(point.y) is int
+               for multipolygon in ported_result
+               for polygon in multipolygon
+               for linear_ring in polygon
+               for point in linear_ring)
+
+
+@given(strategies.booleans, strategies.small_multipolygons,
+       strategies.small_multipolygons, strategies.operation_kinds,
+       strategies.fill_kinds, strategies.fill_kinds)
+def test_int32_variant(reverse_output: bool,
+                       subject: RawMultipolygon,
+                       clip: RawMultipolygon,
+                       operation_kind: Enum,
+                       subject_fill_kind: Enum,
+                       clip_fill_kind: Enum) -> None:
+    int32_result = execute(_wagyu_int32, reverse_output, subject, clip,
+                           operation_kind, subject_fill_kind, clip_fill_kind)
+    int64_result = execute(_wagyu_int64, reverse_output, subject, clip,
+                           operation_kind, subject_fill_kind, clip_fill_kind)
+
+    assert (to_raw_multipolygon(int32_result)
+            == to_raw_multipolygon(int64_result))
+    assert isinstance(int32_result, _wagyu_int32.Multipolygon)
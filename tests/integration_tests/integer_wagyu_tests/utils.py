@@ -0,0 +1,79 @@
+from enum import Enum
+from functools import partial
+from types import (ModuleType,
+                   SimpleNamespace)
+from typing import (Any,
+                    List,
+                    Tuple,
+                    Union)
+
+from tests.port_tests.utils import (PortedFillKind,
+                                    PortedLinearRing,
+                                    PortedOperationKind,
+                                    PortedPoint,
+                                    PortedPolygon,
+                                    PortedPolygonKind,
+                                    PortedWagyu)
+from tests.utils import (RawMultipolygon,
+                         RawPointsList,
+                         RawPolygon)
+
+Namespace = Union[ModuleType, SimpleNamespace]
+ported_integer_namespace = SimpleNamespace(
+        FillKind=PortedFillKind,
+        LinearRing=PortedLinearRing,
+        OperationKind=PortedOperationKind,
+        Point=PortedPoint,
+        Polygon=PortedPolygon,
+        PolygonKind=PortedPolygonKind,
+        Wagyu=partial(PortedWagyu,
+                      coordinate_kind=int))
+
+
+def execute(namespace: Namespace,
+            reverse_output: bool,
+            subject: RawMultipolygon,
+            clip: RawMultipolygon,
+            operation_kind: Enum,
+            subject_fill_kind: Enum,
+            clip_fill_kind: Enum) -> Any:
+    wagyu = namespace.Wagyu(reverse_output)
+    for raw_polygon in subject:
+        wagyu.add_polygon(to_polygon(namespace, raw_polygon),
+                          namespace.PolygonKind.SUBJECT)
+    for raw_polygon in clip:
+        wagyu.add_polygon(to_polygon(namespace, raw_polygon),
+                          namespace.PolygonKind.CLIP)
+    return wagyu.execute(to_enum(namespace.OperationKind, operation_kind),
+                         to_enum(namespace.FillKind, subject_fill_kind),
+                         to_enum(namespace.FillKind, clip_fill_kind))
+
+
+def to_enum(cls: Any, value: Enum) -> Any:
+    return getattr(cls, value.name)
+
+
+def to_linear_ring(namespace: Namespace, raw_points: RawPointsList) -> Any:
+    points = [namespace.Point(x, y) for x, y in raw_points]
+    return namespace.LinearRing(points + [points[0]])
+
+
+def to_polygon(namespace: Namespace, raw_polygon: RawPolygon) -> Any:
+    raw_border, raw_holes = raw_polygon
+    return namespace.Polygon([to_linear_ring(namespace, raw_border)]
+                             + [to_linear_ring(namespace, raw_hole)
+                                for raw_hole in raw_holes])
+
+
+def to_polygons_pairs(namespace: Namespace,
+                      raw_polygons_pairs: List[Tuple[RawPolygon, RawPolygon]]
+                      ) -> List[Tuple[Any, Any]]:
+    return [(to_polygon(namespace, raw_subject),
+             to_polygon(namespace, raw_clip))
+            for raw_subject, raw_clip in raw_polygons_pairs]
+
+
+def to_raw_multipolygon(multipolygon: Any) -> Any:
+    return [[[(point.x, point.y) for point in linear_ring]
+             for linear_ring in polygon]
+            for polygon in multipolygon]
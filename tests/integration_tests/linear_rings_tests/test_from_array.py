@@ -0,0 +1,24 @@
+from array import array
+
+from hypothesis import given
+
+from tests.binding_tests.utils import BoundLinearRing
+from tests.integration_tests.utils import (BoundPortedPointsListsPair,
+                                           are_bound_ported_points_equal)
+from tests.port_tests.utils import PortedLinearRing
+from . import strategies
+
+
+@given(strategies.linear_rings_points_pairs)
+def test_basic(points_pair: BoundPortedPointsListsPair) -> None:
+    bound_points, ported_points = points_pair
+    coordinates = array('d', [coordinate
+                              for point in ported_points
+                              for coordinate in (point.x, point.y)])
+
+    bound, ported = (BoundLinearRing.from_array(coordinates),
+                     PortedLinearRing.from_array(coordinates))
+
+    assert bound == BoundLinearRing(bound_points)
+    assert ported == PortedLinearRing(ported_points)
+    assert all(map(are_bound_ported_points_equal, bound, ported))
@@ -0,0 +1,7 @@
+from hypothesis_geometry import planar
+
+from tests.integration_tests.utils import to_bound_with_ported_polygons_pair
+from tests.strategies import coordinates
+
+polygons_pairs = (planar.polygons(coordinates)
+                  .map(to_bound_with_ported_polygons_pair))
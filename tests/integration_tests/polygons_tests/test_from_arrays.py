@@ -0,0 +1,23 @@
+from array import array
+
+from hypothesis import given
+
+from tests.binding_tests.utils import BoundPolygon
+from tests.integration_tests.utils import BoundPortedPolygonsPair
+from tests.port_tests.utils import PortedPolygon
+from . import strategies
+
+
+@given(strategies.polygons_pairs)
+def test_basic(polygons_pair: BoundPortedPolygonsPair) -> None:
+    bound_polygon, ported_polygon = polygons_pair
+    arrays = [array('d', [coordinate
+                          for point in linear_ring
+                          for coordinate in (point.x, point.y)])
+              for linear_ring in ported_polygon]
+
+    bound, ported = (BoundPolygon.from_arrays(arrays),
+                     PortedPolygon.from_arrays(arrays))
+
+    assert bound == bound_polygon
+    assert ported == ported_polygon
@@ -0,0 +1,43 @@
+from typing import Tuple
+
+from hypothesis import strategies
+from hypothesis_geometry import planar
+
+from tests.binding_tests.utils import bound_fill_kinds
+from tests.integration_tests.utils import (
+    BoundPortedBoxesPair,
+    to_bound_with_ported_boxes_pair,
+    to_bound_with_ported_linear_rings_pair,
+    to_bound_with_ported_multipolygons_pair,
+    to_bound_with_ported_points_lists_pair,
+    to_bound_with_ported_points_pair,
+    to_bound_with_ported_polygons_pair)
+from tests.port_tests.utils import ported_fill_kinds
+from tests.strategies import coordinates
+from tests.utils import (sort_pair,
+                         to_pairs)
+from wagyu.hints import Coordinate
+
+
+def to_bound_with_ported_boxes_pair_from_ranges(
+        x_range: Tuple[Coordinate, Coordinate],
+        y_range: Tuple[Coordinate, Coordinate]) -> BoundPortedBoxesPair:
+    min_x, max_x = x_range
+    min_y, max_y = y_range
+    return to_bound_with_ported_boxes_pair(
+            to_bound_with_ported_points_pair(min_x, min_y),
+            to_bound_with_ported_points_pair(max_x, max_y))
+
+
+coordinates_ranges = to_pairs(coordinates).map(sort_pair)
+boxes_pairs = strategies.builds(to_bound_with_ported_boxes_pair_from_ranges,
+                                coordinates_ranges, coordinates_ranges)
+fill_kinds_pairs = strategies.sampled_from(list(zip(bound_fill_kinds,
+                                                    ported_fill_kinds)))
+linear_rings_pairs = (planar.contours(coordinates)
+                      .map(to_bound_with_ported_points_lists_pair)
+                      .map(to_bound_with_ported_linear_rings_pair))
+multipolygons_pairs = (planar.multipolygons(coordinates)
+                       .map(to_bound_with_ported_multipolygons_pair))
+polygons_pairs = (planar.polygons(coordinates)
+                  .map(to_bound_with_ported_polygons_pair))
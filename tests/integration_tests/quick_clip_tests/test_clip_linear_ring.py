@@ -0,0 +1,21 @@
+from _wagyu import clip_linear_ring as bound_clip_linear_ring
+from hypothesis import given
+
+from tests.integration_tests.utils import (
+    BoundPortedBoxesPair,
+    BoundPortedLinearRingsPair,
+    are_bound_ported_linear_rings_equal)
+from wagyu.quick_clip import clip_linear_ring as ported_clip_linear_ring
+from . import strategies
+
+
+@given(strategies.linear_rings_pairs, strategies.boxes_pairs)
+def test_basic(linear_rings_pair: BoundPortedLinearRingsPair,
+               boxes_pair: BoundPortedBoxesPair) -> None:
+    bound_linear_ring, ported_linear_ring = linear_rings_pair
+    bound_box, ported_box = boxes_pair
+
+    bound_result = bound_clip_linear_ring(bound_linear_ring, bound_box)
+    ported_result = ported_clip_linear_ring(ported_linear_ring, ported_box)
+
+    assert are_bound_ported_linear_rings_equal(bound_result, ported_result)
@@ -0,0 +1,27 @@
+from _wagyu import clip_multipolygon as bound_clip_multipolygon
+from hypothesis import given
+
+from tests.integration_tests.utils import (
+    BoundPortedBoxesPair,
+    BoundPortedFillKindsPair,
+    BoundPortedMultipolygonsPair,
+    are_bound_ported_multipolygons_equal)
+from wagyu.quick_clip import clip_multipolygon as ported_clip_multipolygon
+from . import strategies
+
+
+@given(strategies.multipolygons_pairs, strategies.boxes_pairs,
+       strategies.fill_kinds_pairs)
+def test_basic(multipolygons_pair: BoundPortedMultipolygonsPair,
+               boxes_pair: BoundPortedBoxesPair,
+               fill_kinds_pair: BoundPortedFillKindsPair) -> None:
+    bound_multipolygon, ported_multipolygon = multipolygons_pair
+    bound_box, ported_box = boxes_pair
+    bound_fill_kind, ported_fill_kind = fill_kinds_pair
+
+    bound_result = bound_clip_multipolygon(bound_multipolygon, bound_box,
+                                           bound_fill_kind)
+    ported_result = ported_clip_multipolygon(ported_multipolygon, ported_box,
+                                             ported_fill_kind)
+
+    assert are_bound_ported_multipolygons_equal(bound_result, ported_result)
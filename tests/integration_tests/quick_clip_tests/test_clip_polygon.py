@@ -0,0 +1,27 @@
+from _wagyu import clip_polygon as bound_clip_polygon
+from hypothesis import given
+
+from tests.integration_tests.utils import (
+    BoundPortedBoxesPair,
+    BoundPortedFillKindsPair,
+    BoundPortedPolygonsPair,
+    are_bound_ported_multipolygons_equal)
+from wagyu.quick_clip import clip_polygon as ported_clip_polygon
+from . import strategies
+
+
+@given(strategies.polygons_pairs, strategies.boxes_pairs,
+       strategies.fill_kinds_pairs)
+def test_basic(polygons_pair: BoundPortedPolygonsPair,
+               boxes_pair: BoundPortedBoxesPair,
+               fill_kinds_pair: BoundPortedFillKindsPair) -> None:
+    bound_polygon, ported_polygon = polygons_pair
+    bound_box, ported_box = boxes_pair
+    bound_fill_kind, ported_fill_kind = fill_kinds_pair
+
+    bound_result = bound_clip_polygon(bound_polygon, bound_box,
+                                      bound_fill_kind)
+    ported_result = ported_clip_polygon(ported_polygon, ported_box,
+                                        ported_fill_kind)
+
+    assert are_bound_ported_multipolygons_equal(bound_result, ported_result)
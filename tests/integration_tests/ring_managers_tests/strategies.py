@@ -18,6 +18,7 @@ from tests.integration_tests.utils import (
     BoundPortedRingManagersPair,
     BoundPortedRingsPair,
     initialize_bounds,
+    to_bound_with_ported_active_bounds_pair,
     to_bound_with_ported_bounds_pair,
     to_bound_with_ported_edges_pair,
     to_bound_with_ported_linear_rings_pair,
@@ -45,7 +46,7 @@ from tests.utils import (Strategy,
 from wagyu.hints import Coordinate
 
 coordinates = coordinates
-coordinates_lists = strategies.lists(coordinates)
+scanbeams = strategies.lists(coordinates).map(sorted)
 sorted_coordinates_pairs = to_pairs(coordinates).map(sort_pair)
 fill_kinds_pairs = strategies.sampled_from(list(zip(bound_fill_kinds,
                                                     ported_fill_kinds)))
@@ -143,7 +144,7 @@ non_empty_bounds_pairs = strategies.builds(
         integers_32, trits, polygon_kinds_pairs, edges_sides_pairs)
 non_empty_bounds_lists_pairs = (strategies.lists(non_empty_bounds_pairs,
                                                  min_size=1)
-                                .map(transpose_pairs))
+                                .map(to_bound_with_ported_active_bounds_pair))
 
 
 def to_bounds_lists_pairs_indices(
@@ -173,7 +174,7 @@ def to_bounds_lists_pairs_with_indices_pairs(
 
 two_or_more_non_empty_bounds_lists_pairs = (
     strategies.lists(non_empty_bounds_pairs,
-                     min_size=2).map(transpose_pairs))
+                     min_size=2).map(to_bound_with_ported_active_bounds_pair))
 two_or_more_non_empty_bounds_lists_pairs_with_indices_pairs = (
     two_or_more_non_empty_bounds_lists_pairs.flatmap(
             to_bounds_lists_pairs_with_indices_pairs))
@@ -195,20 +196,21 @@ def to_initialized_bounds_pairs(bounds_pair: BoundPortedBoundsPair
 initialized_bounds_pairs = bounds_pairs.flatmap(to_initialized_bounds_pairs)
 initialized_non_empty_bounds_pairs = (non_empty_bounds_pairs
                                       .flatmap(to_initialized_bounds_pairs))
-initialized_bounds_lists_pairs = (strategies.lists(initialized_bounds_pairs)
-                                  .map(transpose_pairs))
+initialized_bounds_lists_pairs = (
+    strategies.lists(initialized_bounds_pairs)
+    .map(to_bound_with_ported_active_bounds_pair))
 non_empty_initialized_bounds_lists_pairs = (
     strategies.lists(initialized_bounds_pairs,
-                     min_size=1).map(transpose_pairs))
+                     min_size=1).map(to_bound_with_ported_active_bounds_pair))
 non_empty_initialized_non_empty_bounds_lists_pairs = (
     strategies.lists(initialized_non_empty_bounds_pairs,
-                     min_size=1).map(transpose_pairs))
+                     min_size=1).map(to_bound_with_ported_active_bounds_pair))
 non_empty_initialized_non_empty_bounds_lists_pairs_with_indices = (
     non_empty_initialized_non_empty_bounds_lists_pairs.flatmap(
             to_bounds_lists_pairs_indices))
 two_or_more_initialized_non_empty_bounds_lists_pairs = (
     strategies.lists(initialized_non_empty_bounds_pairs,
-                     min_size=2).map(transpose_pairs))
+                     min_size=2).map(to_bound_with_ported_active_bounds_pair))
 two_or_more_initialized_non_empty_bounds_lists_pairs_indices_pairs = (
     two_or_more_initialized_non_empty_bounds_lists_pairs.flatmap(
             to_bounds_lists_pairs_with_indices_pairs))
@@ -220,7 +222,7 @@ def to_lists_pairs_scanbeams_ys(
     bound_list, _ = bounds_lists_pair
     top_ys = [edge.top.y for bound in bound_list for edge in bound.edges]
     return strategies.tuples(strategies.just(bounds_lists_pair),
-                             subsequences(top_ys),
+                             subsequences(top_ys).map(sorted),
                              strategies.sampled_from(top_ys))
 
 
@@ -239,7 +241,7 @@ def to_lists_pairs_scanbeams_ys_indices(
     bound_list, _ = bounds_lists_pair
     top_ys = [edge.top.y for bound in bound_list for edge in bound.edges]
     return strategies.tuples(strategies.just(bounds_lists_pair),
-                             subsequences(top_ys),
+                             subsequences(top_ys).map(sorted),
                              strategies.sampled_from(top_ys),
                              strategies.integers(0, len(bound_list) - 1))
 
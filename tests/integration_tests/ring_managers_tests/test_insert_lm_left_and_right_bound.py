@@ -10,13 +10,14 @@ from tests.integration_tests.utils import (
     BoundPortedRingManagersPair,
     are_bound_ported_bounds_lists_equal,
     are_bound_ported_ring_managers_equal)
+from tests.port_tests.utils import PortedScanbeamQueue
 from wagyu.hints import Coordinate
 from . import strategies
 
 
 @given(strategies.initialized_non_empty_hot_pixels_ring_managers_pairs,
        strategies.operation_kinds_pairs, strategies.fill_kinds_pairs,
-       strategies.fill_kinds_pairs, strategies.coordinates_lists,
+       strategies.fill_kinds_pairs, strategies.scanbeams,
        strategies
        .two_or_more_initialized_non_empty_bounds_lists_pairs_indices_pairs)
 def test_basic(pair: BoundPortedRingManagersPair,
@@ -30,7 +31,8 @@ def test_basic(pair: BoundPortedRingManagersPair,
     bound_operation_kind, ported_operation_kind = operation_kinds_pair
     bound_subject_fill_kind, ported_subject_fill_kind = subject_fill_kinds_pair
     bound_clip_fill_kind, ported_clip_fill_kind = clip_fill_kinds_pair
-    bound_scanbeams, ported_scanbeams = scanbeams, scanbeams[:]
+    bound_scanbeams, ported_scanbeams = (scanbeams,
+                                         PortedScanbeamQueue(scanbeams))
     ((bound_active_bounds, ported_active_bounds),
      (first_index, second_index)) = active_bounds_pair_indices_pair
     ported_first_bound = ported_active_bounds[first_index]
@@ -46,7 +48,7 @@ def test_basic(pair: BoundPortedRingManagersPair,
             ported_clip_fill_kind, ported_scanbeams, ported_first_bound,
             ported_second_bound, ported_active_bounds)
 
-    assert bound_scanbeams == ported_scanbeams
+    assert bound_scanbeams == list(ported_scanbeams)
     assert are_bound_ported_bounds_lists_equal(bound_active_bounds,
                                                ported_active_bounds)
     assert are_bound_ported_ring_managers_equal(bound, ported)
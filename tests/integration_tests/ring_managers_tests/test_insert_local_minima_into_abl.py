@@ -10,6 +10,7 @@ from tests.integration_tests.utils import (
     BoundPortedRingManagersPair,
     are_bound_ported_bounds_lists_equal,
     are_bound_ported_ring_managers_equal)
+from tests.port_tests.utils import PortedScanbeamQueue
 from wagyu.hints import Coordinate
 from . import strategies
 
@@ -36,7 +37,8 @@ def test_basic(pair: BoundPortedRingManagersPair,
      bottom_y) = local_minimum_lists_pair_index_top_y
     bound_active_bounds, ported_active_bounds = active_bounds_pair
     bound_scanbeams = bound_local_minimum_list.scanbeams
-    ported_scanbeams = ported_local_minimum_list.scanbeams
+    ported_scanbeams = PortedScanbeamQueue(
+            ported_local_minimum_list.scanbeams)
 
     (bound_active_bounds, bound_scanbeams,
      bound_result) = bound.insert_local_minima_into_abl(
@@ -49,7 +51,7 @@ def test_basic(pair: BoundPortedRingManagersPair,
             ported_local_minimum_list, index, ported_active_bounds)
 
     assert bound_result == ported_result
-    assert bound_scanbeams == ported_scanbeams
+    assert bound_scanbeams == list(ported_scanbeams)
     assert are_bound_ported_bounds_lists_equal(bound_active_bounds,
                                                ported_active_bounds)
     assert are_bound_ported_ring_managers_equal(bound, ported)
@@ -8,6 +8,7 @@ from tests.integration_tests.utils import (
     BoundPortedRingManagersPair,
     are_bound_ported_bounds_lists_equal,
     are_bound_ported_ring_managers_equal)
+from tests.port_tests.utils import PortedScanbeamQueue
 from wagyu.hints import Coordinate
 from . import strategies
 
@@ -25,7 +26,8 @@ def test_basic(pair: BoundPortedRingManagersPair,
      top_y) = local_minimum_lists_pair_index_top_y
     bound_active_bounds, ported_active_bounds = active_bounds_pair
     bound_scanbeams = bound_local_minimum_list.scanbeams
-    ported_scanbeams = ported_local_minimum_list.scanbeams
+    ported_scanbeams = PortedScanbeamQueue(
+            ported_local_minimum_list.scanbeams)
 
     (bound_active_bounds, bound_scanbeams,
      bound_result) = bound.insert_local_minima_into_abl_hot_pixel(
@@ -36,7 +38,7 @@ def test_basic(pair: BoundPortedRingManagersPair,
             ported_scanbeams)
 
     assert bound_result == ported_result
-    assert bound_scanbeams == ported_scanbeams
+    assert bound_scanbeams == list(ported_scanbeams)
     assert are_bound_ported_bounds_lists_equal(bound_active_bounds,
                                                ported_active_bounds)
     assert are_bound_ported_ring_managers_equal(bound, ported)
@@ -10,6 +10,7 @@ from tests.integration_tests.utils import (
     BoundPortedRingManagersPair,
     are_bound_ported_maybe_bounds_lists_equal,
     are_bound_ported_ring_managers_equal)
+from tests.port_tests.utils import PortedScanbeamQueue
 from wagyu.hints import Coordinate
 from . import strategies
 
@@ -33,7 +34,8 @@ def test_basic(pair: BoundPortedRingManagersPair,
     bound_clip_fill_kind, ported_clip_fill_kind = clip_fill_kinds_pair
     ((bound_active_bounds, ported_active_bounds), scanbeams, scanline_y,
      index) = active_bounds_pair_scanbeams_scanline_y_index
-    bound_scanbeams, ported_scanbeams = scanbeams, scanbeams[:]
+    bound_scanbeams, ported_scanbeams = (scanbeams,
+                                         PortedScanbeamQueue(scanbeams))
 
     (bound_active_bounds, bound_scanbeams,
      bound_result) = bound.process_horizontal(
@@ -46,7 +48,7 @@ def test_basic(pair: BoundPortedRingManagersPair,
             ported_active_bounds)
 
     assert bound_result == ported_result
-    assert bound_scanbeams == ported_scanbeams
+    assert bound_scanbeams == list(ported_scanbeams)
     assert are_bound_ported_maybe_bounds_lists_equal(bound_active_bounds,
                                                      ported_active_bounds)
     assert are_bound_ported_ring_managers_equal(bound, ported)
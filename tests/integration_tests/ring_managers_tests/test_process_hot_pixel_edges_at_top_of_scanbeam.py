@@ -8,6 +8,7 @@ from tests.integration_tests.utils import (
     BoundPortedRingManagersPair,
     are_bound_ported_bounds_lists_equal,
     are_bound_ported_ring_managers_equal)
+from tests.port_tests.utils import PortedScanbeamQueue
 from wagyu.hints import Coordinate
 from . import strategies
 
@@ -21,7 +22,8 @@ def test_basic(pair: BoundPortedRingManagersPair,
     bound, ported = pair
     ((bound_active_bounds, ported_active_bounds), scanbeams,
      top_y) = active_bounds_pair_scanbeams_top_y
-    bound_scanbeams, ported_scanbeams = scanbeams, scanbeams[:]
+    bound_scanbeams, ported_scanbeams = (scanbeams,
+                                         PortedScanbeamQueue(scanbeams))
 
     assert are_bound_ported_bounds_lists_equal(bound_active_bounds,
                                                ported_active_bounds)
@@ -33,6 +35,6 @@ def test_basic(pair: BoundPortedRingManagersPair,
     ported_result = ported.process_hot_pixel_edges_at_top_of_scanbeam(
             top_y, ported_scanbeams, ported_active_bounds)
 
-    assert bound_scanbeams == ported_scanbeams
+    assert bound_scanbeams == list(ported_scanbeams)
     assert are_bound_ported_bounds_lists_equal(bound_result, ported_result)
     assert are_bound_ported_ring_managers_equal(bound, ported)
@@ -25,7 +25,8 @@ from tests.binding_tests.utils import (BoundBound,
                                        to_bound_local_minimum_list,
                                        to_bound_points_list,
                                        to_bound_polygon_linear_rings)
-from tests.port_tests.utils import (PortedBound,
+from tests.port_tests.utils import (PortedActiveBounds,
+                                    PortedBound,
                                     PortedBox,
                                     PortedEdge,
                                     PortedEdgeSide,
@@ -54,6 +55,7 @@ from tests.utils import (RawMultipolygon,
                          transpose_pairs)
 
 BoundPortedBoundsPair = Tuple[BoundBound, PortedBound]
+BoundPortedActiveBoundsPair = Tuple[List[BoundBound], PortedActiveBounds]
 BoundPortedBoundsListsPair = Tuple[List[BoundBound], List[PortedBound]]
 BoundPortedBoxesPair = Tuple[BoundBox, PortedBox]
 BoundPortedEdgesPair = Tuple[BoundEdge, PortedEdge]
@@ -228,6 +230,12 @@ def are_bound_ported_wagyus_equal(bound: BoundWagyu,
             and bound.reverse_output is ported.reverse_output)
 
 
+def to_bound_with_ported_active_bounds_pair(
+        pairs: List[BoundPortedBoundsPair]) -> BoundPortedActiveBoundsPair:
+    bound_bounds, ported_bounds = transpose_pairs(pairs)
+    return bound_bounds, PortedActiveBounds(ported_bounds)
+
+
 def to_bound_with_ported_bounds_pair(edges: BoundPortedEdgesListsPair,
                                      current_edge_index: int,
                                      next_edge_index: int,
@@ -0,0 +1,10 @@
+from _wagyu import are_floats_almost_equal as bound
+from hypothesis import given
+
+from wagyu.numeric import is_float_almost_zero as ported
+from . import strategies
+
+
+@given(strategies.floats)
+def test_basic(value: float) -> None:
+    assert bound(value, 0.) is ported(value)
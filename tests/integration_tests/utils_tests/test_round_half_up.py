@@ -0,0 +1,10 @@
+from _wagyu import round_half_up as bound
+from hypothesis import given
+
+from wagyu.utils import round_half_up as ported
+from . import strategies
+
+
+@given(strategies.floats)
+def test_basic(value: float) -> None:
+    assert bound(value) == ported(value)
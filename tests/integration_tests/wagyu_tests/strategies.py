@@ -2,6 +2,7 @@ from hypothesis import strategies
 from hypothesis_geometry import planar
 
 from tests.binding_tests.utils import (bound_fill_kinds,
+                                       bound_operation_kinds,
                                        bound_polygon_kinds)
 from tests.integration_tests.utils import (
     to_bound_with_ported_linear_rings_pair,
@@ -10,6 +11,7 @@ from tests.integration_tests.utils import (
     to_bound_with_ported_polygons_pair,
     to_bound_with_ported_wagyus_pair)
 from tests.port_tests.utils import (ported_fill_kinds,
+                                    ported_operation_kinds,
                                     ported_polygon_kinds)
 from tests.strategies import coordinates
 
@@ -21,9 +23,17 @@ linear_rings_pairs = (linear_rings_points_pairs
                       .map(to_bound_with_ported_linear_rings_pair))
 polygons_pairs = (planar.polygons(coordinates)
                   .map(to_bound_with_ported_polygons_pair))
+polygons_pairs_pairs_lists = strategies.lists(
+        strategies.tuples(polygons_pairs, polygons_pairs),
+        max_size=5)
 polygon_kinds_pairs = strategies.sampled_from(
         list(zip(bound_polygon_kinds, ported_polygon_kinds)))
 multipolygons_pairs = (planar.multipolygons(coordinates)
                        .map(to_bound_with_ported_multipolygons_pair))
+non_empty_multipolygons_pairs = (planar.multipolygons(coordinates,
+                                                      min_size=1)
+                                 .map(to_bound_with_ported_multipolygons_pair))
 fill_kinds_pairs = strategies.sampled_from(list(zip(bound_fill_kinds,
                                                     ported_fill_kinds)))
+operation_kinds_pairs = strategies.sampled_from(
+        list(zip(bound_operation_kinds, ported_operation_kinds)))
@@ -0,0 +1,125 @@
+import pytest
+from hypothesis import given
+
+from tests.binding_tests.utils import (BoundExecuteStats,
+                                       BoundInterrupted,
+                                       BoundInterrupter,
+                                       BoundPolygonKind)
+from tests.integration_tests.utils import (
+    BoundPortedFillKindsPair,
+    BoundPortedMultipolygonsPair,
+    BoundPortedOperationKindsPair,
+    BoundPortedWagyusPair,
+    are_bound_ported_multipolygons_equal)
+from tests.port_tests.utils import (PortedExecuteStats,
+                                    PortedInterrupted,
+                                    PortedInterrupter,
+                                    PortedPolygonKind)
+from . import strategies
+
+
+@given(strategies.wagyus_pairs, strategies.multipolygons_pairs,
+       strategies.multipolygons_pairs, strategies.operation_kinds_pairs,
+       strategies.fill_kinds_pairs, strategies.fill_kinds_pairs)
+def test_basic(wagyus_pair: BoundPortedWagyusPair,
+               subjects_pair: BoundPortedMultipolygonsPair,
+               clips_pair: BoundPortedMultipolygonsPair,
+               operation_kinds_pair: BoundPortedOperationKindsPair,
+               subject_fill_kinds_pair: BoundPortedFillKindsPair,
+               clip_fill_kinds_pair: BoundPortedFillKindsPair) -> None:
+    bound, ported = wagyus_pair
+    bound_subject, ported_subject = subjects_pair
+    bound_clip, ported_clip = clips_pair
+    bound_operation_kind, ported_operation_kind = operation_kinds_pair
+    bound_subject_fill_kind, ported_subject_fill_kind = subject_fill_kinds_pair
+    bound_clip_fill_kind, ported_clip_fill_kind = clip_fill_kinds_pair
+
+    for bound_subject_polygon in bound_subject:
+        bound.add_polygon(bound_subject_polygon, BoundPolygonKind.SUBJECT)
+    for bound_clip_polygon in bound_clip:
+        bound.add_polygon(bound_clip_polygon, BoundPolygonKind.CLIP)
+    for ported_subject_polygon in ported_subject:
+        ported.add_polygon(ported_subject_polygon, PortedPolygonKind.SUBJECT)
+    for ported_clip_polygon in ported_clip:
+        ported.add_polygon(ported_clip_polygon, PortedPolygonKind.CLIP)
+
+    bound_result = bound.execute(bound_operation_kind, bound_subject_fill_kind,
+                                 bound_clip_fill_kind, BoundInterrupter())
+    ported_result = ported.execute(ported_operation_kind,
+                                   ported_subject_fill_kind,
+                                   ported_clip_fill_kind, PortedInterrupter())
+
+    assert are_bound_ported_multipolygons_equal(bound_result, ported_result)
+
+
+@given(strategies.wagyus_pairs, strategies.non_empty_multipolygons_pairs,
+       strategies.operation_kinds_pairs, strategies.fill_kinds_pairs,
+       strategies.fill_kinds_pairs)
+def test_interrupted(wagyus_pair: BoundPortedWagyusPair,
+                     subjects_pair: BoundPortedMultipolygonsPair,
+                     operation_kinds_pair: BoundPortedOperationKindsPair,
+                     subject_fill_kinds_pair: BoundPortedFillKindsPair,
+                     clip_fill_kinds_pair: BoundPortedFillKindsPair) -> None:
+    bound, ported = wagyus_pair
+    bound_subject, ported_subject = subjects_pair
+    bound_operation_kind, ported_operation_kind = operation_kinds_pair
+    bound_subject_fill_kind, ported_subject_fill_kind = subject_fill_kinds_pair
+    bound_clip_fill_kind, ported_clip_fill_kind = clip_fill_kinds_pair
+
+    for bound_subject_polygon in bound_subject:
+        bound.add_polygon(bound_subject_polygon, BoundPolygonKind.SUBJECT)
+    for ported_subject_polygon in ported_subject:
+        ported.add_polygon(ported_subject_polygon, PortedPolygonKind.SUBJECT)
+
+    with pytest.raises(BoundInterrupted):
+        bound.execute(bound_operation_kind, bound_subject_fill_kind,
+                      bound_clip_fill_kind, BoundInterrupter(requested=True))
+    with pytest.raises(PortedInterrupted):
+        ported.execute(ported_operation_kind, ported_subject_fill_kind,
+                       ported_clip_fill_kind,
+                       PortedInterrupter(requested=True))
+
+
+@given(strategies.wagyus_pairs, strategies.multipolygons_pairs,
+       strategies.multipolygons_pairs, strategies.operation_kinds_pairs,
+       strategies.fill_kinds_pairs, strategies.fill_kinds_pairs)
+def test_stats(wagyus_pair: BoundPortedWagyusPair,
+               subjects_pair: BoundPortedMultipolygonsPair,
+               clips_pair: BoundPortedMultipolygonsPair,
+               operation_kinds_pair: BoundPortedOperationKindsPair,
+               subject_fill_kinds_pair: BoundPortedFillKindsPair,
+               clip_fill_kinds_pair: BoundPortedFillKindsPair) -> None:
+    bound, ported = wagyus_pair
+    bound_subject, ported_subject = subjects_pair
+    bound_clip, ported_clip = clips_pair
+    bound_operation_kind, ported_operation_kind = operation_kinds_pair
+    bound_subject_fill_kind, ported_subject_fill_kind = subject_fill_kinds_pair
+    bound_clip_fill_kind, ported_clip_fill_kind = clip_fill_kinds_pair
+
+    for bound_subject_polygon in bound_subject:
+        bound.add_polygon(bound_subject_polygon, BoundPolygonKind.SUBJECT)
+    for bound_clip_polygon in bound_clip:
+        bound.add_polygon(bound_clip_polygon, BoundPolygonKind.CLIP)
+    for ported_subject_polygon in ported_subject:
+        ported.add_polygon(ported_subject_polygon, PortedPolygonKind.SUBJECT)
+    for ported_clip_polygon in ported_clip:
+        ported.add_polygon(ported_clip_polygon, PortedPolygonKind.CLIP)
+
+    bound_stats, ported_stats = BoundExecuteStats(), PortedExecuteStats()
+    bound_result = bound.execute(bound_operation_kind, bound_subject_fill_kind,
+                                 bound_clip_fill_kind, None, bound_stats)
+    ported_result = ported.execute(ported_operation_kind,
+                                   ported_subject_fill_kind,
+                                   ported_clip_fill_kind, None, ported_stats)
+
+    assert are_bound_ported_multipolygons_equal(bound_result, ported_result)
+    assert bound_stats.scanbeams_count == ported_stats.scanbeams_count
+    assert bound_stats.active_bounds_peak == ported_stats.active_bounds_peak
+    assert (bound_stats.intersections_count
+            == ported_stats.intersections_count)
+    assert bound_stats.hot_pixels_count == ported_stats.hot_pixels_count
+    assert (bound_stats.rings_created_count
+            == ported_stats.rings_created_count)
+    assert (bound_stats.rings_removed_count
+            == ported_stats.rings_removed_count)
+
@@ -0,0 +1,41 @@
+from typing import List
+
+from hypothesis import given
+
+from tests.binding_tests.utils import BoundWagyu
+from tests.integration_tests.utils import (
+    BoundPortedFillKindsPair,
+    BoundPortedOperationKindsPair,
+    BoundPortedPolygonsPair,
+    are_bound_ported_multipolygons_equal)
+from tests.port_tests.utils import PortedWagyu
+from . import strategies
+
+
+@given(strategies.polygons_pairs_pairs_lists,
+       strategies.operation_kinds_pairs, strategies.fill_kinds_pairs,
+       strategies.fill_kinds_pairs, strategies.booleans)
+def test_basic(polygons_pairs_pairs: List[BoundPortedPolygonsPair],
+               operation_kinds_pair: BoundPortedOperationKindsPair,
+               subject_fill_kinds_pair: BoundPortedFillKindsPair,
+               clip_fill_kinds_pair: BoundPortedFillKindsPair,
+               reverse_output: bool) -> None:
+    bound_operation_kind, ported_operation_kind = operation_kinds_pair
+    bound_subject_fill_kind, ported_subject_fill_kind = subject_fill_kinds_pair
+    bound_clip_fill_kind, ported_clip_fill_kind = clip_fill_kinds_pair
+
+    bound_result = BoundWagyu.execute_many(
+            [(bound_subject, bound_clip)
+             for (bound_subject, _), (bound_clip, _) in polygons_pairs_pairs],
+            bound_operation_kind, bound_subject_fill_kind,
+            bound_clip_fill_kind, reverse_output)
+    ported_result = PortedWagyu.execute_many(
+            [(ported_subject, ported_clip)
+             for (_, ported_subject), (_, ported_clip)
+             in polygons_pairs_pairs],
+            ported_operation_kind, ported_subject_fill_kind,
+            ported_clip_fill_kind, reverse_output)
+
+    assert len(bound_result) == len(ported_result) == len(polygons_pairs_pairs)
+    assert all(map(are_bound_ported_multipolygons_equal, bound_result,
+                   ported_result))
@@ -0,0 +1,32 @@
+from typing import (List,
+                    Tuple)
+
+from hypothesis import strategies
+
+from tests.strategies import (floats,
+                              trits)
+from tests.utils import (Strategy,
+                         to_maybe)
+from wagyu.bound import Bound
+from wagyu.enums import PolygonKind
+
+polygon_kinds = strategies.sampled_from(list(PolygonKind))
+bounds = strategies.builds(Bound,
+                           current_x=floats,
+                           winding_delta=trits,
+                           polygon_kind=polygon_kinds)
+bounds_lists = strategies.lists(bounds)
+maybe_bounds_lists = strategies.lists(to_maybe(bounds))
+
+
+def to_bounds_lists_with_indices(bounds_list: List[Bound]
+                                 ) -> Strategy[Tuple[List[Bound], int]]:
+    return strategies.tuples(strategies.just(bounds_list),
+                             strategies.integers(-len(bounds_list),
+                                                 len(bounds_list)))
+
+
+bounds_lists_with_indices = bounds_lists.flatmap(to_bounds_lists_with_indices)
+non_empty_bounds_lists_with_indices = (strategies.lists(bounds,
+                                                        min_size=1)
+                                       .flatmap(to_bounds_lists_with_indices))
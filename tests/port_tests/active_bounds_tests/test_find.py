@@ -0,0 +1,79 @@
+from typing import (List,
+                    Optional,
+                    Tuple)
+
+from hypothesis import given
+
+from wagyu.active_bounds import ActiveBounds
+from wagyu.bound import Bound
+from wagyu.utils import find
+from . import strategies
+
+
+@given(strategies.maybe_bounds_lists, strategies.bounds)
+def test_basic(bounds_list: List[Optional[Bound]], bound: Bound) -> None:
+    active_bounds = ActiveBounds(bounds_list)
+
+    assert all(active_bounds.find(element) == find(element, bounds_list)
+               for element in bounds_list
+               if element is not None)
+    assert active_bounds.find(bound) == len(active_bounds)
+
+
+@given(strategies.bounds_lists_with_indices, strategies.bounds)
+def test_after_insertion(bounds_list_with_index: Tuple[List[Bound], int],
+                         bound: Bound) -> None:
+    bounds_list, index = bounds_list_with_index
+    active_bounds = ActiveBounds(bounds_list)
+    for element in bounds_list:
+        active_bounds.find(element)
+
+    active_bounds.insert(index, bound)
+
+    assert all(active_bounds.find(element) == find(element, active_bounds)
+               for element in active_bounds)
+
+
+@given(strategies.non_empty_bounds_lists_with_indices)
+def test_after_deletion(bounds_list_with_index: Tuple[List[Bound], int]
+                        ) -> None:
+    bounds_list, index = bounds_list_with_index
+    index = min(index, len(bounds_list) - 1)
+    active_bounds = ActiveBounds(bounds_list)
+    for element in bounds_list:
+        active_bounds.find(element)
+    bound = active_bounds[index]
+
+    del active_bounds[index]
+
+    assert all(active_bounds.find(element) == find(element, active_bounds)
+               for element in active_bounds)
+    assert active_bounds.find(bound) == len(active_bounds)
+
+
+@given(strategies.non_empty_bounds_lists_with_indices)
+def test_after_swap(bounds_list_with_index: Tuple[List[Bound], int]) -> None:
+    bounds_list, index = bounds_list_with_index
+    index = min(index, len(bounds_list) - 1)
+    active_bounds = ActiveBounds(bounds_list)
+    for element in bounds_list:
+        active_bounds.find(element)
+
+    active_bounds[0], active_bounds[index] = (active_bounds[index],
+                                              active_bounds[0])
+
+    assert all(active_bounds.find(element) == find(element, active_bounds)
+               for element in active_bounds)
+
+
+@given(strategies.non_empty_bounds_lists_with_indices)
+def test_after_tombstoning(bounds_list_with_index: Tuple[List[Bound], int]
+                           ) -> None:
+    bounds_list, index = bounds_list_with_index
+    index = min(index, len(bounds_list) - 1)
+    active_bounds = ActiveBounds(bounds_list)
+    bound = active_bounds[index]
+
+    active_bounds[index] = None
+
+    assert active_bounds.find(bound) == len(active_bounds)
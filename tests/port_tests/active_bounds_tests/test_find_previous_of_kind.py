@@ -0,0 +1,64 @@
+from typing import (List,
+                    Tuple)
+
+from hypothesis import given
+
+from wagyu.active_bounds import ActiveBounds
+from wagyu.bound import Bound
+from wagyu.enums import PolygonKind
+from . import strategies
+
+
+@given(strategies.non_empty_bounds_lists_with_indices,
+       strategies.polygon_kinds)
+def test_basic(bounds_list_with_index: Tuple[List[Bound], int],
+               polygon_kind: PolygonKind) -> None:
+    bounds_list, index = bounds_list_with_index
+    index = abs(index)
+    active_bounds = ActiveBounds(bounds_list)
+
+    result = active_bounds.find_previous_of_kind(index, polygon_kind)
+
+    assert result == to_previous_of_kind(active_bounds, index, polygon_kind)
+
+
+@given(strategies.non_empty_bounds_lists_with_indices, strategies.bounds,
+       strategies.polygon_kinds)
+def test_after_insertion(bounds_list_with_index: Tuple[List[Bound], int],
+                         bound: Bound,
+                         polygon_kind: PolygonKind) -> None:
+    bounds_list, index = bounds_list_with_index
+    active_bounds = ActiveBounds(bounds_list)
+    active_bounds.find_previous_of_kind(len(active_bounds), polygon_kind)
+
+    active_bounds.insert(index, bound)
+
+    assert all(active_bounds.find_previous_of_kind(index, polygon_kind)
+               == to_previous_of_kind(active_bounds, index, polygon_kind)
+               for index in range(len(active_bounds) + 1))
+
+
+@given(strategies.non_empty_bounds_lists_with_indices,
+       strategies.polygon_kinds)
+def test_after_swap(bounds_list_with_index: Tuple[List[Bound], int],
+                    polygon_kind: PolygonKind) -> None:
+    bounds_list, index = bounds_list_with_index
+    index = min(abs(index), len(bounds_list) - 1)
+    active_bounds = ActiveBounds(bounds_list)
+    active_bounds.find_previous_of_kind(len(active_bounds), polygon_kind)
+
+    active_bounds[0], active_bounds[index] = (active_bounds[index],
+                                              active_bounds[0])
+
+    assert all(active_bounds.find_previous_of_kind(index, polygon_kind)
+               == to_previous_of_kind(active_bounds, index, polygon_kind)
+               for index in range(len(active_bounds) + 1))
+
+
+def to_previous_of_kind(bounds: List[Bound],
+                        index: int,
+                        polygon_kind: PolygonKind) -> int:
+    index -= 1
+    while index >= 0 and bounds[index].polygon_kind is not polygon_kind:
+        index -= 1
+    return index
@@ -0,0 +1,50 @@
+from typing import (List,
+                    Tuple)
+
+from hypothesis import given
+
+from wagyu.active_bounds import ActiveBounds
+from wagyu.bound import Bound
+from . import strategies
+
+
+@given(strategies.bounds_lists_with_indices)
+def test_basic(bounds_list_with_index: Tuple[List[Bound], int]) -> None:
+    bounds_list, index = bounds_list_with_index
+    index = abs(index)
+    active_bounds = ActiveBounds(bounds_list)
+
+    assert all(active_bounds.winding_deltas_sum(start, index)
+               == sum(bound.winding_delta
+                      for bound in bounds_list[start:index])
+               for start in range(index + 1))
+
+
+@given(strategies.bounds_lists_with_indices, strategies.bounds)
+def test_after_insertion(bounds_list_with_index: Tuple[List[Bound], int],
+                         bound: Bound) -> None:
+    bounds_list, index = bounds_list_with_index
+    active_bounds = ActiveBounds(bounds_list)
+    active_bounds.winding_deltas_sum(0, len(active_bounds))
+
+    active_bounds.insert(index, bound)
+
+    assert all(active_bounds.winding_deltas_sum(0, stop)
+               == sum(bound.winding_delta for bound in active_bounds[:stop])
+               for stop in range(len(active_bounds) + 1))
+
+
+@given(strategies.non_empty_bounds_lists_with_indices)
+def test_after_tombstoning(bounds_list_with_index: Tuple[List[Bound], int]
+                           ) -> None:
+    bounds_list, index = bounds_list_with_index
+    index = min(abs(index), len(bounds_list) - 1)
+    active_bounds = ActiveBounds(bounds_list)
+    active_bounds.winding_deltas_sum(0, len(active_bounds))
+
+    active_bounds[index] = None
+
+    assert (active_bounds.winding_deltas_sum(0, len(active_bounds))
+            == sum(bound.winding_delta
+                   for bound in active_bounds
+                   if bound is not None))
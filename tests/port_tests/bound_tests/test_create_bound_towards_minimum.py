@@ -0,0 +1,9 @@
+import pytest
+
+from wagyu.bound import create_bound_towards_minimum
+from wagyu.edge import EdgesArrays
+
+
+def test_empty() -> None:
+    with pytest.raises(ValueError):
+        create_bound_towards_minimum(EdgesArrays())
@@ -34,7 +34,7 @@ def test_basic(edges: List[Edge],
                    ring, current_x, position, winding_count,
                    opposite_winding_count, winding_delta, polygon_kind, side)
 
-    assert result.edges == edges
+    assert list(result.edges) == edges
     assert result.current_edge_index == min(current_edge_index, len(edges))
     assert result.next_edge_index == min(next_edge_index, len(edges))
     assert result.last_point == last_point
@@ -0,0 +1,14 @@
+from hypothesis import strategies
+
+from tests.strategies import (coordinates,
+                              floats)
+from wagyu.edge import Edge
+from wagyu.point import Point
+
+points = (strategies.builds(Point, coordinates, coordinates)
+          | strategies.builds(Point, floats, floats))
+edges = strategies.builds(Edge, points, points)
+edges_lists = strategies.lists(edges)
+non_empty_edges_lists = strategies.lists(edges,
+                                         min_size=1)
+floats = floats
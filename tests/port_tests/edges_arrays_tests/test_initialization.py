@@ -0,0 +1,16 @@
+from typing import List
+
+from hypothesis import given
+
+from wagyu.edge import (Edge,
+                        EdgesArrays)
+from . import strategies
+
+
+@given(strategies.edges_lists)
+def test_basic(edges: List[Edge]) -> None:
+    result = EdgesArrays(edges)
+
+    assert len(result) == len(edges)
+    assert list(result) == edges
+    assert [edge.slope for edge in result] == [edge.slope for edge in edges]
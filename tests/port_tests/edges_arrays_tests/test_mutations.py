@@ -0,0 +1,73 @@
+from typing import List
+
+from hypothesis import given
+
+from wagyu.edge import (Edge,
+                        EdgesArrays)
+from wagyu.utils import rotate_sequence
+from . import strategies
+
+
+@given(strategies.edges_lists, strategies.edges_lists)
+def test_extend(first_edges: List[Edge], second_edges: List[Edge]) -> None:
+    result = EdgesArrays(first_edges)
+
+    result.extend(EdgesArrays(second_edges))
+
+    assert list(result) == first_edges + second_edges
+
+
+@given(strategies.non_empty_edges_lists)
+def test_reverse_horizontal(edges: List[Edge]) -> None:
+    result = EdgesArrays(edges)
+
+    result.reverse_horizontal(0)
+    edges[0].reverse_horizontal()
+
+    assert list(result) == edges
+
+
+@given(strategies.non_empty_edges_lists)
+def test_rotate(edges: List[Edge]) -> None:
+    result = EdgesArrays(edges)
+
+    result.rotate(-1)
+
+    assert list(result) == rotate_sequence(edges, -1)
+
+
+@given(strategies.non_empty_edges_lists, strategies.floats)
+def test_get_current_x(edges: List[Edge], current_y: float) -> None:
+    result = EdgesArrays(edges)
+
+    assert result.get_current_x(0, current_y) == edges[0].get_current_x(
+            current_y)
+
+
+@given(strategies.non_empty_edges_lists, strategies.floats)
+def test_get_min_x(edges: List[Edge], current_y: float) -> None:
+    result = EdgesArrays(edges)
+
+    assert result.get_min_x(0, current_y) == result[0].get_min_x(current_y)
+
+
+@given(strategies.non_empty_edges_lists, strategies.floats)
+def test_get_max_x(edges: List[Edge], current_y: float) -> None:
+    result = EdgesArrays(edges)
+
+    assert result.get_max_x(0, current_y) == result[0].get_max_x(current_y)
+
+
+@given(strategies.non_empty_edges_lists)
+def test_endpoints(edges: List[Edge]) -> None:
+    result = EdgesArrays(edges)
+
+    assert result.get_bottom(-1) == result[-1].bottom
+    assert result.get_top(-1) == result[-1].top
+
+
+@given(strategies.non_empty_edges_lists, strategies.non_empty_edges_lists)
+def test_intersect(first_edges: List[Edge], second_edges: List[Edge]) -> None:
+    first, second = EdgesArrays(first_edges), EdgesArrays(second_edges)
+
+    assert first.intersect(0, second, -1) == first[0] & second[-1]
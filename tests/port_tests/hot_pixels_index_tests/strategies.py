@@ -0,0 +1,20 @@
+from itertools import groupby
+from typing import List
+
+from hypothesis import strategies
+
+from tests.strategies import coordinates
+from wagyu.point import Point
+
+coordinates = coordinates
+points = strategies.builds(Point, coordinates, coordinates)
+
+
+def to_sorted_hot_pixels(points_list: List[Point]) -> List[Point]:
+    return [point
+            for point, _ in groupby(sorted(points_list,
+                                           key=lambda point: (-point.y,
+                                                              point.x)))]
+
+
+hot_pixels_lists = strategies.lists(points).map(to_sorted_hot_pixels)
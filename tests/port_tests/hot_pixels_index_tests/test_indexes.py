@@ -0,0 +1,24 @@
+from typing import List
+
+from hypothesis import given
+
+from wagyu.hot_pixels import HotPixelsIndex
+from wagyu.point import Point
+from . import strategies
+
+
+@given(strategies.hot_pixels_lists)
+def test_basic(hot_pixels: List[Point]) -> None:
+    hot_pixels_index = HotPixelsIndex(hot_pixels)
+
+    assert hot_pixels_index.indexes(hot_pixels)
+    assert not hot_pixels_index.indexes(hot_pixels[:])
+
+
+@given(strategies.hot_pixels_lists, strategies.points)
+def test_after_append(hot_pixels: List[Point], point: Point) -> None:
+    hot_pixels_index = HotPixelsIndex(hot_pixels)
+
+    hot_pixels.append(point)
+
+    assert not hot_pixels_index.indexes(hot_pixels)
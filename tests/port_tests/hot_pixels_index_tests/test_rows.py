@@ -0,0 +1,46 @@
+from typing import List
+
+from hypothesis import given
+
+from wagyu.hints import Coordinate
+from wagyu.hot_pixels import HotPixelsIndex
+from wagyu.point import Point
+from . import strategies
+
+
+@given(strategies.hot_pixels_lists, strategies.coordinates,
+       strategies.coordinates, strategies.coordinates,
+       strategies.coordinates)
+def test_basic(hot_pixels: List[Point],
+               max_y: Coordinate,
+               min_y: Coordinate,
+               min_x: Coordinate,
+               max_x: Coordinate) -> None:
+    hot_pixels_index = HotPixelsIndex(hot_pixels)
+
+    result = [hot_pixel
+              for _, start, stop in hot_pixels_index.rows(max_y, min_y,
+                                                          min_x, max_x)
+              for hot_pixel in hot_pixels[start:stop]]
+
+    assert result == [hot_pixel
+                      for hot_pixel in hot_pixels
+                      if (min_y <= hot_pixel.y <= max_y
+                          and min_x <= hot_pixel.x <= max_x)]
+
+
+@given(strategies.hot_pixels_lists, strategies.coordinates,
+       strategies.coordinates, strategies.coordinates,
+       strategies.coordinates)
+def test_rows(hot_pixels: List[Point],
+              max_y: Coordinate,
+              min_y: Coordinate,
+              min_x: Coordinate,
+              max_x: Coordinate) -> None:
+    hot_pixels_index = HotPixelsIndex(hot_pixels)
+
+    result = hot_pixels_index.rows(max_y, min_y, min_x, max_x)
+
+    assert all(hot_pixel.y == y
+               for y, start, stop in result
+               for hot_pixel in hot_pixels[start:stop])
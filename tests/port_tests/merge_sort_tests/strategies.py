@@ -0,0 +1,10 @@
+from hypothesis import strategies
+
+from tests.strategies import coordinates
+
+# narrow range to get plenty of ties
+small_coordinates = strategies.integers(0, 5)
+coordinates_pairs_lists = (
+        strategies.lists(strategies.tuples(coordinates, coordinates))
+        | strategies.lists(strategies.tuples(small_coordinates,
+                                             small_coordinates)))
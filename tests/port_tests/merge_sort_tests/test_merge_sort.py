@@ -0,0 +1,43 @@
+from functools import partial
+from operator import itemgetter
+from typing import (List,
+                    Tuple)
+
+from hypothesis import given
+
+from wagyu.hints import Coordinate
+from wagyu.bubble_sort import bubble_sort
+from wagyu.merge_sort import merge_sort
+from . import strategies
+
+CoordinatesPair = Tuple[Coordinate, Coordinate]
+
+
+def on_swap(swaps: List[Tuple[CoordinatesPair, CoordinatesPair]],
+            left: CoordinatesPair,
+            right: CoordinatesPair) -> None:
+    swaps.append((left, right))
+
+
+@given(strategies.coordinates_pairs_lists)
+def test_basic(pairs: List[CoordinatesPair]) -> None:
+    def comparator(left: CoordinatesPair, right: CoordinatesPair) -> bool:
+        return left[0] <= right[0]
+
+    bubble_swaps, merge_swaps = [], []
+    assert (merge_sort(pairs, comparator, partial(on_swap, merge_swaps),
+                       itemgetter(0))
+            == bubble_sort(pairs, comparator, partial(on_swap, bubble_swaps)))
+    assert merge_swaps == bubble_swaps
+
+
+@given(strategies.coordinates_pairs_lists)
+def test_inconsistent_comparator(pairs: List[CoordinatesPair]) -> None:
+    def comparator(left: CoordinatesPair, right: CoordinatesPair) -> bool:
+        return left[0] <= right[0] or left[1] == right[1]
+
+    bubble_swaps, merge_swaps = [], []
+    assert (merge_sort(pairs, comparator, partial(on_swap, merge_swaps),
+                       itemgetter(0))
+            == bubble_sort(pairs, comparator, partial(on_swap, bubble_swaps)))
+    assert merge_swaps == bubble_swaps
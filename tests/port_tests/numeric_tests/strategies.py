@@ -0,0 +1,9 @@
+from hypothesis import strategies
+
+from tests.strategies import (floats,
+                              integers_32)
+
+floats = floats
+floats_pairs = strategies.tuples(floats, floats)
+integers_32 = integers_32
+integers_32_pairs = strategies.tuples(integers_32, integers_32)
@@ -0,0 +1,24 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from wagyu.numeric import (are_floats_almost_equal,
+                           max_almost_equal_difference)
+from . import strategies
+
+
+@given(strategies.floats)
+def test_basic(value: float) -> None:
+    result = max_almost_equal_difference(value)
+
+    assert result > 0
+
+
+@given(strategies.floats_pairs)
+def test_properties(values_pair: Tuple[float, float]) -> None:
+    first, second = values_pair
+
+    result = max_almost_equal_difference(first)
+
+    assert (abs(second - first) <= result
+            or not are_floats_almost_equal(first, second))
@@ -0,0 +1,21 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from wagyu.numeric import to_int32
+from . import strategies
+
+
+@given(strategies.integers_32)
+def test_in_range(value: int) -> None:
+    assert to_int32(value) == value
+
+
+@given(strategies.integers_32_pairs)
+def test_wrapping(values_pair: Tuple[int, int]) -> None:
+    first, second = values_pair
+
+    result = to_int32(first + second)
+
+    assert -2 ** 31 <= result < 2 ** 31
+    assert (result - (first + second)) % 2 ** 32 == 0
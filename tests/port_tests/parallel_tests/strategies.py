@@ -0,0 +1,14 @@
+from hypothesis import strategies
+from hypothesis_geometry import planar
+
+from tests.port_tests.utils import (ported_fill_kinds,
+                                    ported_operation_kinds,
+                                    to_ported_polygon)
+from tests.strategies import coordinates
+
+booleans = strategies.booleans()
+polygons = planar.polygons(coordinates).map(to_ported_polygon)
+polygons_pairs_lists = strategies.lists(strategies.tuples(polygons, polygons),
+                                        max_size=5)
+fill_kinds = strategies.sampled_from(ported_fill_kinds)
+operation_kinds = strategies.sampled_from(ported_operation_kinds)
@@ -0,0 +1,76 @@
+from typing import (List,
+                    Tuple)
+
+from hypothesis import given
+
+from tests.port_tests.utils import (PortedFillKind,
+                                    PortedMultipolygon,
+                                    PortedOperationKind,
+                                    PortedPolygon,
+                                    PortedWagyu)
+from wagyu.parallel import map_execute
+from . import strategies
+
+
+@given(strategies.polygons_pairs_lists, strategies.operation_kinds,
+       strategies.fill_kinds, strategies.fill_kinds, strategies.booleans)
+def test_basic(polygons_pairs: List[Tuple[PortedPolygon, PortedPolygon]],
+               operation_kind: PortedOperationKind,
+               subject_fill_kind: PortedFillKind,
+               clip_fill_kind: PortedFillKind,
+               reverse_output: bool) -> None:
+    result = map_execute(polygons_pairs, operation_kind, subject_fill_kind,
+                         clip_fill_kind, reverse_output,
+                         max_workers=1)
+
+    assert result == PortedWagyu.execute_many(polygons_pairs, operation_kind,
+                                              subject_fill_kind,
+                                              clip_fill_kind, reverse_output)
+
+
+@given(strategies.polygons_pairs_lists, strategies.operation_kinds,
+       strategies.fill_kinds, strategies.fill_kinds)
+def test_coordinates_types(polygons_pairs: List[Tuple[PortedPolygon,
+                                                      PortedPolygon]],
+                           operation_kind: PortedOperationKind,
+                           subject_fill_kind: PortedFillKind,
+                           clip_fill_kind: PortedFillKind) -> None:
+    result = map_execute(polygons_pairs, operation_kind, subject_fill_kind,
+                         clip_fill_kind,
+                         max_workers=1)
+
+    assert (list(map(to_coordinates_types, result))
+            == list(map(to_coordinates_types,
+                        PortedWagyu.execute_many(polygons_pairs,
+                                                 operation_kind,
+                                                 subject_fill_kind,
+                                                 clip_fill_kind))))
+
+
+@given(strategies.polygons_pairs_lists, strategies.operation_kinds,
+       strategies.fill_kinds, strategies.fill_kinds, strategies.booleans)
+def test_integer_coordinates(polygons_pairs: List[Tuple[PortedPolygon,
+                                                        PortedPolygon]],
+                             operation_kind: PortedOperationKind,
+                             subject_fill_kind: PortedFillKind,
+                             clip_fill_kind: PortedFillKind,
+                             reverse_output: bool) -> None:
+    result = map_execute(polygons_pairs, operation_kind, subject_fill_kind,
+                         clip_fill_kind, reverse_output, int,
+                         max_workers=1)
+
+    assert result == PortedWagyu.execute_many(polygons_pairs, operation_kind,
+                                              subject_fill_kind,
+                                              clip_fill_kind, reverse_output,
+                                              int)
+    assert all(coordinate_type is int
+               for multipolygon in result
+               for coordinate_type in to_coordinates_types(multipolygon))
+
+
+def to_coordinates_types(multipolygon: PortedMultipolygon) -> List[type]:
+    return [type(coordinate)
+            for polygon in multipolygon
+            for linear_ring in polygon
+            for point in linear_ring
+            for coordinate in (point.x, point.y)]
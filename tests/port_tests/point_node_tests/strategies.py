@@ -1,6 +1,34 @@
+from typing import (List,
+                    Tuple)
+
 from hypothesis import strategies
 
 from tests.strategies import coordinates
-from wagyu.point_node import PointNode
+from wagyu.point_node import (DoubledStats,
+                              PointNode)
 
 points_nodes = strategies.builds(PointNode, coordinates, coordinates)
+small_coordinates = strategies.integers(-3, 3)
+points_nodes_lists = strategies.lists(strategies.builds(PointNode,
+                                                        small_coordinates,
+                                                        small_coordinates))
+
+
+def to_split_ring(x: int,
+                  y: int,
+                  first_tail: List[PointNode],
+                  second_tail: List[PointNode]
+                  ) -> Tuple[PointNode, PointNode, DoubledStats]:
+    first, second = PointNode(x, y), PointNode(x, y)
+    for node in [*first_tail, second, *second_tail]:
+        node.place_before(first)
+    doubled_stats = first.doubled_stats
+    third, fourth = first.prev, second.prev
+    first.prev, fourth.next = fourth, first
+    second.prev, third.next = third, second
+    return first, second, doubled_stats
+
+
+split_rings = strategies.builds(to_split_ring, small_coordinates,
+                                small_coordinates, points_nodes_lists,
+                                points_nodes_lists)
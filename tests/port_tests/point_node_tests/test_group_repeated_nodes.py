@@ -0,0 +1,29 @@
+from itertools import groupby
+from typing import List
+
+from hypothesis import given
+
+from wagyu.point_node import (PointNode,
+                              group_repeated_nodes,
+                              node_key)
+from . import strategies
+
+
+@given(strategies.points_nodes_lists)
+def test_basic(nodes: List[PointNode]) -> None:
+    result = group_repeated_nodes(nodes)
+
+    assert all(len(group) > 1 for group in result)
+    assert all(node == group[0] for group in result for node in group)
+
+
+@given(strategies.points_nodes_lists)
+def test_sorted_runs(nodes: List[PointNode]) -> None:
+    result = group_repeated_nodes(nodes)
+
+    runs = [list(run)
+            for _, run in groupby(sorted(nodes,
+                                         key=node_key),
+                                  key=node_key)]
+    assert ([list(map(id, group)) for group in result]
+            == [list(map(id, run)) for run in runs if len(run) > 1])
@@ -0,0 +1,33 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from wagyu.point_node import (DoubledStats,
+                              PointNode,
+                              split_doubled_stats)
+from . import strategies
+
+
+@given(strategies.split_rings)
+def test_basic(split_ring: Tuple[PointNode, PointNode, DoubledStats]
+               ) -> None:
+    first, second, doubled_stats = split_ring
+
+    result = split_doubled_stats(first, second, doubled_stats)
+
+    assert result == (first.doubled_stats, second.doubled_stats)
+
+
+@given(strategies.split_rings)
+def test_totals(split_ring: Tuple[PointNode, PointNode, DoubledStats]
+                ) -> None:
+    first, second, doubled_stats = split_ring
+
+    first_stats, second_stats = split_doubled_stats(first, second,
+                                                    doubled_stats)
+
+    first_doubled_area, first_size, _ = first_stats
+    second_doubled_area, second_size, _ = second_stats
+    doubled_area, size, _ = doubled_stats
+    assert first_doubled_area + second_doubled_area == doubled_area
+    assert first_size + second_size == size
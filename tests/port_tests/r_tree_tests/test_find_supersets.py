@@ -0,0 +1,26 @@
+from typing import List
+
+from hypothesis import given
+
+from wagyu.box import Box
+from wagyu.r_tree import RTree
+from . import strategies
+
+
+@given(strategies.boxes_lists, strategies.boxes)
+def test_basic(boxes: List[Box], box: Box) -> None:
+    tree = RTree(boxes)
+
+    result = tree.find_supersets(box)
+
+    assert result == [index
+                      for index, candidate in enumerate(boxes)
+                      if box.inside_of(candidate)]
+
+
+@given(strategies.boxes_lists)
+def test_elements(boxes: List[Box]) -> None:
+    tree = RTree(boxes)
+
+    assert all(index in tree.find_supersets(box)
+               for index, box in enumerate(boxes))
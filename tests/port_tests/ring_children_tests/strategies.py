@@ -0,0 +1,20 @@
+from typing import List
+
+from hypothesis import strategies
+
+from tests.utils import (Strategy,
+                         to_maybe)
+from wagyu.ring import Ring
+
+rings = strategies.builds(Ring)
+maybe_rings_lists = strategies.lists(to_maybe(rings))
+
+
+def to_maybe_rings_lists_with_repeats(rings_list: List[Ring]
+                                      ) -> Strategy[List[Ring]]:
+    return strategies.lists(to_maybe(strategies.sampled_from(rings_list)))
+
+
+maybe_rings_lists_with_repeats = (strategies.lists(rings,
+                                                   min_size=1)
+                                  .flatmap(to_maybe_rings_lists_with_repeats))
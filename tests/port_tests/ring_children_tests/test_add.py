@@ -0,0 +1,49 @@
+from typing import (List,
+                    Optional)
+
+from hypothesis import given
+
+from wagyu.ring import Ring
+from wagyu.ring_children import RingChildren
+from . import strategies
+
+
+@given(strategies.maybe_rings_lists, strategies.rings)
+def test_basic(rings_list: List[Optional[Ring]], ring: Ring) -> None:
+    children = RingChildren(rings_list)
+
+    children.add(ring)
+
+    assert children == (rings_list[:rings_list.index(None)] + [ring]
+                        + rings_list[rings_list.index(None) + 1:]
+                        if None in rings_list
+                        else rings_list + [ring])
+
+
+@given(strategies.maybe_rings_lists, strategies.rings)
+def test_after_discarding(rings_list: List[Optional[Ring]],
+                          ring: Ring) -> None:
+    children = RingChildren(rings_list)
+    for element in reversed(rings_list):
+        if element is not None:
+            children.discard(element)
+
+    children.add(ring)
+
+    assert children == ([ring] + [None] * (len(rings_list) - 1)
+                        if rings_list
+                        else [ring])
+
+
+@given(strategies.maybe_rings_lists, strategies.rings)
+def test_after_repeating(rings_list: List[Optional[Ring]],
+                         ring: Ring) -> None:
+    children = RingChildren(rings_list)
+    children.find(ring)
+    children *= 2
+
+    for _ in range(children.count(None)):
+        children.add(ring)
+
+    assert len(children) == 2 * len(rings_list)
+    assert None not in children
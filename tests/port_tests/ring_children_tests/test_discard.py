@@ -0,0 +1,25 @@
+from typing import (List,
+                    Optional)
+
+from hypothesis import given
+
+from wagyu.ring import Ring
+from wagyu.ring_children import RingChildren
+from wagyu.utils import find
+from . import strategies
+
+
+@given(strategies.maybe_rings_lists_with_repeats, strategies.rings)
+def test_basic(rings_list: List[Optional[Ring]], ring: Ring) -> None:
+    children = RingChildren(rings_list)
+
+    for element in rings_list:
+        if element is None:
+            continue
+        index = find(element, children)
+
+        children.discard(element)
+
+        assert index == len(children) or children[index] is None
+    children.discard(ring)
+    assert children == [None] * len(rings_list)
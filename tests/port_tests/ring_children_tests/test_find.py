@@ -0,0 +1,33 @@
+from typing import (List,
+                    Optional)
+
+from hypothesis import given
+
+from wagyu.ring import Ring
+from wagyu.ring_children import RingChildren
+from wagyu.utils import find
+from . import strategies
+
+
+@given(strategies.maybe_rings_lists_with_repeats, strategies.rings)
+def test_basic(rings_list: List[Optional[Ring]], ring: Ring) -> None:
+    children = RingChildren(rings_list)
+
+    assert all(children.find(element) == find(element, rings_list)
+               for element in rings_list
+               if element is not None)
+    assert children.find(ring) == len(children)
+
+
+@given(strategies.maybe_rings_lists_with_repeats)
+def test_after_tombstoning(rings_list: List[Optional[Ring]]) -> None:
+    children = RingChildren(rings_list)
+    for element in rings_list:
+        children.find(element)
+
+    for index, element in enumerate(rings_list):
+        children[index] = None
+
+        assert all(children.find(element) == find(element, children)
+                   for element in rings_list
+                   if element is not None)
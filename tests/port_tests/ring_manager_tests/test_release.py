@@ -0,0 +1,21 @@
+from hypothesis import given
+
+from wagyu.ring_manager import RingManager
+from . import strategies
+
+
+@given(strategies.ring_managers)
+def test_basic(ring_manager: RingManager) -> None:
+    rings = list(ring_manager.rings)
+    nodes = [node
+             for ring in rings
+             if ring.node is not None
+             for node in ring.node]
+
+    result = ring_manager.release()
+
+    assert result is None
+    assert ring_manager == RingManager(index=ring_manager.index)
+    assert all(ring.node is None and ring.parent is None and not ring.children
+               for ring in rings)
+    assert all(node.prev is node.next is node.ring is None for node in nodes)
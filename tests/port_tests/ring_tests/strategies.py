@@ -18,3 +18,5 @@ maybe_rings = to_maybe(strategies.deferred(lambda: rings))
 maybe_rings_lists = strategies.lists(maybe_rings)
 rings = strategies.builds(Ring, non_negative_integers, maybe_rings_lists,
                           points_lists, booleans)
+non_empty_rings_lists = strategies.lists(rings,
+                                         min_size=1)
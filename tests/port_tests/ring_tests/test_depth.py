@@ -0,0 +1,58 @@
+from typing import List
+
+from hypothesis import given
+
+from wagyu.ring import Ring
+from wagyu.ring_manager import RingManager
+from . import strategies
+from .utils import (link_rings,
+                    to_depth)
+
+
+@given(strategies.rings)
+def test_basic(ring: Ring) -> None:
+    assert ring.depth == 0
+
+
+@given(strategies.non_empty_rings_lists)
+def test_linked(rings: List[Ring]) -> None:
+    link_rings(rings)
+
+    assert all(ring.depth == to_depth(ring) for ring in rings)
+
+
+@given(strategies.non_empty_rings_lists, strategies.non_empty_rings_lists)
+def test_reparenting(rings: List[Ring], other_rings: List[Ring]) -> None:
+    link_rings(rings)
+    link_rings(other_rings)
+
+    rings[0].parent = other_rings[-1]
+
+    assert all(ring.depth == to_depth(ring) for ring in rings)
+
+
+@given(strategies.non_empty_rings_lists, strategies.non_empty_rings_lists)
+def test_removed(rings: List[Ring], other_rings: List[Ring]) -> None:
+    link_rings(rings)
+    link_rings(other_rings)
+    removed = rings[-1]
+    if removed.parent is not None:
+        removed.parent.children.discard(removed)
+    removed.node = None
+
+    rings[0].parent = other_rings[-1]
+
+    assert removed.depth == to_depth(removed)
+
+
+@given(strategies.non_empty_rings_lists, strategies.non_empty_rings_lists)
+def test_orphaned(rings: List[Ring], other_rings: List[Ring]) -> None:
+    link_rings(rings)
+    link_rings(other_rings)
+    manager = RingManager()
+    removed = rings[len(rings) // 2]
+    manager.remove_ring(removed, False, False)
+
+    rings[0].parent = other_rings[-1]
+
+    assert all(ring.depth == to_depth(ring) for ring in rings)
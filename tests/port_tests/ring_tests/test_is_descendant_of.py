@@ -0,0 +1,49 @@
+from typing import List
+
+from hypothesis import given
+
+from wagyu.ring import Ring
+from . import strategies
+from .utils import link_rings
+
+
+@given(strategies.rings, strategies.rings)
+def test_basic(ring: Ring, other: Ring) -> None:
+    assert not ring.is_descendant_of(other)
+
+
+@given(strategies.non_empty_rings_lists)
+def test_linked(rings: List[Ring]) -> None:
+    link_rings(rings)
+
+    assert all(rings[index].is_descendant_of(rings[other_index])
+               is (other_index < index)
+               for index in range(len(rings))
+               for other_index in range(len(rings)))
+
+
+@given(strategies.non_empty_rings_lists, strategies.non_empty_rings_lists)
+def test_reparenting(rings: List[Ring], other_rings: List[Ring]) -> None:
+    link_rings(rings)
+    link_rings(other_rings)
+
+    rings[0].parent = other_rings[-1]
+
+    assert all(ring.is_descendant_of(other_ring)
+               for ring in rings
+               for other_ring in other_rings)
+
+
+@given(strategies.non_empty_rings_lists, strategies.non_empty_rings_lists)
+def test_removed(rings: List[Ring], other_rings: List[Ring]) -> None:
+    link_rings(rings)
+    link_rings(other_rings)
+    removed = rings[-1]
+    if removed.parent is not None:
+        removed.parent.children.discard(removed)
+    removed.node = None
+
+    rings[0].parent = other_rings[-1]
+
+    assert all(removed.is_descendant_of(other_ring)
+               for other_ring in other_rings)
@@ -0,0 +1,18 @@
+from typing import List
+
+from wagyu.ring import Ring
+
+
+def link_rings(rings: List[Ring]) -> None:
+    for parent, child in zip(rings, rings[1:]):
+        parent.children.append(child)
+        child.parent = parent
+
+
+def to_depth(ring: Ring) -> int:
+    result = 0
+    cursor = ring.parent
+    while cursor is not None:
+        result += 1
+        cursor = cursor.parent
+    return result
@@ -0,0 +1,6 @@
+from hypothesis import strategies
+
+from tests.strategies import coordinates
+
+coordinates = coordinates
+coordinates_lists = strategies.lists(coordinates)
@@ -0,0 +1,19 @@
+from typing import List
+
+from hypothesis import given
+
+from wagyu.hints import Coordinate
+from wagyu.scanbeam import ScanbeamQueue
+from . import strategies
+
+
+@given(strategies.coordinates_lists)
+def test_basic(ys: List[Coordinate]) -> None:
+    scanbeams = ScanbeamQueue(ys)
+
+    result = []
+    while scanbeams:
+        result.append(scanbeams.pop())
+
+    assert result == sorted(ys,
+                            reverse=True)
@@ -0,0 +1,33 @@
+from bisect import bisect_left
+from typing import List
+
+from hypothesis import given
+
+from wagyu.hints import Coordinate
+from wagyu.scanbeam import ScanbeamQueue
+from . import strategies
+
+
+@given(strategies.coordinates_lists, strategies.coordinates_lists)
+def test_basic(ys: List[Coordinate], pushed_ys: List[Coordinate]) -> None:
+    scanbeams = ScanbeamQueue(ys)
+    sorted_ys = sorted(ys)
+
+    for y in pushed_ys:
+        scanbeams.push(y)
+        index = bisect_left(sorted_ys, y)
+        if index == len(sorted_ys) or y < sorted_ys[index]:
+            sorted_ys.insert(index, y)
+
+    assert list(scanbeams) == sorted_ys
+
+
+@given(strategies.coordinates_lists, strategies.coordinates)
+def test_idempotence(ys: List[Coordinate], y: Coordinate) -> None:
+    scanbeams = ScanbeamQueue(ys)
+
+    scanbeams.push(y)
+    result = list(scanbeams)
+    scanbeams.push(y)
+
+    assert list(scanbeams) == result
@@ -4,13 +4,17 @@ from typing import (List,
 from tests.utils import (RawPointsList,
                          RawPolygon,
                          enum_to_values)
+from wagyu.active_bounds import ActiveBounds as PortedActiveBounds
 from wagyu.bound import Bound as PortedBound
 from wagyu.box import Box as PortedBox
 from wagyu.edge import Edge as PortedEdge
 from wagyu.enums import (EdgeSide as PortedEdgeSide,
                          FillKind as PortedFillKind,
                          OperationKind as PortedOperationKind,
-                         PolygonKind as PortedPolygonKind)
+                         PolygonKind as PortedPolygonKind,
+                         SortingKind as PortedSortingKind)
+from wagyu.interrupt import (Interrupted as PortedInterrupted,
+                             Interrupter as PortedInterrupter)
 from wagyu.intersect_node import IntersectNode as PortedIntersectNode
 from wagyu.linear_ring import LinearRing as PortedLinearRing
 from wagyu.local_minimum import (LocalMinimum as PortedLocalMinimum,
@@ -20,14 +24,20 @@ from wagyu.polygon import (Multipolygon as PortedMultipolygon,
                            Polygon as PortedPolygon)
 from wagyu.ring import Ring as PortedRing
 from wagyu.ring_manager import RingManager as PortedRingManager
+from wagyu.scanbeam import ScanbeamQueue as PortedScanbeamQueue
+from wagyu.stats import ExecuteStats as PortedExecuteStats
 from wagyu.wagyu import Wagyu as PortedWagyu
 
+PortedActiveBounds = PortedActiveBounds
 PortedBound = PortedBound
 PortedBox = PortedBox
 PortedEdge = PortedEdge
 PortedEdgeSide = PortedEdgeSide
+PortedExecuteStats = PortedExecuteStats
 PortedFillKind = PortedFillKind
 PortedIntersectNode = PortedIntersectNode
+PortedInterrupted = PortedInterrupted
+PortedInterrupter = PortedInterrupter
 PortedLinearRing = PortedLinearRing
 PortedLinearRingWithPolygonKind = Tuple[PortedLinearRing, PortedPolygonKind]
 PortedLocalMinimum = PortedLocalMinimum
@@ -37,8 +47,10 @@ PortedOperationKind = PortedOperationKind
 PortedPoint = PortedPoint
 PortedPolygon = PortedPolygon
 PortedPolygonKind = PortedPolygonKind
+PortedSortingKind = PortedSortingKind
 PortedRing = PortedRing
 PortedRingManager = PortedRingManager
+PortedScanbeamQueue = PortedScanbeamQueue
 PortedWagyu = PortedWagyu
 
 ported_edges_sides = enum_to_values(PortedEdgeSide)
@@ -47,12 +59,20 @@ ported_operation_kinds = enum_to_values(PortedOperationKind)
 ported_polygon_kinds = enum_to_values(PortedPolygonKind)
 
 
+def to_ported_linear_ring(raw_points: RawPointsList) -> PortedLinearRing:
+    return PortedLinearRing(to_ported_linear_rings_points(raw_points))
+
+
 def to_ported_linear_rings_points(raw_points: RawPointsList
                                   ) -> List[PortedPoint]:
     points = [PortedPoint(x, y) for x, y in raw_points]
     return points + [points[0]]
 
 
+def to_ported_polygon(raw_polygon: RawPolygon) -> PortedPolygon:
+    return PortedPolygon(to_ported_polygon_linear_rings(raw_polygon))
+
+
 def to_ported_polygon_linear_rings(raw_polygon: RawPolygon
                                    ) -> List[PortedLinearRing]:
     raw_border, raw_holes = raw_polygon
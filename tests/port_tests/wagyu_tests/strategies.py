@@ -0,0 +1,15 @@
+from hypothesis import strategies
+from hypothesis_geometry import planar
+
+from tests.port_tests.utils import (ported_polygon_kinds,
+                                    to_ported_linear_ring)
+from tests.strategies import (coordinates,
+                              floats)
+
+integral_floats = coordinates.map(float)
+non_integral_floats = floats.filter(lambda value: not value.is_integer())
+integral_floats_linear_rings = (planar.contours(integral_floats)
+                                .map(to_ported_linear_ring))
+non_integral_floats_linear_rings = (planar.contours(non_integral_floats)
+                                    .map(to_ported_linear_ring))
+polygon_kinds = strategies.sampled_from(ported_polygon_kinds)
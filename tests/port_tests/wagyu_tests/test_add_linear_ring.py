@@ -0,0 +1,31 @@
+import pytest
+from hypothesis import given
+
+from tests.port_tests.utils import (PortedLinearRing,
+                                    PortedPolygonKind,
+                                    PortedWagyu)
+from . import strategies
+
+
+@given(strategies.integral_floats_linear_rings, strategies.polygon_kinds)
+def test_integer_coordinates(linear_ring: PortedLinearRing,
+                             polygon_kind: PortedPolygonKind) -> None:
+    wagyu = PortedWagyu(coordinate_kind=int)
+
+    wagyu.add_linear_ring(linear_ring, polygon_kind)
+
+    assert all(type(edge.bottom.x) is type(edge.bottom.y)
+               is type(edge.top.x) is type(edge.top.y) is int
+               for local_minimum in wagyu.minimums
+               for bound in (local_minimum.left_bound,
+                             local_minimum.right_bound)
+               for edge in bound.edges)
+
+
+@given(strategies.non_integral_floats_linear_rings, strategies.polygon_kinds)
+def test_non_integer_coordinates(linear_ring: PortedLinearRing,
+                                 polygon_kind: PortedPolygonKind) -> None:
+    wagyu = PortedWagyu(coordinate_kind=int)
+
+    with pytest.raises(ValueError):
+        wagyu.add_linear_ring(linear_ring, polygon_kind)
@@ -0,0 +1,159 @@
+from typing import (TYPE_CHECKING,
+                    Dict,
+                    Iterable,
+                    List,
+                    Optional,
+                    Union)
+
+from .enums import PolygonKind
+
+if TYPE_CHECKING:
+    from .bound import Bound
+
+
+class ActiveBounds(list):
+    """
+    List of active bounds with cached search of a bound
+    and of winding prefix information.
+
+    Insertions & deletions are still linear like for plain list.
+    Indices of assigned bounds are cached immediately,
+    indices of bounds shifted by insertions & deletions
+    are re-cached lazily on the next search,
+    so search is amortized constant only when mutations
+    mostly append or assign,
+    prefixes are recalculated lazily from the first changed index.
+    """
+    __slots__ = ('_indices', '_stale_index', '_kinds_last_indices',
+                 '_prefixes_size', '_winding_deltas_sums')
+
+    def __init__(self, bounds: Iterable[Optional['Bound']] = ()) -> None:
+        super().__init__(bounds)
+        # cached indices are keyed by bounds' identities
+        # and are valid for elements preceding the stale index
+        self._indices = {}  # type: Dict[int, int]
+        self._stale_index = 0
+        # prefix entry with index ``i`` describes elements preceding ``i``
+        self._kinds_last_indices = {
+            kind: [-1] for kind in PolygonKind
+        }  # type: Dict[PolygonKind, List[int]]
+        self._winding_deltas_sums = [0]  # type: List[int]
+        self._prefixes_size = 1
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        self._invalidate(index)
+        super().__delitem__(index)
+
+    def __repr__(self) -> str:
+        return '{}.{}({})'.format(type(self).__module__,
+                                  type(self).__qualname__,
+                                  super().__repr__())
+
+    def __setitem__(self,
+                    index: Union[int, slice],
+                    value: Optional['Bound']) -> None:
+        if isinstance(index, slice):
+            self._invalidate(index)
+            super().__setitem__(index, value)
+            return
+        super().__setitem__(index, value)
+        if index < 0:
+            index += len(self)
+        if value is not None:
+            self._indices[id(value)] = index
+        if self._prefixes_size > index + 1:
+            self._prefixes_size = index + 1
+
+    def clear(self) -> None:
+        self._invalidate(0)
+        super().clear()
+
+    def find(self, bound: 'Bound') -> int:
+        """
+        Equivalent of C++'s ``std::find`` for the active bound list.
+        """
+        index = self._to_cached_index(bound)
+        if index is None and self._stale_index < len(self):
+            indices = self._indices
+            for index in range(self._stale_index, len(self)):
+                element = self[index]
+                if element is not None:
+                    indices[id(element)] = index
+            self._stale_index = len(self)
+            index = self._to_cached_index(bound)
+        return len(self) if index is None else index
+
+    def find_previous_of_kind(self,
+                              index: int,
+                              polygon_kind: PolygonKind) -> int:
+        """
+        Returns index of the closest bound of given polygon kind
+        preceding given index or -1 if there is no such bound.
+        """
+        self._update_prefixes(index)
+        return self._kinds_last_indices[polygon_kind][index]
+
+    def insert(self, index: int, bound: Optional['Bound']) -> None:
+        self._invalidate(index)
+        super().insert(index, bound)
+
+    def pop(self, index: int = -1) -> Optional['Bound']:
+        self._invalidate(index)
+        return super().pop(index)
+
+    def remove(self, bound: Optional['Bound']) -> None:
+        self._invalidate(0)
+        super().remove(bound)
+
+    def reverse(self) -> None:
+        self._invalidate(0)
+        super().reverse()
+
+    def sort(self, *args, **kwargs) -> None:
+        self._invalidate(0)
+        super().sort(*args, **kwargs)
+
+    def winding_deltas_sum(self, start: int, stop: int) -> int:
+        """
+        Returns sum of winding deltas of bounds in given range of indices.
+        """
+        self._update_prefixes(stop)
+        return (self._winding_deltas_sums[stop]
+                - self._winding_deltas_sums[start])
+
+    def _invalidate(self, index: Union[int, slice]) -> None:
+        if isinstance(index, slice):
+            index = index.indices(len(self))[0] if index.step is None else 0
+        elif index < 0:
+            index = max(len(self) + index, 0)
+        self._stale_index = min(self._stale_index, index)
+        self._prefixes_size = min(self._prefixes_size, index + 1)
+
+    def _to_cached_index(self, bound: 'Bound') -> Optional[int]:
+        index = self._indices.get(id(bound))
+        return (index
+                if (index is not None and index < len(self)
+                    and self[index] is bound)
+                else None)
+
+    def _update_prefixes(self, stop: int) -> None:
+        size = self._prefixes_size
+        if size > stop:
+            return
+        kinds_last_indices = self._kinds_last_indices
+        winding_deltas_sums = self._winding_deltas_sums
+        for last_indices in kinds_last_indices.values():
+            del last_indices[size:]
+        del winding_deltas_sums[size:]
+        for index in range(size - 1, stop):
+            element = self[index]
+            for kind, last_indices in kinds_last_indices.items():
+                last_indices.append(index
+                                    if (element is not None
+                                        and element.polygon_kind is kind)
+                                    else last_indices[index])
+            winding_deltas_sums.append(winding_deltas_sums[index]
+                                       + (0
+                                          if element is None
+                                          else element.winding_delta))
+        self._prefixes_size = stop + 1
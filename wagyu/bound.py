@@ -1,24 +1,32 @@
-from functools import partial
-from typing import (List,
-                    Optional)
+import math
+from operator import attrgetter
+from typing import (Callable,
+                    List,
+                    MutableSequence,
+                    Optional,
+                    Sequence)
 
 from reprit.base import generate_repr
 
+from .active_bounds import ActiveBounds
+from .bubble_sort import bubble_sort
 from .edge import (Edge,
-                   are_edges_slopes_equal)
+                   EdgesArrays)
 from .enums import (EdgeSide,
                     FillKind,
                     OperationKind,
-                    PolygonKind)
+                    PolygonKind,
+                    SortingKind)
 from .hints import Coordinate
+from .merge_sort import merge_sort
+from .numeric import (are_floats_almost_equal,
+                      max_almost_equal_difference,
+                      to_int32)
 from .point import Point
 from .ring import Ring
-from .utils import (are_floats_almost_equal,
-                    are_floats_greater_than,
-                    are_floats_less_than,
-                    find_if,
-                    insort_unique,
-                    rotate_sequence)
+from .scanbeam import ScanbeamQueue
+from .utils import (are_floats_greater_than,
+                    are_floats_less_than)
 
 
 class Bound:
@@ -28,7 +36,7 @@ class Bound:
                  'polygon_kind', 'side', 'maximum_bound')
 
     def __init__(self,
-                 edges: Optional[List[Edge]] = None,
+                 edges: Optional[Sequence[Edge]] = None,
                  current_edge_index: Optional[int] = None,
                  next_edge_index: Optional[int] = None,
                  last_point: Optional[Point] = None,
@@ -40,7 +48,9 @@ class Bound:
                  winding_delta: int = 0,
                  polygon_kind: PolygonKind = PolygonKind.SUBJECT,
                  side: EdgeSide = EdgeSide.LEFT) -> None:
-        self.edges = edges or []
+        self.edges = (edges
+                      if isinstance(edges, EdgesArrays)
+                      else EdgesArrays(edges or ()))
         self._current_edge_index = (
             None
             if (current_edge_index is None
@@ -172,123 +182,152 @@ class Bound:
             return subject_fill_kind is FillKind.EVEN_ODD
 
     def is_intermediate(self, y: Coordinate) -> bool:
-        return (self.next_edge_index < len(self.edges)
-                and self.current_edge.top.y == y)
+        return (self._next_edge_index is not None
+                and self.edges.top_ys[self.current_edge_index] == y)
 
     def is_maxima(self, y: Coordinate) -> bool:
-        return (self.next_edge_index == len(self.edges)
-                and self.current_edge.top.y == y)
+        return (self._next_edge_index is None
+                and self.edges.top_ys[self.current_edge_index] == y)
 
     def fix_horizontals(self) -> None:
         edges = self.edges
         if len(edges) == 1:
             return
-        edge = edges[0]
-        next_edge_index = 1
-        next_edge = edges[next_edge_index]
-        if edge.is_horizontal and edge.top != next_edge.bottom:
-            edge.reverse_horizontal()
-        for next_edge_index in range(next_edge_index, len(edges)):
-            next_edge = edges[next_edge_index]
-            if next_edge.is_horizontal and edge.top != next_edge.bottom:
-                next_edge.reverse_horizontal()
-            edge = next_edge
+        bottom_xs, bottom_ys, top_xs, top_ys, slopes = (
+            edges.bottom_xs, edges.bottom_ys, edges.top_xs, edges.top_ys,
+            edges.slopes)
+        if math.isinf(slopes[0]) and (top_xs[0] != bottom_xs[1]
+                                      or top_ys[0] != bottom_ys[1]):
+            edges.reverse_horizontal(0)
+        for index in range(1, len(edges)):
+            if math.isinf(slopes[index]) and (
+                    top_xs[index - 1] != bottom_xs[index]
+                    or top_ys[index - 1] != bottom_ys[index]):
+                edges.reverse_horizontal(index)
 
     def move_horizontals(self, other: 'Bound') -> None:
         edges = self.edges
-        for index, edge in enumerate(edges):
-            if not edge.is_horizontal:
+        for index, slope in enumerate(edges.slopes):
+            if not math.isinf(slope):
                 break
-            edge.reverse_horizontal()
+            edges.reverse_horizontal(index)
         else:
             index = len(edges)
         if index:
             other_edges = other.edges
             other_edges.extend(edges[index - 1::-1])
             del edges[:index]
-            other_edges[:] = rotate_sequence(other_edges, -index)
+            other_edges.rotate(-index)
 
-    def to_next_edge(self, scanbeams: List[Coordinate]) -> None:
+    def to_next_edge(self, scanbeams: ScanbeamQueue) -> None:
         self.current_edge_index += 1
-        if self.current_edge_index < len(self.edges):
+        index = self._current_edge_index
+        if index is not None:
             self.next_edge_index += 1
-            self.current_x = self.current_edge.bottom.x
-            if not self.current_edge.is_horizontal:
-                insort_unique(scanbeams, self.current_edge.top.y)
-
-
-def create_bound_towards_maximum(edges: List[Edge]) -> Bound:
-    edges_iterator = iter(edges)
-    edge = next(edges_iterator)
-    edge_is_horizontal = edge.is_horizontal
+            edges = self.edges
+            self.current_x = edges.bottom_xs[index]
+            if not math.isinf(edges.slopes[index]):
+                scanbeams.push(edges.top_ys[index])
+
+
+def create_bound_towards_maximum(edges: MutableSequence[Edge]) -> Bound:
+    edges_arrays = (edges
+                    if isinstance(edges, EdgesArrays)
+                    else EdgesArrays(edges))
+    bottom_xs, bottom_ys, top_xs, top_ys, slopes = (
+        edges_arrays.bottom_xs, edges_arrays.bottom_ys, edges_arrays.top_xs,
+        edges_arrays.top_ys, edges_arrays.slopes)
+    if not slopes:
+        raise ValueError('Edges should not be empty.')
+    edge_is_horizontal = math.isinf(slopes[0])
     y_decreasing_before_last_horizontal = False
-    for next_edge_index, next_edge in enumerate(edges_iterator,
-                                                start=1):
-        next_edge_is_horizontal = next_edge.is_horizontal
+    for next_edge_index in range(1, len(slopes)):
+        edge_index = next_edge_index - 1
+        next_edge_is_horizontal = math.isinf(slopes[next_edge_index])
+        tops_coincide = (top_xs[edge_index] == top_xs[next_edge_index]
+                         and top_ys[edge_index] == top_ys[next_edge_index])
         if (not next_edge_is_horizontal and not edge_is_horizontal
-                and edge.top == next_edge.top):
+                and tops_coincide):
             break
         if not next_edge_is_horizontal and edge_is_horizontal:
             if (y_decreasing_before_last_horizontal
-                    and (next_edge.top == edge.bottom
-                         or next_edge.top == edge.top)):
+                    and ((top_xs[next_edge_index] == bottom_xs[edge_index]
+                          and top_ys[next_edge_index] == bottom_ys[edge_index])
+                         or tops_coincide)):
                 break
         elif (not y_decreasing_before_last_horizontal
               and not edge_is_horizontal and next_edge_is_horizontal
-              and (edge.top == next_edge.top or edge.top == next_edge.bottom)):
+              and (tops_coincide
+                   or (top_xs[edge_index] == bottom_xs[next_edge_index]
+                       and top_ys[edge_index] == bottom_ys[next_edge_index]))):
             y_decreasing_before_last_horizontal = True
-        edge, edge_is_horizontal = next_edge, next_edge_is_horizontal
-        next_edge_index += 1
+        edge_is_horizontal = next_edge_is_horizontal
     else:
-        next_edge_index = len(edges)
-    result = Bound(edges[:next_edge_index])
+        next_edge_index = len(slopes)
+    result = Bound(edges_arrays[:next_edge_index])
     del edges[:next_edge_index]
     return result
 
 
-def create_bound_towards_minimum(edges: List[Edge]) -> Bound:
-    edges_iterator = iter(edges)
-    edge = next(edges_iterator)
-    edge_is_horizontal = edge.is_horizontal
+def create_bound_towards_minimum(edges: MutableSequence[Edge]) -> Bound:
+    edges_arrays = (edges
+                    if isinstance(edges, EdgesArrays)
+                    else EdgesArrays(edges))
+    bottom_xs, bottom_ys, top_xs, top_ys, slopes = (
+        edges_arrays.bottom_xs, edges_arrays.bottom_ys, edges_arrays.top_xs,
+        edges_arrays.top_ys, edges_arrays.slopes)
+    if not slopes:
+        raise ValueError('Edges should not be empty.')
+    edge_is_horizontal = math.isinf(slopes[0])
     if edge_is_horizontal:
-        edge.reverse_horizontal()
+        edges_arrays.reverse_horizontal(0)
     y_increasing_before_last_horizontal = False
-    for next_edge_index, next_edge in enumerate(edges_iterator,
-                                                start=1):
-        next_edge_is_horizontal = next_edge.is_horizontal
+    for next_edge_index in range(1, len(slopes)):
+        edge_index = next_edge_index - 1
+        next_edge_is_horizontal = math.isinf(slopes[next_edge_index])
+        bottoms_coincide = (
+                bottom_xs[edge_index] == bottom_xs[next_edge_index]
+                and bottom_ys[edge_index] == bottom_ys[next_edge_index])
         if (not next_edge_is_horizontal and not edge_is_horizontal
-                and edge.bottom == next_edge.bottom):
+                and bottoms_coincide):
             break
         if not next_edge_is_horizontal and edge_is_horizontal:
             if (y_increasing_before_last_horizontal
-                    and (next_edge.bottom == edge.bottom
-                         or next_edge.bottom == edge.top)):
+                    and (bottoms_coincide
+                         or (bottom_xs[next_edge_index] == top_xs[edge_index]
+                             and (bottom_ys[next_edge_index]
+                                  == top_ys[edge_index])))):
                 break
         elif (not y_increasing_before_last_horizontal
               and not edge_is_horizontal and next_edge_is_horizontal
-              and (edge.bottom == next_edge.top
-                   or edge.bottom == next_edge.bottom)):
+              and ((bottom_xs[edge_index] == top_xs[next_edge_index]
+                    and bottom_ys[edge_index] == top_ys[next_edge_index])
+                   or bottoms_coincide)):
             y_increasing_before_last_horizontal = True
-        edge_is_horizontal, edge = next_edge_is_horizontal, next_edge
+        edge_is_horizontal = next_edge_is_horizontal
         if edge_is_horizontal:
-            edge.reverse_horizontal()
+            edges_arrays.reverse_horizontal(next_edge_index)
     else:
-        next_edge_index = len(edges)
-    result = Bound(edges[next_edge_index - 1::-1])
+        next_edge_index = len(slopes)
+    result = Bound(edges_arrays[next_edge_index - 1::-1])
     del edges[:next_edge_index]
     return result
 
 
 def bound_insert_location(left: Bound, right: Bound) -> bool:
     if are_floats_almost_equal(left.current_x, right.current_x):
-        if left.current_edge.top.y > right.current_edge.top.y:
-            return are_floats_less_than(float(left.current_edge.top.x),
-                                        right.current_edge.get_current_x(
-                                                left.current_edge.top.y))
+        left_edges, left_index = left.edges, left.current_edge_index
+        right_edges, right_index = right.edges, right.current_edge_index
+        left_top_y, right_top_y = (left_edges.top_ys[left_index],
+                                   right_edges.top_ys[right_index])
+        if left_top_y > right_top_y:
+            return are_floats_less_than(
+                    float(left_edges.top_xs[left_index]),
+                    right_edges.get_current_x(right_index, left_top_y))
         else:
-            return are_floats_greater_than(float(right.current_edge.top.x),
-                                           left.current_edge.get_current_x(
-                                                   right.current_edge.top.y))
+            return are_floats_greater_than(
+                    float(right_edges.top_xs[right_index]),
+                    left_edges.get_current_x(left_index, right_top_y))
     else:
         return left.current_x < right.current_x
 
@@ -296,19 +335,50 @@ def bound_insert_location(left: Bound, right: Bound) -> bool:
 def insert_bound_into_abl(left: Bound,
                           right: Bound,
                           active_bounds: List[Bound]) -> int:
-    index = find_if(partial(bound_insert_location, left),
-                    active_bounds)
+    # equivalent of ``find_if`` with ``bound_insert_location`` predicate
+    # which skips the costly almost equality check for distant bounds
+    current_x = left.current_x
+    max_difference = max_almost_equal_difference(current_x)
+    for index, bound in enumerate(active_bounds):
+        difference = bound.current_x - current_x
+        if difference < -max_difference:
+            continue
+        elif (difference > max_difference
+              or bound_insert_location(left, bound)):
+            break
+    else:
+        index = len(active_bounds)
     active_bounds.insert(index, right)
     active_bounds.insert(index, left)
     return index
 
 
 def intersection_compare(left: Bound, right: Bound) -> bool:
-    return (left.current_x <= right.current_x
-            or are_edges_slopes_equal(left.current_edge, right.current_edge))
-
-
-def set_winding_count(bound_index: int, active_bounds: List[Bound],
+    if left.current_x <= right.current_x:
+        return True
+    left_edges, left_index = left.edges, left.current_edge_index
+    right_edges, right_index = right.edges, right.current_edge_index
+    # same as ``are_edges_slopes_equal`` for current edges
+    return ((left_edges.top_ys[left_index] - left_edges.bottom_ys[left_index])
+            * (right_edges.top_xs[right_index]
+               - right_edges.bottom_xs[right_index])
+            == ((left_edges.top_xs[left_index]
+                 - left_edges.bottom_xs[left_index])
+                * (right_edges.top_ys[right_index]
+                   - right_edges.bottom_ys[right_index])))
+
+
+def sort_intersecting_bounds(bounds: List[Bound],
+                             on_swap: Callable[[Bound, Bound], None],
+                             sorting_kind: SortingKind = SortingKind.BUBBLE
+                             ) -> List[Bound]:
+    return (bubble_sort(bounds, intersection_compare, on_swap)
+            if sorting_kind is SortingKind.BUBBLE
+            else merge_sort(bounds, intersection_compare, on_swap,
+                            attrgetter('current_x')))
+
+
+def set_winding_count(bound_index: int, active_bounds: ActiveBounds,
                       subject_fill_kind: FillKind, clip_fill_kind: FillKind
                       ) -> None:
     bound = active_bounds[bound_index]
@@ -318,11 +388,8 @@ def set_winding_count(bound_index: int, active_bounds: List[Bound],
         return
     # find the edge of the same polygon kind that immediately precedes 'edge'
     # in AEL
-    reversed_bound_index = bound_index - 1
-    while (reversed_bound_index >= 0
-           and (active_bounds[reversed_bound_index].polygon_kind
-                is not bound.polygon_kind)):
-        reversed_bound_index -= 1
+    reversed_bound_index = active_bounds.find_previous_of_kind(
+            bound_index, bound.polygon_kind)
     if reversed_bound_index == -1:
         bound.winding_count = bound.winding_delta
         bound.opposite_winding_count = 0
@@ -345,8 +412,9 @@ def set_winding_count(bound_index: int, active_bounds: List[Bound],
                     bound.winding_count = reversed_bound.winding_count
                 else:
                     # otherwise continue to 'decrease' winding count
-                    bound.winding_count = (reversed_bound.winding_count
-                                           + bound.winding_delta)
+                    bound.winding_count = to_int32(
+                            reversed_bound.winding_count
+                            + bound.winding_delta)
             else:
                 # now outside all polygons of same polygon kind
                 # so set own winding count
@@ -360,18 +428,23 @@ def set_winding_count(bound_index: int, active_bounds: List[Bound],
                 bound.winding_count = reversed_bound.winding_count
             else:
                 # otherwise add to winding count
-                bound.winding_count = (reversed_bound.winding_count
-                                       + bound.winding_delta)
+                bound.winding_count = to_int32(reversed_bound.winding_count
+                                               + bound.winding_delta)
         bound.opposite_winding_count = reversed_bound.opposite_winding_count
-    # update opposite winding count
+    # update opposite winding count,
+    # all bounds in between are of the opposite polygon kind
     forward_bound_index = reversed_bound_index + 1
-    if bound.is_even_odd_alt_fill_kind(subject_fill_kind, clip_fill_kind):
-        # even-odd filling
-        for forward_bound_index in range(forward_bound_index, bound_index):
-            bound.opposite_winding_count = int(
-                    not bound.opposite_winding_count)
+    if forward_bound_index == bound_index:
+        return
+    elif bound.is_even_odd_alt_fill_kind(subject_fill_kind, clip_fill_kind):
+        # even-odd filling, toggling for each bound in between
+        bound.opposite_winding_count = (
+            int(not bound.opposite_winding_count)
+            if (bound_index - forward_bound_index) % 2
+            else int(bool(bound.opposite_winding_count)))
     else:
         # non-zero, positive or negative filling
-        for forward_bound_index in range(forward_bound_index, bound_index):
-            bound.opposite_winding_count += (active_bounds[forward_bound_index]
-                                             .winding_delta)
+        bound.opposite_winding_count = to_int32(
+                bound.opposite_winding_count
+                + active_bounds.winding_deltas_sum(forward_bound_index,
+                                                   bound_index))
@@ -1,9 +1,15 @@
 import math
-from typing import Optional
+from array import array
+from collections import abc
+from typing import (Iterable,
+                    Optional,
+                    Union)
 
 from reprit.base import generate_repr
 
 from .hints import Coordinate
+from .numeric import (INT64_MAX,
+                      INT64_MIN)
 from .point import Point
 from .utils import (round_towards_max,
                     round_towards_min)
@@ -22,23 +28,10 @@ class Edge:
     __repr__ = generate_repr(__init__)
 
     def __and__(self, other: 'Edge') -> Optional[Point]:
-        delta_x = self.top.x - self.bottom.x
-        delta_y = self.top.y - self.bottom.y
-        other_delta_x = other.top.x - other.bottom.x
-        other_delta_y = other.top.y - other.bottom.y
-        denominator = delta_x * other_delta_y - other_delta_x * delta_y
-        if not denominator:
-            return None
-        s = ((-delta_y * (self.bottom.x - other.bottom.x)
-              + delta_x * (self.bottom.y - other.bottom.y))
-             / denominator)
-        t = ((other_delta_x * (self.bottom.y - other.bottom.y)
-              - other_delta_y * (self.bottom.x - other.bottom.x))
-             / denominator)
-        return (Point(self.bottom.x + (t * delta_x),
-                      self.bottom.y + (t * delta_y))
-                if 0. <= s <= 1. and 0. <= t <= 1.
-                else None)
+        return to_edges_intersection(self.bottom.x, self.bottom.y,
+                                     self.top.x, self.top.y,
+                                     other.bottom.x, other.bottom.y,
+                                     other.top.x, other.top.y)
 
     def __eq__(self, other: 'Edge') -> bool:
         return (self.top == other.top and self.bottom == other.bottom
@@ -50,44 +43,16 @@ class Edge:
         return math.isinf(self.slope)
 
     def get_current_x(self, current_y: Coordinate) -> Coordinate:
-        return float(
-                self.top.x
-                if current_y == self.top.y
-                else self.bottom.x + self.slope * (current_y - self.bottom.y))
+        return to_current_x(self.bottom.x, self.bottom.y, self.top.x,
+                            self.top.y, self.slope, current_y)
 
     def get_min_x(self, current_y: Coordinate) -> Coordinate:
-        if self.is_horizontal:
-            return min(self.bottom.x, self.top.x)
-        elif self.slope > 0:
-            if current_y == self.top.y:
-                return self.top.x
-            else:
-                lower_range_y = current_y - self.bottom.y - 0.5
-                return round_towards_min(self.bottom.x
-                                         + self.slope * lower_range_y)
-        elif current_y == self.bottom.y:
-            return self.bottom.x
-        else:
-            lower_range_y = current_y - self.bottom.y + 0.5
-            return round_towards_min(self.bottom.x
-                                     + self.slope * lower_range_y)
+        return to_min_x(self.bottom.x, self.bottom.y, self.top.x, self.top.y,
+                        self.slope, current_y)
 
     def get_max_x(self, current_y: Coordinate) -> Coordinate:
-        if self.is_horizontal:
-            return max(self.bottom.x, self.top.x)
-        elif self.slope < 0:
-            if current_y == self.top.y:
-                return self.top.x
-            else:
-                lower_range_y = current_y - self.bottom.y - 0.5
-                return round_towards_max(self.bottom.x
-                                         + self.slope * lower_range_y)
-        elif current_y == self.bottom.y:
-            return self.bottom.x
-        else:
-            lower_range_y = current_y - self.bottom.y + 0.5
-            return round_towards_max(self.bottom.x
-                                     + self.slope * lower_range_y)
+        return to_max_x(self.bottom.x, self.bottom.y, self.top.x, self.top.y,
+                        self.slope, current_y)
 
     def reverse_horizontal(self) -> None:
         self.top, self.bottom = (Point(self.bottom.x, self.top.y),
@@ -98,3 +63,255 @@ def are_edges_slopes_equal(first: Edge, second: Edge) -> bool:
     return ((first.top.y - first.bottom.y) * (second.top.x - second.bottom.x)
             == ((first.top.x - first.bottom.x)
                 * (second.top.y - second.bottom.y)))
+
+
+class EdgesArrays(abc.MutableSequence):
+    """
+    Sequence of edges stored as parallel arrays of endpoints coordinates
+    and slopes.
+
+    Coordinates are stored as 64-bit integers while all of them are,
+    and as doubles otherwise.
+    """
+    __slots__ = 'bottom_xs', 'bottom_ys', 'top_xs', 'top_ys', 'slopes'
+
+    def __init__(self, edges: Iterable[Edge] = ()) -> None:
+        edges = list(edges)
+        typecode = to_coordinates_typecode(
+                coordinate
+                for edge in edges
+                for coordinate in (edge.bottom.x, edge.bottom.y,
+                                   edge.top.x, edge.top.y))
+        self.bottom_xs = array(typecode, [edge.bottom.x for edge in edges])
+        self.bottom_ys = array(typecode, [edge.bottom.y for edge in edges])
+        self.top_xs = array(typecode, [edge.top.x for edge in edges])
+        self.top_ys = array(typecode, [edge.top.y for edge in edges])
+        self.slopes = array('d', [edge.slope for edge in edges])
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        del (self.bottom_xs[index], self.bottom_ys[index], self.top_xs[index],
+             self.top_ys[index], self.slopes[index])
+
+    def __eq__(self, other: 'EdgesArrays') -> bool:
+        return (self.bottom_xs == other.bottom_xs
+                and self.bottom_ys == other.bottom_ys
+                and self.top_xs == other.top_xs
+                and self.top_ys == other.top_ys
+                if isinstance(other, EdgesArrays)
+                else NotImplemented)
+
+    def __getitem__(self, index: Union[int, slice]
+                    ) -> Union[Edge, 'EdgesArrays']:
+        if isinstance(index, slice):
+            result = EdgesArrays()
+            result.bottom_xs, result.bottom_ys = (self.bottom_xs[index],
+                                                  self.bottom_ys[index])
+            result.top_xs, result.top_ys = (self.top_xs[index],
+                                            self.top_ys[index])
+            result.slopes = self.slopes[index]
+            return result
+        # returned edge is a detached copy which is costly to build,
+        # so hot paths should index arrays directly instead,
+        # endpoints are already ordered, so skipping ``Edge.__init__``
+        result = Edge.__new__(Edge)
+        result.bottom = Point(self.bottom_xs[index], self.bottom_ys[index])
+        result.top = Point(self.top_xs[index], self.top_ys[index])
+        result.slope = self.slopes[index]
+        return result
+
+    def __len__(self) -> int:
+        return len(self.slopes)
+
+    def __repr__(self) -> str:
+        return '{}.{}({!r})'.format(type(self).__module__,
+                                    type(self).__qualname__, list(self))
+
+    def __setitem__(self, index: int, edge: Edge) -> None:
+        self._ensure_coordinates_fit(edge)
+        self.bottom_xs[index], self.bottom_ys[index] = (edge.bottom.x,
+                                                        edge.bottom.y)
+        self.top_xs[index], self.top_ys[index] = edge.top.x, edge.top.y
+        self.slopes[index] = edge.slope
+
+    def extend(self, edges: Iterable[Edge]) -> None:
+        if not isinstance(edges, EdgesArrays):
+            edges = EdgesArrays(edges)
+        if self.bottom_xs.typecode != edges.bottom_xs.typecode:
+            self._to_floating_coordinates()
+            edges = edges[:]
+            edges._to_floating_coordinates()
+        self.bottom_xs.extend(edges.bottom_xs)
+        self.bottom_ys.extend(edges.bottom_ys)
+        self.top_xs.extend(edges.top_xs)
+        self.top_ys.extend(edges.top_ys)
+        self.slopes.extend(edges.slopes)
+
+    def get_current_x(self, index: int, current_y: Coordinate) -> Coordinate:
+        """
+        Equivalent of ``Edge.get_current_x`` for the edge with given index.
+        """
+        return to_current_x(self.bottom_xs[index], self.bottom_ys[index],
+                            self.top_xs[index], self.top_ys[index],
+                            self.slopes[index], current_y)
+
+    def get_bottom(self, index: int) -> Point:
+        return Point(self.bottom_xs[index], self.bottom_ys[index])
+
+    def get_max_x(self, index: int, current_y: Coordinate) -> Coordinate:
+        """
+        Equivalent of ``Edge.get_max_x`` for the edge with given index.
+        """
+        return to_max_x(self.bottom_xs[index], self.bottom_ys[index],
+                        self.top_xs[index], self.top_ys[index],
+                        self.slopes[index], current_y)
+
+    def get_min_x(self, index: int, current_y: Coordinate) -> Coordinate:
+        """
+        Equivalent of ``Edge.get_min_x`` for the edge with given index.
+        """
+        return to_min_x(self.bottom_xs[index], self.bottom_ys[index],
+                        self.top_xs[index], self.top_ys[index],
+                        self.slopes[index], current_y)
+
+    def get_top(self, index: int) -> Point:
+        return Point(self.top_xs[index], self.top_ys[index])
+
+    def insert(self, index: int, edge: Edge) -> None:
+        self._ensure_coordinates_fit(edge)
+        self.bottom_xs.insert(index, edge.bottom.x)
+        self.bottom_ys.insert(index, edge.bottom.y)
+        self.top_xs.insert(index, edge.top.x)
+        self.top_ys.insert(index, edge.top.y)
+        self.slopes.insert(index, edge.slope)
+
+    def is_horizontal(self, index: int) -> bool:
+        return math.isinf(self.slopes[index])
+
+    def intersect(self,
+                  index: int,
+                  other: 'EdgesArrays',
+                  other_index: int) -> Optional[Point]:
+        """
+        Equivalent of ``Edge.__and__`` for edges with given indices.
+        """
+        return to_edges_intersection(
+                self.bottom_xs[index], self.bottom_ys[index],
+                self.top_xs[index], self.top_ys[index],
+                other.bottom_xs[other_index], other.bottom_ys[other_index],
+                other.top_xs[other_index], other.top_ys[other_index])
+
+    def reverse_horizontal(self, index: int) -> None:
+        """
+        Equivalent of ``Edge.reverse_horizontal`` for the edge
+        with given index.
+        """
+        self.bottom_xs[index], self.top_xs[index] = (self.top_xs[index],
+                                                     self.bottom_xs[index])
+
+    def rotate(self, offset: int) -> None:
+        """
+        Rotates edges in place like ``utils.rotate_sequence`` does.
+        """
+        if 0 < abs(offset) < len(self):
+            for name in self.__slots__:
+                values = getattr(self, name)
+                setattr(self, name, values[offset:] + values[:offset])
+
+    def _ensure_coordinates_fit(self, edge: Edge) -> None:
+        if (self.bottom_xs.typecode != 'd'
+                and to_coordinates_typecode((edge.bottom.x, edge.bottom.y,
+                                             edge.top.x, edge.top.y)) == 'd'):
+            self._to_floating_coordinates()
+
+    def _to_floating_coordinates(self) -> None:
+        self.bottom_xs, self.bottom_ys = (array('d', self.bottom_xs),
+                                          array('d', self.bottom_ys))
+        self.top_xs, self.top_ys = (array('d', self.top_xs),
+                                    array('d', self.top_ys))
+
+
+def to_coordinates_typecode(coordinates: Iterable[Coordinate]) -> str:
+    return ('q'
+            if all(type(coordinate) is int
+                   and INT64_MIN <= coordinate <= INT64_MAX
+                   for coordinate in coordinates)
+            else 'd')
+
+
+def to_current_x(bottom_x: Coordinate,
+                 bottom_y: Coordinate,
+                 top_x: Coordinate,
+                 top_y: Coordinate,
+                 slope: float,
+                 current_y: Coordinate) -> Coordinate:
+    return float(top_x
+                 if current_y == top_y
+                 else bottom_x + slope * (current_y - bottom_y))
+
+
+def to_edges_intersection(bottom_x: Coordinate,
+                          bottom_y: Coordinate,
+                          top_x: Coordinate,
+                          top_y: Coordinate,
+                          other_bottom_x: Coordinate,
+                          other_bottom_y: Coordinate,
+                          other_top_x: Coordinate,
+                          other_top_y: Coordinate) -> Optional[Point]:
+    delta_x = top_x - bottom_x
+    delta_y = top_y - bottom_y
+    other_delta_x = other_top_x - other_bottom_x
+    other_delta_y = other_top_y - other_bottom_y
+    denominator = delta_x * other_delta_y - other_delta_x * delta_y
+    if not denominator:
+        return None
+    s = ((-delta_y * (bottom_x - other_bottom_x)
+          + delta_x * (bottom_y - other_bottom_y))
+         / denominator)
+    t = ((other_delta_x * (bottom_y - other_bottom_y)
+          - other_delta_y * (bottom_x - other_bottom_x))
+         / denominator)
+    return (Point(bottom_x + (t * delta_x), bottom_y + (t * delta_y))
+            if 0. <= s <= 1. and 0. <= t <= 1.
+            else None)
+
+
+def to_max_x(bottom_x: Coordinate,
+             bottom_y: Coordinate,
+             top_x: Coordinate,
+             top_y: Coordinate,
+             slope: float,
+             current_y: Coordinate) -> Coordinate:
+    if math.isinf(slope):
+        return max(bottom_x, top_x)
+    elif slope < 0:
+        if current_y == top_y:
+            return top_x
+        else:
+            lower_range_y = current_y - bottom_y - 0.5
+            return round_towards_max(bottom_x + slope * lower_range_y)
+    elif current_y == bottom_y:
+        return bottom_x
+    else:
+        lower_range_y = current_y - bottom_y + 0.5
+        return round_towards_max(bottom_x + slope * lower_range_y)
+
+
+def to_min_x(bottom_x: Coordinate,
+             bottom_y: Coordinate,
+             top_x: Coordinate,
+             top_y: Coordinate,
+             slope: float,
+             current_y: Coordinate) -> Coordinate:
+    if math.isinf(slope):
+        return min(bottom_x, top_x)
+    elif slope > 0:
+        if current_y == top_y:
+            return top_x
+        else:
+            lower_range_y = current_y - bottom_y - 0.5
+            return round_towards_min(bottom_x + slope * lower_range_y)
+    elif current_y == bottom_y:
+        return bottom_x
+    else:
+        lower_range_y = current_y - bottom_y + 0.5
+        return round_towards_min(bottom_x + slope * lower_range_y)
@@ -29,6 +29,12 @@ class OperationKind(Base):
     XOR = 3
 
 
+@unique
+class SortingKind(Base):
+    BUBBLE = 0
+    MERGE = 1
+
+
 @unique
 class PolygonKind(Base):
     SUBJECT = 0
@@ -1,5 +1,8 @@
+from array import array
 from numbers import Real
-from typing import TypeVar
+from typing import (Tuple,
+                    TypeVar)
 
 Coordinate = Real
 Domain = TypeVar('Domain')
+MultipolygonArrays = Tuple[array, array, array]
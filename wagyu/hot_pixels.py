@@ -0,0 +1,57 @@
+from bisect import (bisect_left,
+                    bisect_right)
+from typing import (Iterator,
+                    List,
+                    Tuple)
+
+from .hints import Coordinate
+from .point import Point
+
+
+class HotPixelsIndex:
+    """
+    Index of sorted hot pixels by rows.
+
+    Hot pixels are expected to be sorted by ordinates in descending order
+    and then by abscissas in ascending order,
+    so each row is a contiguous range of bisectable abscissas.
+    """
+    __slots__ = '_hot_pixels', '_size', '_keys', '_starts', '_xs'
+
+    def __init__(self, hot_pixels: List[Point]) -> None:
+        self._hot_pixels = hot_pixels
+        self._size = len(hot_pixels)
+        # rows' ordinates are negated to be bisectable in ascending order
+        self._keys = []  # type: List[Coordinate]
+        self._starts = []  # type: List[int]
+        self._xs = [hot_pixel.x for hot_pixel in hot_pixels]
+        for index, hot_pixel in enumerate(hot_pixels):
+            if not self._keys or self._keys[-1] != -hot_pixel.y:
+                self._keys.append(-hot_pixel.y)
+                self._starts.append(index)
+        self._starts.append(len(hot_pixels))
+
+    def indexes(self, hot_pixels: List[Point]) -> bool:
+        """
+        Checks if index is up to date with given hot pixels.
+        """
+        return hot_pixels is self._hot_pixels and len(hot_pixels) == self._size
+
+    def rows(self,
+             max_y: Coordinate,
+             min_y: Coordinate,
+             min_x: Coordinate,
+             max_x: Coordinate) -> Iterator[Tuple[Coordinate, int, int]]:
+        """
+        Returns iterator over ordinates with ranges of indices
+        of hot pixels lying in given box row by row
+        from the top row to the bottom one.
+        """
+        keys, starts, xs = self._keys, self._starts, self._xs
+        for row_index in range(bisect_left(keys, -max_y),
+                               bisect_right(keys, -min_y)):
+            row_start, row_stop = starts[row_index], starts[row_index + 1]
+            start = bisect_left(xs, min_x, row_start, row_stop)
+            stop = bisect_right(xs, max_x, start, row_stop)
+            if start < stop:
+                yield self._hot_pixels[row_start].y, start, stop
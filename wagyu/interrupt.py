@@ -0,0 +1,37 @@
+import time
+from typing import Optional
+
+from reprit.base import generate_repr
+
+
+class Interrupted(RuntimeError):
+    pass
+
+
+class Interrupter:
+    __slots__ = 'deadline', 'requested'
+
+    def __init__(self,
+                 deadline: Optional[float] = None,
+                 requested: bool = False) -> None:
+        self.deadline = deadline
+        self.requested = requested
+
+    __repr__ = generate_repr(__init__)
+
+    @classmethod
+    def from_timeout(cls, timeout: float) -> 'Interrupter':
+        return cls(time.monotonic() + timeout)
+
+    def check(self) -> None:
+        if self.requested or (self.deadline is not None
+                              and time.monotonic() >= self.deadline):
+            raise Interrupted('Wagyu interrupted')
+
+    def request(self) -> None:
+        self.requested = True
+
+
+def interrupt_check(interrupter: Optional[Interrupter]) -> None:
+    if interrupter is not None:
+        interrupter.check()
@@ -1,14 +1,14 @@
-import ctypes
 from typing import (List,
                     Tuple)
 
 from reprit.base import generate_repr
 
 from .bound import (Bound,
-                    intersection_compare)
-from .bubble_sort import bubble_sort
+                    sort_intersecting_bounds)
+from .enums import SortingKind
+from .numeric import (are_floats_almost_equal,
+                      to_int32)
 from .point import Point
-from .utils import are_floats_almost_equal
 
 
 class IntersectNode:
@@ -44,20 +44,19 @@ class IntersectNode:
         return self.first_bound is bound or self.second_bound is bound
 
 
-def to_int32(value: int) -> int:
-    return ctypes.c_int32(value).value
-
-
-def build_intersect_list(active_bounds: List[Bound]
+def build_intersect_list(active_bounds: List[Bound],
+                         sorting_kind: SortingKind = SortingKind.BUBBLE
                          ) -> Tuple[List[Bound], List[IntersectNode]]:
     intersections = []
 
     def on_swap(left: Bound, right: Bound) -> None:
-        intersection = left.current_edge & right.current_edge
+        intersection = left.edges.intersect(left.current_edge_index,
+                                            right.edges,
+                                            right.current_edge_index)
         if intersection is None:
             raise RuntimeError('Trying to find intersection of lines '
                                'that do not intersect')
         intersections.append(IntersectNode(left, right, intersection))
 
-    return (bubble_sort(active_bounds, intersection_compare, on_swap),
+    return (sort_intersecting_bounds(active_bounds, on_swap, sorting_kind),
             intersections)
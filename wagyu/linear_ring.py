@@ -1,5 +1,6 @@
 from collections import abc
-from typing import List
+from typing import (Any,
+                    List)
 
 from reprit.base import generate_repr
 
@@ -29,6 +30,17 @@ class LinearRing(abc.Sequence):
     def __len__(self) -> int:
         return len(self.points)
 
+    @classmethod
+    def from_array(cls, array: Any) -> 'LinearRing':
+        view = memoryview(array)
+        if view.ndim == 2 and view.shape[1] == 2:
+            return cls([Point(x, y) for x, y in view.tolist()])
+        elif view.ndim == 1 and not view.shape[0] % 2:
+            coordinates = iter(view.tolist())
+            return cls([Point(x, y) for x, y in zip(coordinates, coordinates)])
+        raise ValueError('Array should have shape (N, 2) or (2 * N,), '
+                         'but found {}.'.format(view.shape))
+
     @property
     def edges(self) -> List[Edge]:
         result = []  # type: List[Edge]
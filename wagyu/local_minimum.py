@@ -7,7 +7,8 @@ from reprit.base import generate_repr
 from .bound import (Bound,
                     create_bound_towards_maximum,
                     create_bound_towards_minimum)
-from .edge import Edge
+from .edge import (Edge,
+                   EdgesArrays)
 from .enums import (EdgeSide,
                     PolygonKind)
 from .hints import Coordinate
@@ -49,7 +50,7 @@ class LocalMinimum:
         if left_bound.edges:
             left_bound.current_edge_index = 0
             left_bound.next_edge_index = 1
-            left_bound.current_x = float(left_bound.current_edge.bottom.x)
+            left_bound.current_x = float(left_bound.edges.bottom_xs[0])
             left_bound.winding_count = left_bound.opposite_winding_count = 0
             left_bound.side = EdgeSide.LEFT
             left_bound.ring = None
@@ -57,7 +58,7 @@ class LocalMinimum:
         if right_bound.edges:
             right_bound.current_edge_index = 0
             right_bound.next_edge_index = 1
-            right_bound.current_x = float(right_bound.current_edge.bottom.x)
+            right_bound.current_x = float(right_bound.edges.bottom_xs[0])
             right_bound.winding_count = right_bound.opposite_winding_count = 0
             right_bound.side = EdgeSide.RIGHT
             right_bound.ring = None
@@ -98,7 +99,7 @@ class LocalMinimumList(abc.MutableSequence):
         edges = linear_ring.edges
         if not edges:
             return False
-        edges = to_edges_starting_on_local_maximum(edges)
+        edges = EdgesArrays(to_edges_starting_on_local_maximum(edges))
         first_minimum = last_maximum = None  # type: Optional[Bound]
         while edges:
             to_minimum = create_bound_towards_minimum(edges)
@@ -121,8 +122,8 @@ class LocalMinimumList(abc.MutableSequence):
             minimum_has_horizontal = (max_non_horizontal_index > 0
                                       or min_non_horizontal_index > 0)
             if minimum_has_horizontal:
-                if (maximum_edges[max_non_horizontal_index].bottom.x
-                        > minimum_edges[min_non_horizontal_index].bottom.x):
+                if (maximum_edges.bottom_xs[max_non_horizontal_index]
+                        > minimum_edges.bottom_xs[min_non_horizontal_index]):
                     minimum_is_left = True
                     to_minimum.move_horizontals(to_maximum)
                 else:
@@ -130,9 +131,9 @@ class LocalMinimumList(abc.MutableSequence):
                     to_maximum.move_horizontals(to_minimum)
             else:
                 minimum_is_left = (
-                        maximum_edges[max_non_horizontal_index].slope
-                        <= minimum_edges[min_non_horizontal_index].slope)
-            min_front = minimum_edges[0]
+                        maximum_edges.slopes[max_non_horizontal_index]
+                        <= minimum_edges.slopes[min_non_horizontal_index])
+            min_front_y = minimum_edges.bottom_ys[0]
             if last_maximum:
                 to_minimum.maximum_bound = last_maximum
             to_minimum.polygon_kind = to_maximum.polygon_kind = polygon_kind
@@ -142,7 +143,7 @@ class LocalMinimumList(abc.MutableSequence):
                 to_minimum.winding_delta = -1
                 to_maximum.winding_delta = 1
                 minimum = LocalMinimum(to_maximum, to_minimum,
-                                       min_front.bottom.y,
+                                       min_front_y,
                                        minimum_has_horizontal)
                 if last_maximum is None:
                     first_minimum = minimum.right_bound
@@ -155,7 +156,7 @@ class LocalMinimumList(abc.MutableSequence):
                 to_minimum.winding_delta = -1
                 to_maximum.winding_delta = 1
                 minimum = LocalMinimum(to_minimum, to_maximum,
-                                       min_front.bottom.y,
+                                       min_front_y,
                                        minimum_has_horizontal)
                 if last_maximum is None:
                     first_minimum = minimum.left_bound
@@ -0,0 +1,70 @@
+from typing import (Any,
+                    Callable,
+                    List,
+                    Tuple)
+
+from .bubble_sort import bubble_sort
+from .hints import Domain
+
+
+def merge_sort(sequence: List[Domain],
+               comparator: Callable[[Domain, Domain], bool],
+               on_swap: Callable[[Domain, Domain], None],
+               key: Callable[[Domain], Any]) -> List[Domain]:
+    """
+    Drop-in replacement for ``bubble_sort`` which finds swaps
+    by merge sort in ``O(n log n + k log k)`` time for ``k`` swaps
+    and reports them in the same order as ``bubble_sort`` would.
+
+    ``comparator`` should hold for elements with non-decreasing keys,
+    if it does not hold for some pair with decreasing keys
+    falls back to ``bubble_sort``.
+    """
+    keys = [key(element) for element in sequence]
+    if all(keys[index] <= keys[index + 1]
+           for index in range(len(keys) - 1)):
+        return sequence[:]
+    indices, larger_predecessors = _merge_sort_indices(keys)
+    swaps = []  # type: List[Tuple[int, int, int, int]]
+    for index, predecessors in enumerate(larger_predecessors):
+        # in each pass of the bubble sort
+        # element gets overtaken by the largest of its predecessors
+        # (latest one among equal), so overtakes order is descending
+        predecessors.sort(key=lambda predecessor: (keys[predecessor],
+                                                   predecessor),
+                          reverse=True)
+        for pass_index, predecessor in enumerate(predecessors):
+            if comparator(sequence[predecessor], sequence[index]):
+                return bubble_sort(sequence, comparator, on_swap)
+            swaps.append((pass_index, index - pass_index - 1, predecessor,
+                          index))
+    swaps.sort()
+    for _, _, predecessor, index in swaps:
+        on_swap(sequence[predecessor], sequence[index])
+    return [sequence[index] for index in indices]
+
+
+def _merge_sort_indices(keys: List[Any]) -> Tuple[List[int], List[List[int]]]:
+    larger_predecessors = [[] for _ in keys]  # type: List[List[int]]
+    indices = list(range(len(keys)))
+    step = 1
+    while step < len(indices):
+        merged = []  # type: List[int]
+        for start in range(0, len(indices), 2 * step):
+            left = indices[start:start + step]
+            right = indices[start + step:start + 2 * step]
+            left_index = right_index = 0
+            while left_index < len(left) and right_index < len(right):
+                if keys[left[left_index]] <= keys[right[right_index]]:
+                    merged.append(left[left_index])
+                    left_index += 1
+                else:
+                    larger_predecessors[right[right_index]].extend(
+                            left[left_index:])
+                    merged.append(right[right_index])
+                    right_index += 1
+            merged.extend(left[left_index:])
+            merged.extend(right[right_index:])
+        indices = merged
+        step *= 2
+    return indices, larger_predecessors
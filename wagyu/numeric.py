@@ -0,0 +1,100 @@
+"""Numeric kernel mirroring C++ floating point helpers used by wagyu."""
+import math
+import struct
+
+from .hints import Coordinate
+
+MAX_ULPS = 4
+# integers below this limit are more than ``MAX_ULPS`` apart from each other
+EXACT_INTEGERS_LIMIT = 1 << 50
+SIGN_BIT_MASK = 1 << 63
+UINT64_MASK = (1 << 64) - 1
+INT32_MASK = (1 << 32) - 1
+INT32_OFFSET = 1 << 31
+INT64_MAX = (1 << 63) - 1
+INT64_MIN = -(1 << 63)
+# biased key of both zeros is ``SIGN_BIT_MASK``
+# and the nearest ``MAX_ULPS`` keys belong to the smallest subnormals
+MAX_ALMOST_ZERO = MAX_ULPS * math.ldexp(1., -1074)
+# ``MAX_ULPS`` units of the last place of a normal float
+# relative to its magnitude with a margin for rounding
+MAX_ALMOST_EQUAL_RELATIVE_DIFFERENCE = math.ldexp(1., -48)
+
+_double_to_bits = struct.Struct('<d').pack
+_bits_to_uint64 = struct.Struct('<Q').unpack
+
+
+def are_floats_almost_equal(left: float, right: float,
+                            *,
+                            max_ulps: int = MAX_ULPS) -> bool:
+    """
+    Equivalent of ``FloatingPoint::AlmostEquals`` from Google Test.
+    """
+    if left == right:
+        return True
+    elif (type(left) is int and type(right) is int
+          and -EXACT_INTEGERS_LIMIT < left < EXACT_INTEGERS_LIMIT
+          and -EXACT_INTEGERS_LIMIT < right < EXACT_INTEGERS_LIMIT):
+        return False
+    elif left != left or right != right:
+        # NaNs are not equal to anything
+        return False
+    return abs(float_to_biased(left) - float_to_biased(right)) <= max_ulps
+
+
+def float_to_biased(value: float) -> int:
+    """
+    Returns key which differs from keys of adjacent floats by one.
+    """
+    bits, = _bits_to_uint64(_double_to_bits(value))
+    return ((-bits) & UINT64_MASK
+            if bits & SIGN_BIT_MASK
+            else bits | SIGN_BIT_MASK)
+
+
+def is_float_almost_zero(value: float) -> bool:
+    return -MAX_ALMOST_ZERO <= value <= MAX_ALMOST_ZERO
+
+
+def max_almost_equal_difference(value: float) -> float:
+    """
+    Returns upper bound of differences between ``value``
+    and floats which are almost equal to it.
+    """
+    return abs(value) * MAX_ALMOST_EQUAL_RELATIVE_DIFFERENCE + MAX_ALMOST_ZERO
+
+
+def round_half_up(number: Coordinate) -> int:
+    """
+    Equivalent of C++'s ``std::llround``.
+    """
+    integer = int(number)
+    # difference with truncated value is exact for floats
+    fraction = number - integer
+    if fraction >= 0.5:
+        return integer + 1
+    elif fraction <= -0.5:
+        return integer - 1
+    return integer
+
+
+def to_int32(value: int) -> int:
+    """
+    Wraps integer value to C++'s ``std::int32_t`` range.
+    """
+    return ((value + INT32_OFFSET) & INT32_MASK) - INT32_OFFSET
+
+
+def to_int64(value: Coordinate) -> int:
+    """
+    Converts integral value to C++'s ``std::int64_t`` exactly.
+    """
+    try:
+        result = int(value)
+    except (OverflowError, ValueError):
+        result = None
+    if result is None or result != value or not (INT64_MIN <= result
+                                                 <= INT64_MAX):
+        raise ValueError('Coordinate should be an integer '
+                         'in 64-bit range, but found {!r}.'.format(value))
+    return result
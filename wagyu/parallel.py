@@ -0,0 +1,100 @@
+import os
+from array import array
+from concurrent.futures import (Executor,
+                                ProcessPoolExecutor)
+from functools import partial
+from itertools import chain
+from typing import (Iterable,
+                    List,
+                    Optional,
+                    Tuple,
+                    Type)
+
+from .edge import to_coordinates_typecode
+from .enums import (FillKind,
+                    OperationKind)
+from .hints import Coordinate
+from .linear_ring import LinearRing
+from .point import Point
+from .polygon import (Multipolygon,
+                      Polygon)
+from .wagyu import Wagyu
+
+PackedLinearRing = array
+PackedPolygon = Tuple[PackedLinearRing, ...]
+PackedMultipolygon = Tuple[PackedPolygon, ...]
+
+
+def map_execute(pairs: Iterable[Tuple[Polygon, Polygon]],
+                operation_kind: OperationKind,
+                subject_fill_type: FillKind = FillKind.EVEN_ODD,
+                clip_fill_type: FillKind = FillKind.EVEN_ODD,
+                reverse_output: bool = False,
+                coordinate_kind: Type[Coordinate] = float,
+                *,
+                executor: Optional[Executor] = None,
+                max_workers: Optional[int] = None,
+                chunksize: Optional[int] = None) -> List[Multipolygon]:
+    packed_pairs = [(pack_polygon(subject), pack_polygon(clip))
+                    for subject, clip in pairs]
+    if not packed_pairs:
+        return []
+    if chunksize is None:
+        workers_count = max_workers or os.cpu_count() or 1
+        chunksize = max(len(packed_pairs) // (4 * workers_count), 1)
+    function = partial(_execute_packed, operation_kind, subject_fill_type,
+                       clip_fill_type, reverse_output, coordinate_kind)
+    if executor is None:
+        with ProcessPoolExecutor(max_workers) as executor:
+            packed_results = list(executor.map(function, packed_pairs,
+                                               chunksize=chunksize))
+    else:
+        packed_results = list(executor.map(function, packed_pairs,
+                                           chunksize=chunksize))
+    return [unpack_multipolygon(packed_result)
+            for packed_result in packed_results]
+
+
+def pack_linear_ring(linear_ring: LinearRing) -> PackedLinearRing:
+    coordinates = list(chain.from_iterable((point.x, point.y)
+                                           for point in linear_ring))
+    return array(to_coordinates_typecode(coordinates), coordinates)
+
+
+def pack_multipolygon(multipolygon: Multipolygon) -> PackedMultipolygon:
+    return tuple(map(pack_polygon, multipolygon))
+
+
+def pack_polygon(polygon: Polygon) -> PackedPolygon:
+    return tuple(map(pack_linear_ring, polygon))
+
+
+def unpack_linear_ring(packed: PackedLinearRing) -> LinearRing:
+    coordinates = iter(packed)
+    return LinearRing([Point(x, y) for x, y in zip(coordinates, coordinates)])
+
+
+def unpack_multipolygon(packed: PackedMultipolygon) -> Multipolygon:
+    return Multipolygon([unpack_polygon(packed_polygon)
+                         for packed_polygon in packed])
+
+
+def unpack_polygon(packed: PackedPolygon) -> Polygon:
+    return Polygon([unpack_linear_ring(packed_linear_ring)
+                    for packed_linear_ring in packed])
+
+
+def _execute_packed(operation_kind: OperationKind,
+                    subject_fill_type: FillKind,
+                    clip_fill_type: FillKind,
+                    reverse_output: bool,
+                    coordinate_kind: Type[Coordinate],
+                    packed_pair: Tuple[PackedPolygon, PackedPolygon]
+                    ) -> PackedMultipolygon:
+    packed_subject, packed_clip = packed_pair
+    result, = Wagyu.execute_many([(unpack_polygon(packed_subject),
+                                   unpack_polygon(packed_clip))],
+                                 operation_kind, subject_fill_type,
+                                 clip_fill_type, reverse_output,
+                                 coordinate_kind)
+    return pack_multipolygon(result)
@@ -1,4 +1,7 @@
-from typing import (Iterator,
+from typing import (TYPE_CHECKING,
+                    Dict,
+                    Iterable,
+                    Iterator,
                     List,
                     Optional,
                     Tuple)
@@ -9,17 +12,22 @@ from .box import Box
 from .edge import Edge
 from .enums import PointInPolygonResult
 from .hints import Coordinate
+from .numeric import (are_floats_almost_equal,
+                      is_float_almost_zero)
 from .point import Point
-from .utils import (are_floats_almost_equal,
-                    are_floats_greater_than_or_equal,
-                    is_float_almost_zero)
+from .utils import are_floats_greater_than_or_equal
+
+if TYPE_CHECKING:
+    from .ring import Ring
+
+# doubled area, size & box of a ring
+DoubledStats = Tuple[Coordinate, int, Box]
 
 
 class PointNode:
     __slots__ = 'x', 'y', 'prev', 'next', 'ring'
 
     def __init__(self, x: Coordinate, y: Coordinate) -> None:
-        from .ring import Ring
         self.x = x
         self.y = y
         self.prev = self  # type: PointNode
@@ -89,7 +97,7 @@ class PointNode:
         return node
 
     @property
-    def stats(self) -> Tuple[float, int, Box]:
+    def doubled_stats(self) -> DoubledStats:
         area = size = 0
         min_x = max_x = self.x
         min_y = max_y = self.y
@@ -108,7 +116,12 @@ class PointNode:
             cursor = cursor.next
             if cursor is self:
                 break
-        return area / 2, size, Box(Point(min_x, min_y), Point(max_x, max_y))
+        return area, size, Box(Point(min_x, min_y), Point(max_x, max_y))
+
+    @property
+    def stats(self) -> Tuple[float, int, Box]:
+        doubled_area, size, box = self.doubled_stats
+        return doubled_area / 2, size, box
 
     def is_bottom_to(self, other: 'PointNode') -> bool:
         node = self.prev
@@ -159,6 +172,68 @@ def maybe_point_node_to_points(node: Optional[PointNode]) -> List[Point]:
                                     for sub_node in node]
 
 
+def split_doubled_stats(first: PointNode,
+                        second: PointNode,
+                        doubled_stats: DoubledStats
+                        ) -> Tuple[DoubledStats, DoubledStats]:
+    """
+    Returns doubled stats of rings starting from given nodes
+    which have the same coordinates and were split from a ring
+    with given doubled stats.
+
+    Only the smaller ring is walked if its stats determine the larger's ones,
+    which is the case for integral coordinates when the smaller ring
+    does not touch sides of the box of the original ring.
+    """
+    # rings are walked in lockstep till the smaller one is closed
+    first_cursor, second_cursor = first.next, second.next
+    while first_cursor is not first and second_cursor is not second:
+        first_cursor, second_cursor = first_cursor.next, second_cursor.next
+    smaller, larger = ((first, second)
+                       if first_cursor is first
+                       else (second, first))
+    smaller_stats = smaller.doubled_stats
+    doubled_area, size, box = doubled_stats
+    smaller_doubled_area, smaller_size, smaller_box = smaller_stats
+    if (type(doubled_area) is int and type(smaller_doubled_area) is int
+            and smaller_box.minimum.x > box.minimum.x
+            and smaller_box.minimum.y > box.minimum.y
+            and smaller_box.maximum.x < box.maximum.x
+            and smaller_box.maximum.y < box.maximum.y):
+        # edges' contributions to the area of the original ring
+        # are split between rings since splitting nodes are equal,
+        # and extrema of the original ring are left in the larger one
+        larger_stats = (doubled_area - smaller_doubled_area,
+                        size - smaller_size,
+                        Box(Point(box.minimum.x, box.minimum.y),
+                            Point(box.maximum.x, box.maximum.y)))
+    else:
+        larger_stats = larger.doubled_stats
+    return ((smaller_stats, larger_stats)
+            if smaller is first
+            else (larger_stats, smaller_stats))
+
+
+def group_repeated_nodes(nodes: Iterable[PointNode]
+                         ) -> List[List[PointNode]]:
+    """
+    Returns groups of two or more nodes with the same coordinates
+    ordered like runs of equal nodes sorted by ``node_key``,
+    nodes of each group keep their relative order.
+    """
+    groups = {}  # type: Dict[Tuple[Coordinate, Coordinate], List[PointNode]]
+    for node in nodes:
+        key = node.x, node.y
+        group = groups.get(key)
+        if group is None:
+            groups[key] = [node]
+        else:
+            group.append(node)
+    result = [group for group in groups.values() if len(group) > 1]
+    result.sort(key=lambda group: node_key(group[0]))
+    return result
+
+
 def node_key(node: PointNode) -> Tuple[Coordinate, Coordinate]:
     return -node.y, node.x
 
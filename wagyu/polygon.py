@@ -1,15 +1,22 @@
+from array import array
 from collections import abc
-from typing import (Iterable,
+from functools import partial
+from operator import is_not
+from typing import (Any,
+                    Iterable,
                     List,
                     Optional)
 
 from reprit.base import generate_repr
 
+from .hints import MultipolygonArrays
 from .linear_ring import LinearRing
 from .point_node import (PointNode,
                          point_node_to_point)
 from .ring import Ring
 
+_is_not_none = partial(is_not, None)
+
 
 class Polygon(abc.Sequence):
     __slots__ = 'linear_rings',
@@ -30,6 +37,10 @@ class Polygon(abc.Sequence):
     def __len__(self) -> int:
         return len(self.linear_rings)
 
+    @classmethod
+    def from_arrays(cls, arrays: Iterable[Any]) -> 'Polygon':
+        return cls([LinearRing.from_array(array) for array in arrays])
+
     @classmethod
     def from_ring(cls, ring: Ring, reverse_output: bool) -> 'Polygon':
         return cls([point_node_to_linear_ring(ring.node, reverse_output)])
@@ -72,21 +83,57 @@ class Multipolygon(abc.Sequence):
 
 def rings_to_polygons(rings: Iterable[Optional[Ring]],
                       reverse_output: bool) -> Iterable[Polygon]:
-    for ring in rings:
-        if ring is None:
-            continue
+    for ring in filter(_is_not_none, rings):
         polygon = Polygon.from_ring(ring, reverse_output)
         yield polygon
-        for child in ring.children:
-            if child is None:
-                continue
+        children = list(filter(_is_not_none, ring.children))
+        for child in children:
             polygon.append(child, reverse_output)
-        for child in ring.children:
-            if child is None:
-                continue
+        for child in children:
             yield from rings_to_polygons(child.children, reverse_output)
 
 
+def rings_to_arrays(rings: Iterable[Optional[Ring]],
+                    reverse_output: bool,
+                    coordinates_typecode: str = 'd') -> MultipolygonArrays:
+    coordinates, rings_offsets, polygons_offsets = (
+        array(coordinates_typecode), array('q', [0]), array('q', [0]))
+    fill_arrays_with_rings(rings, reverse_output, coordinates, rings_offsets,
+                           polygons_offsets)
+    return coordinates, rings_offsets, polygons_offsets
+
+
+def fill_arrays_with_rings(rings: Iterable[Optional[Ring]],
+                           reverse_output: bool,
+                           coordinates: array,
+                           rings_offsets: array,
+                           polygons_offsets: array) -> None:
+    for ring in filter(_is_not_none, rings):
+        fill_arrays_with_point_node(ring.node, reverse_output, coordinates,
+                                    rings_offsets)
+        children = list(filter(_is_not_none, ring.children))
+        for child in children:
+            fill_arrays_with_point_node(child.node, reverse_output,
+                                        coordinates, rings_offsets)
+        polygons_offsets.append(len(rings_offsets) - 1)
+        for child in children:
+            fill_arrays_with_rings(child.children, reverse_output, coordinates,
+                                   rings_offsets, polygons_offsets)
+
+
+def fill_arrays_with_point_node(node: PointNode,
+                                reverse_output: bool,
+                                coordinates: array,
+                                rings_offsets: array) -> None:
+    for cursor in (iter if reverse_output else reversed)(node):
+        coordinates.append(cursor.x)
+        coordinates.append(cursor.y)
+    # close the ring
+    coordinates.append(node.x)
+    coordinates.append(node.y)
+    rings_offsets.append(len(coordinates) // 2)
+
+
 def point_node_to_linear_ring(node: PointNode,
                               reverse_output: bool) -> LinearRing:
     return LinearRing(list(map(point_node_to_point,
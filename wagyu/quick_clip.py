@@ -0,0 +1,106 @@
+from typing import List
+
+from .box import Box
+from .enums import (FillKind,
+                    OperationKind,
+                    PolygonKind)
+from .linear_ring import LinearRing
+from .numeric import round_half_up
+from .point import Point
+from .polygon import (Multipolygon,
+                      Polygon)
+from .wagyu import Wagyu
+
+
+def clip_linear_ring(linear_ring: LinearRing, box: Box) -> LinearRing:
+    points = list(linear_ring)
+    for edge in range(4):
+        if not points:
+            break
+        previous_points, points = points, []
+        start = previous_points[-1]
+        for end in previous_points:
+            if is_point_inside_of_box_edge(end, edge, box):
+                if not is_point_inside_of_box_edge(start, edge, box):
+                    points.append(intersect_with_box_edge(start, end, edge,
+                                                          box))
+                points.append(end)
+            elif is_point_inside_of_box_edge(start, edge, box):
+                points.append(intersect_with_box_edge(start, end, edge, box))
+            start = end
+    if len(points) < 3:
+        return LinearRing([])
+    # close the ring if the first/last point was outside
+    if points[0] != points[-1]:
+        points.append(points[0])
+    return LinearRing(points)
+
+
+def clip_multipolygon(multipolygon: Multipolygon,
+                      box: Box,
+                      subject_fill_type: FillKind = FillKind.EVEN_ODD
+                      ) -> Multipolygon:
+    return _unite_linear_rings([clip_linear_ring(linear_ring, box)
+                                for polygon in multipolygon
+                                for linear_ring in polygon],
+                               subject_fill_type)
+
+
+def clip_polygon(polygon: Polygon,
+                 box: Box,
+                 subject_fill_type: FillKind = FillKind.EVEN_ODD
+                 ) -> Multipolygon:
+    return _unite_linear_rings([clip_linear_ring(linear_ring, box)
+                                for linear_ring in polygon],
+                               subject_fill_type)
+
+
+def intersect_with_box_edge(start: Point,
+                            end: Point,
+                            edge: int,
+                            box: Box) -> Point:
+    if edge == 0:
+        return Point(round_half_up(float(start.x)
+                                   + float(end.x - start.x)
+                                   * float(box.minimum.y - start.y)
+                                   / float(end.y - start.y)),
+                     box.minimum.y)
+    elif edge == 1:
+        return Point(box.maximum.x,
+                     round_half_up(float(start.y)
+                                   + float(end.y - start.y)
+                                   * float(box.maximum.x - start.x)
+                                   / float(end.x - start.x)))
+    elif edge == 2:
+        return Point(round_half_up(float(start.x)
+                                   + float(end.x - start.x)
+                                   * float(box.maximum.y - start.y)
+                                   / float(end.y - start.y)),
+                     box.maximum.y)
+    else:
+        return Point(box.minimum.x,
+                     round_half_up(float(start.y)
+                                   + float(end.y - start.y)
+                                   * float(box.minimum.x - start.x)
+                                   / float(end.x - start.x)))
+
+
+def is_point_inside_of_box_edge(point: Point, edge: int, box: Box) -> bool:
+    if edge == 0:
+        return point.y > box.minimum.y
+    elif edge == 1:
+        return point.x < box.maximum.x
+    elif edge == 2:
+        return point.y < box.maximum.y
+    else:
+        return point.x > box.minimum.x
+
+
+def _unite_linear_rings(linear_rings: List[LinearRing],
+                        subject_fill_type: FillKind) -> Multipolygon:
+    wagyu = Wagyu()
+    for linear_ring in linear_rings:
+        if linear_ring:
+            wagyu.add_linear_ring(linear_ring, PolygonKind.SUBJECT)
+    return wagyu.execute(OperationKind.UNION, subject_fill_type,
+                         FillKind.EVEN_ODD)
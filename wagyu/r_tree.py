@@ -0,0 +1,81 @@
+import math
+from typing import (List,
+                    Tuple)
+
+from .box import Box
+from .hints import Coordinate
+
+NODE_CAPACITY = 16
+
+Bounds = Tuple[Coordinate, Coordinate, Coordinate, Coordinate]
+
+
+class RTree:
+    """
+    Static R-tree of boxes packed with sort-tile-recursive algorithm.
+
+    Tree is built from boxes' state at creation
+    and is not updated on their further changes.
+    """
+    __slots__ = '_indices', '_levels'
+
+    def __init__(self, boxes: List[Box]) -> None:
+        bounds = [(box.minimum.x, box.minimum.y, box.maximum.x, box.maximum.y)
+                  for box in boxes]
+        self._indices = _sort_tile_recursive(bounds)
+        # levels are stored from leaves to the root,
+        # node with index ``i`` contains nodes of the previous level
+        # with indices starting from ``i * NODE_CAPACITY``
+        level = [bounds[index] for index in self._indices]
+        self._levels = [level]  # type: List[List[Bounds]]
+        while len(level) > 1:
+            level = [_merge_bounds(level[start:start + NODE_CAPACITY])
+                     for start in range(0, len(level), NODE_CAPACITY)]
+            self._levels.append(level)
+
+    def find_supersets(self, box: Box) -> List[int]:
+        """
+        Returns indices of boxes which contain given box in ascending order.
+        """
+        if not self._indices:
+            return []
+        min_x, min_y = box.minimum.x, box.minimum.y
+        max_x, max_y = box.maximum.x, box.maximum.y
+        levels = self._levels
+        result = []  # type: List[int]
+        queue = [(len(levels) - 1, 0)]
+        while queue:
+            level_index, index = queue.pop()
+            node_min_x, node_min_y, node_max_x, node_max_y = (
+                levels[level_index][index])
+            if not (node_min_x <= min_x and node_min_y <= min_y
+                    and node_max_x >= max_x and node_max_y >= max_y):
+                continue
+            elif level_index:
+                start = index * NODE_CAPACITY
+                stop = min(start + NODE_CAPACITY, len(levels[level_index - 1]))
+                queue.extend((level_index - 1, child_index)
+                             for child_index in range(start, stop))
+            else:
+                result.append(self._indices[index])
+        result.sort()
+        return result
+
+
+def _merge_bounds(bounds: List[Bounds]) -> Bounds:
+    min_xs, min_ys, max_xs, max_ys = zip(*bounds)
+    return min(min_xs), min(min_ys), max(max_xs), max(max_ys)
+
+
+def _sort_tile_recursive(bounds: List[Bounds]) -> List[int]:
+    leaves_count = math.ceil(len(bounds) / NODE_CAPACITY)
+    slices_count = math.ceil(math.sqrt(leaves_count))
+    slice_size = max(slices_count, 1) * NODE_CAPACITY
+    indices = sorted(range(len(bounds)),
+                     key=lambda index: bounds[index][0] + bounds[index][2])
+    result = []  # type: List[int]
+    for start in range(0, len(indices), slice_size):
+        result.extend(sorted(indices[start:start + slice_size],
+                             key=lambda index: (bounds[index][1]
+                                                + bounds[index][3])))
+    return result
@@ -12,11 +12,13 @@ from .point_node import (PointNode,
                          maybe_point_node_to_points,
                          node_key,
                          point_in_polygon)
+from .ring_children import RingChildren
 
 
 class Ring:
-    __slots__ = ('index', 'parent', 'children', 'node', 'bottom_node',
-                 'corrected', 'box', '_area', '_size', '_is_hole')
+    __slots__ = ('index', 'children', 'node', 'bottom_node', 'corrected',
+                 'box', '_area', '_depth', '_is_hole', '_orphans', '_parent',
+                 '_size')
 
     def __init__(self,
                  index: int = 0,
@@ -24,8 +26,12 @@ class Ring:
                  points: Optional[List[Point]] = None,
                  corrected: bool = False) -> None:
         self.index = index
-        self.parent = None  # type: Optional[Ring]
-        self.children = children or []
+        self._depth = 0  # type: int
+        # children detached by removal which still refer to the ring
+        # as their parent, so they should receive depths updates
+        self._orphans = []  # type: List[Ring]
+        self._parent = None  # type: Optional[Ring]
+        self.children = RingChildren(children or ())
         self.node = (None
                      if not points
                      else node_from_ring_points(points, self))
@@ -62,12 +68,9 @@ class Ring:
 
     @property
     def depth(self) -> int:
-        result = 0
-        cursor = self.parent
-        while cursor is not None:
-            result += 1
-            cursor = cursor.parent
-        return result
+        # removed rings are detached from children of their parents,
+        # so their cached depths are not updated on ancestors' reparenting
+        return self._depth if self.node is not None else _to_depth(self)
 
     @property
     def is_hole(self) -> bool:
@@ -75,6 +78,30 @@ class Ring:
             self.recalculate_stats()
         return self._is_hole
 
+    @property
+    def parent(self) -> Optional['Ring']:
+        return self._parent
+
+    @parent.setter
+    def parent(self, value: Optional['Ring']) -> None:
+        self._parent = value
+        # depths of descendants are updated eagerly,
+        # so they can be read in constant time
+        queue = [self]
+        while queue:
+            ring = queue.pop()
+            depth = 0 if ring._parent is None else ring._parent.depth + 1
+            if ring._depth == depth and ring is not self:
+                continue
+            ring._depth = depth
+            queue.extend(child
+                         for child in ring.children
+                         if child is not None and child._parent is ring)
+            ring._orphans = [orphan
+                             for orphan in ring._orphans
+                             if orphan._parent is ring]
+            queue.extend(ring._orphans)
+
     @property
     def points(self) -> List[Point]:
         return maybe_point_node_to_points(self.node)
@@ -138,12 +165,13 @@ class Ring:
         return result is PointInPolygonResult.INSIDE
 
     def is_descendant_of(self, other: 'Ring') -> bool:
-        cursor = self.parent
-        while cursor is not None:
-            if cursor is other:
-                return True
-            cursor = cursor.parent
-        return False
+        depth, other_depth = self.depth, other.depth
+        if other_depth >= depth:
+            return False
+        cursor = self._parent
+        for _ in range(depth - other_depth - 1):
+            cursor = cursor._parent
+        return cursor is other
 
     def recalculate_stats(self) -> None:
         if self.node is not None:
@@ -178,16 +206,24 @@ def node_from_ring_points(points: List[Point], ring: Ring) -> PointNode:
     return result
 
 
-def remove_from_children(ring: Ring, children: List[Optional[Ring]]) -> None:
-    for index, candidate in enumerate(children):
-        if candidate is ring:
-            children[index] = None
-            return
+def _to_depth(ring: Ring) -> int:
+    result = 0
+    cursor = ring.parent
+    while cursor is not None:
+        result += 1
+        cursor = cursor.parent
+    return result
+
+
+def detach_child(ring: Ring, index: int) -> None:
+    child = ring.children[index]
+    ring.children[index] = None
+    ring._orphans.append(child)
+
+
+def remove_from_children(ring: Ring, children: RingChildren) -> None:
+    children.discard(ring)
 
 
-def set_to_children(ring: Ring, children: List[Optional[Ring]]) -> None:
-    for index, child in enumerate(children):
-        if child is None:
-            children[index] = ring
-            return
-    children.append(ring)
+def set_to_children(ring: Ring, children: RingChildren) -> None:
+    children.add(ring)
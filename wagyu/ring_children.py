@@ -0,0 +1,158 @@
+from heapq import (heapify,
+                   heappop,
+                   heappush)
+from typing import (TYPE_CHECKING,
+                    Dict,
+                    Iterable,
+                    List,
+                    Optional,
+                    Union)
+
+if TYPE_CHECKING:
+    from .ring import Ring
+
+
+class RingChildren(list):
+    """
+    List of ring children with constant time search of a child
+    and logarithmic time search of the first free slot.
+
+    Removed children leave ``None`` slots like in the C++ port,
+    which are filled by the next insertions in ascending order.
+    Indices of children & free slots are cached on assignments & appends,
+    other modifications make the cache rebuilt lazily on the next search.
+    """
+    __slots__ = '_indices', '_free_indices', '_stale'
+
+    def __init__(self, children: Iterable[Optional['Ring']] = ()) -> None:
+        super().__init__(children)
+        # cached indices are keyed by children's identities,
+        # free indices form a heap which can contain outdated entries
+        self._indices = {}  # type: Dict[int, int]
+        self._free_indices = []  # type: List[int]
+        self._stale = True
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        self._stale = True
+        super().__delitem__(index)
+
+    def __iadd__(self, children: Iterable[Optional['Ring']]
+                 ) -> 'RingChildren':
+        self._stale = True
+        return super().__iadd__(children)
+
+    def __imul__(self, count: int) -> 'RingChildren':
+        self._stale = True
+        return super().__imul__(count)
+
+    def __repr__(self) -> str:
+        return '{}.{}({})'.format(type(self).__module__,
+                                  type(self).__qualname__,
+                                  super().__repr__())
+
+    def __setitem__(self,
+                    index: Union[int, slice],
+                    value: Optional['Ring']) -> None:
+        super().__setitem__(index, value)
+        if isinstance(index, slice):
+            self._stale = True
+        elif not self._stale:
+            self._cache(index + len(self) if index < 0 else index, value)
+
+    def add(self, ring: 'Ring') -> None:
+        """
+        Places given ring into the first free slot
+        or appends it if there is no such slot.
+        """
+        self._refresh()
+        free_indices = self._free_indices
+        while free_indices:
+            index = heappop(free_indices)
+            if index < len(self) and self[index] is None:
+                self[index] = ring
+                return
+        self.append(ring)
+
+    def append(self, ring: Optional['Ring']) -> None:
+        super().append(ring)
+        if not self._stale:
+            self._cache(len(self) - 1, ring)
+
+    def clear(self) -> None:
+        self._stale = True
+        super().clear()
+
+    def discard(self, ring: 'Ring') -> None:
+        """
+        Frees the slot of the first occurrence of given ring if any.
+        """
+        index = self.find(ring)
+        if index < len(self):
+            self[index] = None
+
+    def extend(self, children: Iterable[Optional['Ring']]) -> None:
+        self._stale = True
+        super().extend(children)
+
+    def find(self, ring: 'Ring') -> int:
+        """
+        Equivalent of C++'s ``std::find`` for ring children.
+        """
+        self._refresh()
+        index = self._to_cached_index(ring)
+        if index is not None:
+            return index
+        # cache misses only on absent or repeated rings
+        for index, child in enumerate(self):
+            if child is ring:
+                return index
+        return len(self)
+
+    def insert(self, index: int, ring: Optional['Ring']) -> None:
+        self._stale = True
+        super().insert(index, ring)
+
+    def pop(self, index: int = -1) -> Optional['Ring']:
+        self._stale = True
+        return super().pop(index)
+
+    def remove(self, ring: Optional['Ring']) -> None:
+        self._stale = True
+        super().remove(ring)
+
+    def reverse(self) -> None:
+        self._stale = True
+        super().reverse()
+
+    def sort(self, *args, **kwargs) -> None:
+        self._stale = True
+        super().sort(*args, **kwargs)
+
+    def _cache(self, index: int, child: Optional['Ring']) -> None:
+        if child is None:
+            heappush(self._free_indices, index)
+        else:
+            cached_index = self._to_cached_index(child)
+            if cached_index is None or cached_index > index:
+                self._indices[id(child)] = index
+
+    def _refresh(self) -> None:
+        if not self._stale:
+            return
+        self._indices = {}
+        self._free_indices = []
+        for index in range(len(self) - 1, -1, -1):
+            child = self[index]
+            if child is None:
+                self._free_indices.append(index)
+            else:
+                self._indices[id(child)] = index
+        heapify(self._free_indices)
+        self._stale = False
+
+    def _to_cached_index(self, ring: 'Ring') -> Optional[int]:
+        index = self._indices.get(id(ring))
+        return (index
+                if (index is not None and index < len(self)
+                    and self[index] is ring)
+                else None)
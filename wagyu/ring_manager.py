@@ -1,10 +1,12 @@
 import math
+from bisect import bisect_left
 from collections import (defaultdict,
                          deque)
 from functools import partial
 from itertools import groupby
 from operator import is_not
 from typing import (Dict,
+                    Iterator,
                     List,
                     Optional,
                     Set,
@@ -12,40 +14,52 @@ from typing import (Dict,
 
 from reprit.base import generate_repr
 
+from .active_bounds import ActiveBounds
 from .bound import (Bound,
                     insert_bound_into_abl,
-                    intersection_compare,
-                    set_winding_count)
-from .bubble_sort import bubble_sort
+                    set_winding_count,
+                    sort_intersecting_bounds)
 from .enums import (EdgeSide,
                     FillKind,
                     OperationKind,
-                    PolygonKind)
-from .hints import Coordinate
+                    PolygonKind,
+                    SortingKind)
+from .hints import (Coordinate,
+                    MultipolygonArrays)
+from .hot_pixels import HotPixelsIndex
+from .interrupt import (Interrupter,
+                        interrupt_check)
 from .intersect_node import (IntersectNode,
                              build_intersect_list)
 from .local_minimum import (LocalMinimum,
                             LocalMinimumList)
+from .numeric import (is_float_almost_zero,
+                      round_half_up,
+                      to_int32)
 from .point import Point
-from .point_node import (PointNode,
+from .point_node import (DoubledStats,
+                         PointNode,
                          find_start_and_end_of_collinear_edges,
                          fix_collinear_path,
+                         group_repeated_nodes,
                          has_collinear_edge,
                          maybe_point_node_to_points,
-                         point_node_to_point)
-from .polygon import Multipolygon
+                         point_node_to_point,
+                         split_doubled_stats)
+from .polygon import (Multipolygon,
+                      rings_to_arrays)
+from .r_tree import RTree
 from .ring import (Ring,
+                   detach_child,
                    remove_from_children,
                    set_to_children)
+from .ring_children import RingChildren
+from .scanbeam import ScanbeamQueue
+from .stats import ExecuteStats
 from .utils import (are_floats_greater_than,
                     are_floats_less_than,
-                    find,
-                    find_if,
-                    insort_unique,
-                    is_float_almost_zero,
                     is_odd,
-                    quicksort,
-                    round_half_up)
+                    quicksort)
 
 try:
     from typing import Deque
@@ -61,7 +75,7 @@ def ring_have_points_and_non_zero_area(ring: Ring) -> bool:
 
 class RingManager:
     __slots__ = ('children', 'all_nodes', 'hot_pixels',
-                 '_current_hot_pixel_index',
+                 '_current_hot_pixel_index', '_hot_pixels_index',
                  'nodes', 'rings', 'storage', 'index')
 
     def __init__(self,
@@ -70,13 +84,14 @@ class RingManager:
                  current_hot_pixel_index: Optional[int] = None,
                  rings: Optional[List[Ring]] = None,
                  index: int = 0) -> None:
-        self.children = [] if children is None else children
+        self.children = RingChildren(() if children is None else children)
         self.hot_pixels = [] if hot_pixels is None else hot_pixels
         self._current_hot_pixel_index = (
             None
             if (current_hot_pixel_index is None
                 or current_hot_pixel_index >= len(self.hot_pixels))
             else current_hot_pixel_index)
+        self._hot_pixels_index = None  # type: Optional[HotPixelsIndex]
         self.rings = [] if rings is None else rings
         self.index = index
         self.all_nodes = []  # type: List[Optional[PointNode]]
@@ -132,7 +147,7 @@ class RingManager:
         return sorted(self.rings,
                       reverse=True)
 
-    def add_first_point(self, bound: Bound, active_bounds: List[Bound],
+    def add_first_point(self, bound: Bound, active_bounds: ActiveBounds,
                         point: Point) -> None:
         ring = bound.ring = self.create_ring()
         ring.node = self.create_point_node(ring, point)
@@ -143,7 +158,7 @@ class RingManager:
                                 point: Point,
                                 first_bound: Bound,
                                 second_bound: Bound,
-                                active_bounds: List[Bound]) -> None:
+                                active_bounds: ActiveBounds) -> None:
         self.insert_hot_pixels_in_path(second_bound, point, False)
         self.add_point(first_bound, active_bounds, point)
         if first_bound.ring is second_bound.ring:
@@ -159,10 +174,12 @@ class RingManager:
                                 point: Point,
                                 first_bound: Bound,
                                 second_bound: Bound,
-                                active_bounds: List[Bound]) -> None:
-        if (second_bound.current_edge.is_horizontal
-                or (first_bound.current_edge.slope
-                    > second_bound.current_edge.slope)):
+                                active_bounds: ActiveBounds) -> None:
+        second_slope = second_bound.edges.slopes[
+            second_bound.current_edge_index]
+        if (math.isinf(second_slope)
+                or (first_bound.edges.slopes[first_bound.current_edge_index]
+                    > second_slope)):
             self.add_point(first_bound, active_bounds, point)
             second_bound.last_point = point
             second_bound.ring = first_bound.ring
@@ -175,7 +192,7 @@ class RingManager:
             first_bound.side = EdgeSide.RIGHT
             second_bound.side = EdgeSide.LEFT
 
-    def add_point(self, bound: Bound, active_bounds: List[Bound],
+    def add_point(self, bound: Bound, active_bounds: ActiveBounds,
                   point: Point) -> None:
         if bound.ring is None:
             self.add_first_point(bound, active_bounds, point)
@@ -197,7 +214,7 @@ class RingManager:
             bound.ring.node = new_node
 
     def append_ring(self, first_bound: Bound, second_bound: Bound,
-                    active_bounds: List[Bound]) -> None:
+                    active_bounds: ActiveBounds) -> None:
         # get the start and ends of both output polygons
         first_out_rec = first_bound.ring
         second_out_rec = second_bound.ring
@@ -387,20 +404,25 @@ class RingManager:
                     raise RuntimeError('Unable to find a proper parent ring')
         return new_rings
 
-    def build_hot_pixels(self, minimums: LocalMinimumList) -> None:
+    def build_hot_pixels(self,
+                         minimums: LocalMinimumList,
+                         interrupter: Optional[Interrupter] = None,
+                         sorting_kind: SortingKind = SortingKind.BUBBLE
+                         ) -> None:
         sorted_minimums = sorted(minimums,
                                  reverse=True)
         minimums_index = 0
-        scanbeams = minimums.scanbeams
-        active_bounds = []  # type: List[Optional[Bound]]
+        scanbeams = ScanbeamQueue(minimum.y for minimum in minimums)
+        active_bounds = ActiveBounds()
         scanline_y = math.inf
         while scanbeams or minimums_index < len(minimums):
+            interrupt_check(interrupter)
             try:
                 scanline_y = scanbeams.pop()
             except IndexError:
                 pass
-            active_bounds = self.process_hot_pixel_intersections(scanline_y,
-                                                                 active_bounds)
+            active_bounds = self.process_hot_pixel_intersections(
+                    scanline_y, active_bounds, sorting_kind)
             minimums_index = self.insert_local_minima_into_abl_hot_pixel(
                     scanline_y, sorted_minimums, minimums_index, active_bounds,
                     scanbeams)
@@ -411,6 +433,13 @@ class RingManager:
     def build_result(self, reverse_output: bool) -> Multipolygon:
         return Multipolygon.from_rings(self.children, reverse_output)
 
+    def build_result_arrays(self,
+                            reverse_output: bool,
+                            coordinates_typecode: str = 'd'
+                            ) -> MultipolygonArrays:
+        return rings_to_arrays(self.children, reverse_output,
+                               coordinates_typecode)
+
     def correct_chained_repeats(self,
                                 nodes: List[PointNode],
                                 start: int,
@@ -428,66 +457,11 @@ class RingManager:
                                                  connection_map)
 
     def correct_chained_rings(self) -> None:
-        nodes = self.all_nodes
-        if len(nodes) < 2:
-            return
-        # setup connection map which is a map of rings
-        # and their connection point pairs with other rings
-        connection_map = defaultdict(list)
-
-        # now lets find and process any points that overlap,
-        # we should have solved all situations
-        # where these points would be self intersections of a ring
-        # with earlier processing
-        # so this should just be points where different rings are touching
-        count = 0
-        prev_index = 0
-        index = 1
-        while index < len(nodes):
-            if nodes[prev_index] == nodes[index]:
-                count += 1
-                prev_index += 1
-                index += 1
-                if index < len(nodes):
-                    continue
-                else:
-                    prev_index += 1
-            else:
-                prev_index += 1
-                index += 1
-            if count == 0:
-                continue
-            first_index = prev_index - (count + 1)
-            self.correct_chained_repeats(nodes, first_index, prev_index,
-                                         connection_map)
-            count = 0
+        self._correct_chained_groups(group_repeated_nodes(self.all_nodes))
 
     def correct_collinear_edges(self) -> None:
-        if len(self.all_nodes) < 2:
-            return
-        count = 0
-        prev_index = 0
-        index = 1
-        while index < len(self.all_nodes):
-            prev_node = self.all_nodes[prev_index]
-            node = self.all_nodes[index]
-            if prev_node == node:
-                count += 1
-                prev_index += 1
-                index += 1
-                if index < len(self.all_nodes):
-                    continue
-                else:
-                    prev_index += 1
-            else:
-                prev_index += 1
-                index += 1
-            if count == 0:
-                continue
-            first_index = prev_index - (count + 1)
-            self.correct_collinear_repeats(self.all_nodes, first_index,
-                                           prev_index)
-            count = 0
+        for group in group_repeated_nodes(self.all_nodes):
+            self.correct_collinear_repeats(group, 0, len(group))
 
     def correct_collinear_repeats(self,
                                   nodes: List[PointNode],
@@ -522,11 +496,13 @@ class RingManager:
                 ring.node.reverse()
                 ring.recalculate_stats()
 
-    def correct_repeated_points(self,
-                                new_rings: List[Ring],
-                                nodes: List[PointNode],
-                                start: int,
-                                stop: int) -> None:
+    def correct_repeated_points(
+            self,
+            new_rings: List[Ring],
+            nodes: List[PointNode],
+            start: int,
+            stop: int,
+            rings_stats: Optional[Dict[int, DoubledStats]] = None) -> None:
         for index in range(start, stop):
             node = nodes[index]
             if node.ring is None:
@@ -535,7 +511,8 @@ class RingManager:
                 next_node = nodes[next_index]
                 if next_node.ring is None:
                     continue
-                new_ring = self.correct_self_intersection(node, next_node)
+                new_ring = self.correct_self_intersection(node, next_node,
+                                                          rings_stats)
                 if new_ring is not None:
                     new_rings.append(new_ring)
 
@@ -551,9 +528,12 @@ class RingManager:
         ring.corrected = True
         return True
 
-    def correct_self_intersection(self,
-                                  first_node: PointNode,
-                                  second_node: PointNode) -> Optional[Ring]:
+    def correct_self_intersection(
+            self,
+            first_node: PointNode,
+            second_node: PointNode,
+            rings_stats: Optional[Dict[int, DoubledStats]] = None
+    ) -> Optional[Ring]:
         if first_node.ring is not second_node.ring:
             return None
         ring = first_node.ring
@@ -565,8 +545,21 @@ class RingManager:
         second_node.prev = third_node
         third_node.next = second_node
         result = self.create_ring()
-        first_area, first_size, first_box = first_node.stats
-        second_area, second_size, second_box = second_node.stats
+        if rings_stats is None or id(ring) not in rings_stats:
+            first_stats = first_node.doubled_stats
+            second_stats = second_node.doubled_stats
+        else:
+            first_stats, second_stats = split_doubled_stats(
+                    first_node, second_node, rings_stats[id(ring)])
+        first_doubled_area, first_size, first_box = first_stats
+        second_doubled_area, second_size, second_box = second_stats
+        first_area = first_doubled_area / 2
+        second_area = second_doubled_area / 2
+        if rings_stats is not None:
+            rings_stats[id(ring)], rings_stats[id(result)] = (
+                (first_stats, second_stats)
+                if abs(first_area) > abs(second_area)
+                else (second_stats, first_stats))
         if abs(first_area) > abs(second_area):
             ring.node = first_node
             ring.set_stats(first_area, first_size, first_box)
@@ -582,12 +575,17 @@ class RingManager:
 
     def correct_self_intersections(self, correct_tree: bool) -> bool:
         result = False
-        for ring in self.sorted_rings:
+        # only rings which are not corrected yet can have intersections,
+        # so there is no need to sort the rest
+        for ring in sorted(ring
+                           for ring in self.rings
+                           if not ring.corrected and ring.node is not None):
             if self.correct_ring_self_intersections(ring, correct_tree):
                 result = True
         return result
 
-    def correct_topology(self) -> None:
+    def correct_topology(self,
+                         interrupter: Optional[Interrupter] = None) -> None:
         # sort all the points,
         # this will be used for the locating of chained rings
         # and the collinear edges and only needs to be done once
@@ -595,14 +593,21 @@ class RingManager:
         # Initially the orientations of the rings
         # could be incorrect, we need to adjust them
         self.correct_orientations()
+        interrupt_check(interrupter)
         # We should only have to fix collinear edges once.
         # During this we also correct self intersections
         self.correct_collinear_edges()
+        interrupt_check(interrupter)
         self.correct_self_intersections(False)
+        interrupt_check(interrupter)
         self.correct_tree()
+        # points are not moved during the correction,
+        # so repeated ones are grouped once for all the rounds
+        repeated_nodes_groups = group_repeated_nodes(self.all_nodes)
         fixed_intersections = True
         while fixed_intersections:
-            self.correct_chained_rings()
+            interrupt_check(interrupter)
+            self._correct_chained_groups(repeated_nodes_groups)
             fixed_intersections = self.correct_self_intersections(True)
 
     def correct_tree(self) -> None:
@@ -615,6 +620,8 @@ class RingManager:
         # that no smaller ring could ever contain a larger ring
         # so we can use this to our advantage as we iterate over the rings
         sorted_rings = self.reversed_sorted_rings
+        # ring can only be inside of rings whose boxes contain its box
+        rings_tree = RTree([ring.box for ring in sorted_rings])
         for index, ring in enumerate(sorted_rings):
             if ring.node is None:
                 continue
@@ -625,7 +632,9 @@ class RingManager:
             found = False
             # search in reverse from the current iterator back to the beginning
             # to see if any of those rings might be its parent.
-            for reverse_index in range(index - 1, -1, -1):
+            candidates_indices = rings_tree.find_supersets(ring.box)
+            del candidates_indices[bisect_left(candidates_indices, index):]
+            for reverse_index in reversed(candidates_indices):
                 # If orientations are not different, this can't be its parent.
                 reverse_ring = sorted_rings[reverse_index]
                 if ring.is_hole is reverse_ring.is_hole:
@@ -665,7 +674,7 @@ class RingManager:
                   clip_fill_kind: FillKind,
                   bound_index: int,
                   bound_maximum_index: int,
-                  active_bounds: List[Bound]) -> int:
+                  active_bounds: ActiveBounds) -> int:
         next_bound_index = bound_index + 1
         result = bound_index
         skipped = False
@@ -676,7 +685,9 @@ class RingManager:
                 continue
             skipped = True
             bound = active_bounds[bound_index]
-            self.intersect_bounds(bound.current_edge.top, operation_kind,
+            self.intersect_bounds(bound.edges.get_top(
+                                          bound.current_edge_index),
+                                  operation_kind,
                                   subject_fill_kind, clip_fill_kind, bound,
                                   active_bounds[next_bound_index],
                                   active_bounds)
@@ -687,9 +698,9 @@ class RingManager:
         if (active_bounds[bound_index].ring is not None
                 and active_bounds[bound_maximum_index].ring is not None):
             bound = active_bounds[bound_index]
-            self.add_local_maximum_point(bound.current_edge.top, bound,
-                                         active_bounds[bound_maximum_index],
-                                         active_bounds)
+            self.add_local_maximum_point(
+                    bound.edges.get_top(bound.current_edge_index), bound,
+                    active_bounds[bound_maximum_index], active_bounds)
         elif (active_bounds[bound_index].ring is not None
               or active_bounds[bound_maximum_index].ring is not None):
             raise RuntimeError("DoMaxima error")
@@ -700,22 +711,27 @@ class RingManager:
                       minimums: LocalMinimumList,
                       operation_kind: OperationKind,
                       subject_fill_kind: FillKind,
-                      clip_fill_kind: FillKind) -> None:
+                      clip_fill_kind: FillKind,
+                      interrupter: Optional[Interrupter] = None,
+                      stats: Optional[ExecuteStats] = None,
+                      sorting_kind: SortingKind = SortingKind.BUBBLE
+                      ) -> None:
         sorted_minimums = sorted(minimums,
                                  reverse=True)
-        scanbeams = minimums.scanbeams
-        active_bounds = []  # type: List[Optional[Bound]]
+        scanbeams = ScanbeamQueue(minimum.y for minimum in minimums)
+        active_bounds = ActiveBounds()
         self.current_hot_pixel_index = 0
         minimums_index = 0
         scanline_y = math.inf
         while scanbeams or minimums_index < len(minimums):
+            interrupt_check(interrupter)
             try:
                 scanline_y = scanbeams.pop()
             except IndexError:
                 pass
             self.process_intersections(scanline_y, operation_kind,
                                        subject_fill_kind, clip_fill_kind,
-                                       active_bounds)
+                                       active_bounds, stats, sorting_kind)
             self.update_current_hot_pixel_index(scanline_y)
             # first we process bounds that has already been added
             # to the active bound list -- if the active bound list is empty
@@ -732,31 +748,21 @@ class RingManager:
                     operation_kind, subject_fill_kind, clip_fill_kind,
                     scanline_y, scanbeams, sorted_minimums, minimums_index,
                     active_bounds)
+            if stats is not None:
+                stats.scanbeams_count += 1
+                # processing of edges at top of scanbeam
+                # filters out removed bounds, so there are no ``None``s
+                stats.active_bounds_peak = max(stats.active_bounds_peak,
+                                               len(active_bounds))
 
     def find_and_correct_repeated_points(self, ring: Ring,
                                          new_rings: List[Ring]) -> None:
-        sorted_nodes = ring.sorted_nodes
-        count = 0
-        prev_index = 0
-        index = 1
-        while index < len(sorted_nodes):
-            if sorted_nodes[prev_index] == sorted_nodes[index]:
-                count += 1
-                prev_index += 1
-                index += 1
-                if index < len(sorted_nodes):
-                    continue
-                else:
-                    prev_index += 1
-            else:
-                prev_index += 1
-                index += 1
-            if count == 0:
-                continue
-            first_index = prev_index - (count + 1)
-            self.correct_repeated_points(new_rings, sorted_nodes, first_index,
-                                         prev_index)
-            count = 0
+        # stats of rings split at repeated points are derived
+        # from the stats of the rings they are split from
+        rings_stats = {}  # type: Dict[int, DoubledStats]
+        for group in group_repeated_nodes(ring.node):
+            self.correct_repeated_points(new_rings, group, 0, len(group),
+                                         rings_stats)
 
     def find_intersect_loop(self,
                             connection_map: ConnectionMap,
@@ -828,22 +834,21 @@ class RingManager:
 
     def horizontals_at_top_scanbeam(self,
                                     top_y: Coordinate,
-                                    active_bounds: List[Bound],
+                                    active_bounds: ActiveBounds,
                                     bound_index: int
                                     ) -> Tuple[int, bool]:
         shifted = False
         bound = active_bounds[bound_index]
-        current_edge = bound.current_edge
-        bound.current_x = current_edge.top.x
-        if current_edge.bottom.x < current_edge.top.x:
+        edges, index = bound.edges, bound.current_edge_index
+        bound.current_x = edges.top_xs[index]
+        if edges.bottom_xs[index] < edges.top_xs[index]:
             for next_bound_index in range(bound_index + 1, len(active_bounds)):
                 next_bound = active_bounds[next_bound_index]
                 if (next_bound is not None
                         and next_bound.current_x >= bound.current_x):
                     break
                 if (next_bound is not None
-                        and next_bound.current_edge.top.y != top_y
-                        and next_bound.current_edge.bottom.y != top_y):
+                        and not is_current_edge_ending_at(next_bound, top_y)):
                     self.hot_pixels.append(
                             Point(round_half_up(next_bound.current_x), top_y))
                 active_bounds[bound_index], active_bounds[next_bound_index] = (
@@ -858,8 +863,7 @@ class RingManager:
                         and prev_bound.current_x <= bound.current_x):
                     break
                 if (prev_bound is not None
-                        and prev_bound.current_edge.top.y != top_y
-                        and prev_bound.current_edge.bottom.y != top_y):
+                        and not is_current_edge_ending_at(prev_bound, top_y)):
                     self.hot_pixels.append(
                             Point(round_half_up(prev_bound.current_x), top_y))
                 active_bounds[bound_index], active_bounds[prev_bound_index] = (
@@ -870,7 +874,9 @@ class RingManager:
     def hot_pixels_on_swap(self,
                            first_bound: Bound,
                            second_bound: Bound) -> None:
-        intersection = first_bound.current_edge & second_bound.current_edge
+        intersection = first_bound.edges.intersect(
+                first_bound.current_edge_index, second_bound.edges,
+                second_bound.current_edge_index)
         if intersection is None:
             raise RuntimeError('Trying to find intersection of lines '
                                'that do not intersect')
@@ -884,8 +890,9 @@ class RingManager:
                                     hot_pixel_start: int,
                                     hot_pixel_stop: int,
                                     add_end_point: bool) -> int:
-        x_min = max(bound.current_edge.get_min_x(y), start_x)
-        x_max = min(bound.current_edge.get_max_x(y), end_x)
+        edges, index = bound.edges, bound.current_edge_index
+        x_min = max(edges.get_min_x(index, y), start_x)
+        x_max = min(edges.get_max_x(index, y), end_x)
         for hot_pixel_index in range(hot_pixel_start, hot_pixel_stop):
             hot_pixel = self.hot_pixels[hot_pixel_index]
             if hot_pixel.x < x_min:
@@ -915,8 +922,9 @@ class RingManager:
                                     hot_pixel_start: int,
                                     hot_pixel_stop: int,
                                     add_end_point: bool) -> int:
-        x_min = max(bound.current_edge.get_min_x(y), end_x)
-        x_max = min(bound.current_edge.get_max_x(y), start_x)
+        edges, index = bound.edges, bound.current_edge_index
+        x_min = max(edges.get_min_x(index, y), end_x)
+        x_max = min(edges.get_max_x(index, y), start_x)
         for hot_pixel_index in reversed(range(hot_pixel_start,
                                               hot_pixel_stop)):
             hot_pixel = self.hot_pixels[hot_pixel_index]
@@ -944,10 +952,10 @@ class RingManager:
                                                 subject_fill_kind: FillKind,
                                                 clip_fill_kind: FillKind,
                                                 top_y: Coordinate,
-                                                scanbeams: List[Coordinate],
+                                                scanbeams: ScanbeamQueue,
                                                 minimums: LocalMinimumList,
                                                 minimums_index: int,
-                                                active_bounds: List[Bound]
+                                                active_bounds: ActiveBounds
                                                 ) -> int:
         while (minimums_index < len(minimums)
                and minimums[minimums_index].y == top_y
@@ -969,57 +977,28 @@ class RingManager:
             return
         start_x, start_y = bound.last_point.x, bound.last_point.y
         end_x, end_y = end_point.x, end_point.y
-        for index in range(self.current_hot_pixel_index, 0, -1):
-            if self.hot_pixels[index].y > start_y:
-                break
-        else:
-            index = 0
-        if start_x > end_x:
-            while index < len(self.hot_pixels):
-                y = self.hot_pixels[index].y
-                if y > start_y:
-                    index += 1
-                    continue
-                elif y < end_y:
-                    break
-                first_index = index
-                for index in range(index, len(self.hot_pixels)):
-                    if self.hot_pixels[index].y != y:
-                        break
-                else:
-                    index = len(self.hot_pixels)
-                last_index = index
-                self.hot_pixel_set_right_to_left(
-                        y, start_x, end_x, bound, first_index, last_index,
-                        y != end_point.y or add_end_point)
-        else:
-            while index < len(self.hot_pixels):
-                y = self.hot_pixels[index].y
-                if y > start_y:
-                    index += 1
-                    continue
-                elif y < end_y:
-                    break
-                first_index = index
-                for index in range(index, len(self.hot_pixels)):
-                    if self.hot_pixels[index].y != y:
-                        break
-                else:
-                    index = len(self.hot_pixels)
-                last_index = index
-                self.hot_pixel_set_left_to_right(
-                        y, start_x, end_x, bound, first_index, last_index,
-                        y != end_point.y or add_end_point)
+        hot_pixels_index = self._hot_pixels_index
+        rows = (hot_pixels_index.rows(start_y, end_y, min(start_x, end_x),
+                                      max(start_x, end_x))
+                if (hot_pixels_index is not None
+                    and hot_pixels_index.indexes(self.hot_pixels))
+                else self._to_hot_pixels_rows(start_y, end_y))
+        hot_pixel_set = (self.hot_pixel_set_right_to_left
+                         if start_x > end_x
+                         else self.hot_pixel_set_left_to_right)
+        for y, first_index, last_index in rows:
+            hot_pixel_set(y, start_x, end_x, bound, first_index, last_index,
+                          y != end_y or add_end_point)
         bound.last_point = end_point
 
     def insert_lm_left_and_right_bound(self,
                                        operation_kind: OperationKind,
                                        subject_fill_kind: FillKind,
                                        clip_fill_kind: FillKind,
-                                       scanbeams: List[Coordinate],
+                                       scanbeams: ScanbeamQueue,
                                        left_bound: Bound,
                                        right_bound: Bound,
-                                       active_bounds: List[Bound]) -> None:
+                                       active_bounds: ActiveBounds) -> None:
         bound_index = insert_bound_into_abl(left_bound, right_bound,
                                             active_bounds)
         set_winding_count(bound_index, active_bounds, subject_fill_kind,
@@ -1030,22 +1009,25 @@ class RingManager:
         next_bound.opposite_winding_count = bound.opposite_winding_count
         if left_bound.is_contributing(operation_kind, subject_fill_kind,
                                       clip_fill_kind):
-            self.add_local_minimum_point(bound.current_edge.bottom, bound,
-                                         next_bound, active_bounds)
+            self.add_local_minimum_point(
+                    bound.edges.get_bottom(bound.current_edge_index), bound,
+                    next_bound, active_bounds)
         # add edges' top to scanbeams
-        insort_unique(scanbeams, bound.current_edge.top.y)
-        if not next_bound.current_edge.is_horizontal:
-            insort_unique(scanbeams, next_bound.current_edge.top.y)
+        scanbeams.push(bound.edges.top_ys[bound.current_edge_index])
+        next_edges, next_index = (next_bound.edges,
+                                  next_bound.current_edge_index)
+        if not next_edges.is_horizontal(next_index):
+            scanbeams.push(next_edges.top_ys[next_index])
 
     def insert_local_minima_into_abl(self,
                                      operation_kind: OperationKind,
                                      subject_fill_kind: FillKind,
                                      clip_fill_kind: FillKind,
                                      bot_y: Coordinate,
-                                     scanbeams: List[Coordinate],
+                                     scanbeams: ScanbeamQueue,
                                      minimums: LocalMinimumList,
                                      minimums_index: int,
-                                     active_bounds: List[Bound]) -> int:
+                                     active_bounds: ActiveBounds) -> int:
         while (minimums_index < len(minimums)
                and minimums[minimums_index].y == bot_y):
             minimum = minimums[minimums_index]
@@ -1061,33 +1043,31 @@ class RingManager:
                                                top_y: Coordinate,
                                                minimums: List[LocalMinimum],
                                                minimums_index: int,
-                                               active_bounds: List[Bound],
-                                               scanbeams: List[Coordinate]
+                                               active_bounds: ActiveBounds,
+                                               scanbeams: ScanbeamQueue
                                                ) -> int:
         while (minimums_index < len(minimums)
                and minimums[minimums_index].y == top_y):
             current_lm = minimums[minimums_index]
-            self.hot_pixels.append(current_lm.left_bound.edges[0].bottom)
+            self.hot_pixels.append(current_lm.left_bound.edges.get_bottom(0))
             left_bound, right_bound = (current_lm.left_bound,
                                        current_lm.right_bound)
 
             left_bound.current_edge_index = 0
             left_bound.next_edge_index = 1
-            left_bound.current_x = left_bound.current_edge.bottom.x
+            left_bound.current_x = left_bound.edges.bottom_xs[0]
 
             right_bound.current_edge_index = 0
             right_bound.next_edge_index = 1
-            right_bound.current_x = right_bound.current_edge.bottom.x
+            right_bound.current_x = right_bound.edges.bottom_xs[0]
 
             lb_abl_index = insert_bound_into_abl(left_bound, right_bound,
                                                  active_bounds)
-            lb_abl_current_edge = active_bounds[lb_abl_index].current_edge
-            if not lb_abl_current_edge.is_horizontal:
-                insort_unique(scanbeams, lb_abl_current_edge.top.y)
-            rb_abl_index = lb_abl_index + 1
-            rb_abl_current_edge = active_bounds[rb_abl_index].current_edge
-            if not rb_abl_current_edge.is_horizontal:
-                insort_unique(scanbeams, rb_abl_current_edge.top.y)
+            for bound in (active_bounds[lb_abl_index],
+                          active_bounds[lb_abl_index + 1]):
+                edges, index = bound.edges, bound.current_edge_index
+                if not edges.is_horizontal(index):
+                    scanbeams.push(edges.top_ys[index])
             minimums_index += 1
         return minimums_index
 
@@ -1098,7 +1078,7 @@ class RingManager:
                          clip_fill_kind: FillKind,
                          first_bound: Bound,
                          second_bound: Bound,
-                         active_bounds: List[Bound]) -> None:
+                         active_bounds: ActiveBounds) -> None:
         first_bound_contributing = first_bound.ring is not None
         second_bound_contributing = second_bound.ring is not None
         # update winding counts,
@@ -1110,26 +1090,32 @@ class RingManager:
                 first_bound.winding_count, second_bound.winding_count = (
                     second_bound.winding_count, first_bound.winding_count)
             else:
-                if first_bound.winding_count + second_bound.winding_delta == 0:
-                    first_bound.winding_count = -first_bound.winding_count
-                else:
-                    first_bound.winding_count += second_bound.winding_delta
-                if second_bound.winding_count - first_bound.winding_delta == 0:
-                    second_bound.winding_count = -second_bound.winding_count
-                else:
-                    second_bound.winding_count -= first_bound.winding_delta
+                first_bound_winding_count = to_int32(
+                        first_bound.winding_count + second_bound.winding_delta)
+                first_bound.winding_count = (
+                    to_int32(-first_bound.winding_count)
+                    if first_bound_winding_count == 0
+                    else first_bound_winding_count)
+                second_bound_winding_count = to_int32(
+                        second_bound.winding_count - first_bound.winding_delta)
+                second_bound.winding_count = (
+                    to_int32(-second_bound.winding_count)
+                    if second_bound_winding_count == 0
+                    else second_bound_winding_count)
         else:
             if not second_bound.is_even_odd_fill_kind(subject_fill_kind,
                                                       clip_fill_kind):
-                first_bound.opposite_winding_count += (
-                    second_bound.winding_delta)
+                first_bound.opposite_winding_count = to_int32(
+                        first_bound.opposite_winding_count
+                        + second_bound.winding_delta)
             else:
                 first_bound.opposite_winding_count = int(
                         first_bound.opposite_winding_count == 0)
             if not first_bound.is_even_odd_fill_kind(subject_fill_kind,
                                                      clip_fill_kind):
-                second_bound.opposite_winding_count -= (
-                    first_bound.winding_delta)
+                second_bound.opposite_winding_count = to_int32(
+                        second_bound.opposite_winding_count
+                        - first_bound.winding_delta)
             else:
                 second_bound.opposite_winding_count = int(
                         second_bound.opposite_winding_count == 0)
@@ -1328,11 +1314,11 @@ class RingManager:
                                          subject_fill_kind: FillKind,
                                          clip_fill_kind: FillKind,
                                          top_y: Coordinate,
-                                         scanbeams: List[Coordinate],
-                                         active_bounds: List[Bound],
+                                         scanbeams: ScanbeamQueue,
+                                         active_bounds: ActiveBounds,
                                          minimums_index: int,
                                          minimums: LocalMinimumList
-                                         ) -> Tuple[List[Bound], int]:
+                                         ) -> Tuple[ActiveBounds, int]:
         bound_index = 0
         while bound_index < len(active_bounds):
             bound = active_bounds[bound_index]
@@ -1344,10 +1330,10 @@ class RingManager:
             # but exclude maxima with horizontal edges
             is_maxima_edge = bound.is_maxima(top_y)
             if is_maxima_edge:
-                bound_maximum_index = find(bound.maximum_bound, active_bounds)
+                bound_maximum_index = active_bounds.find(bound.maximum_bound)
                 is_maxima_edge = (bound_maximum_index == len(active_bounds)
-                                  or not (active_bounds[bound_maximum_index]
-                                          .current_edge.is_horizontal)
+                                  or not is_current_edge_horizontal(
+                                        active_bounds[bound_maximum_index])
                                   and (active_bounds[bound_maximum_index]
                                        .is_maxima(top_y)))
                 if is_maxima_edge:
@@ -1357,17 +1343,24 @@ class RingManager:
                     continue
             # 2) promote horizontal edges
             bound = active_bounds[bound_index]
-            if bound.is_intermediate(top_y) and bound.next_edge.is_horizontal:
+            if (bound.is_intermediate(top_y)
+                    and bound.edges.is_horizontal(bound.next_edge_index)):
                 if bound.ring is not None:
                     self.insert_hot_pixels_in_path(
-                            bound, bound.current_edge.top, False)
+                            bound,
+                            bound.edges.get_top(bound.current_edge_index),
+                            False)
                 bound.to_next_edge(scanbeams)
                 if bound.ring is not None:
-                    self.add_point_to_ring(bound, bound.current_edge.bottom)
+                    self.add_point_to_ring(
+                            bound,
+                            bound.edges.get_bottom(bound.current_edge_index))
             else:
-                bound.current_x = bound.current_edge.get_current_x(top_y)
+                bound.current_x = bound.edges.get_current_x(
+                        bound.current_edge_index, top_y)
             bound_index += 1
-        active_bounds = list(filter(partial(is_not, None), active_bounds))
+        active_bounds = ActiveBounds(filter(partial(is_not, None),
+                                            active_bounds))
         minimums_index = self.insert_horizontal_local_minima_into_abl(
                 operation_kind, subject_fill_kind, clip_fill_kind, top_y,
                 scanbeams, minimums, minimums_index, active_bounds)
@@ -1378,7 +1371,9 @@ class RingManager:
         for bound in active_bounds:
             if bound.is_intermediate(top_y):
                 if bound.ring is not None:
-                    self.add_point_to_ring(bound, bound.current_edge.top)
+                    self.add_point_to_ring(
+                            bound,
+                            bound.edges.get_top(bound.current_edge_index))
                 bound.to_next_edge(scanbeams)
         return active_bounds, minimums_index
 
@@ -1387,12 +1382,13 @@ class RingManager:
                            subject_fill_kind: FillKind,
                            clip_fill_kind: FillKind,
                            scanline_y: Coordinate,
-                           scanbeams: List[Coordinate],
+                           scanbeams: ScanbeamQueue,
                            bound_index: int,
-                           active_bounds: List[Optional[Bound]]) -> int:
+                           active_bounds: ActiveBounds) -> int:
         bound = active_bounds[bound_index]
+        edges, index = bound.edges, bound.current_edge_index
         return (self.process_horizontal_left_to_right
-                if bound.current_edge.bottom.x < bound.current_edge.top.x
+                if edges.bottom_xs[index] < edges.top_xs[index]
                 else self.process_horizontal_right_to_left)(
                 operation_kind, subject_fill_kind, clip_fill_kind, scanline_y,
                 scanbeams, bound_index, active_bounds)
@@ -1402,40 +1398,42 @@ class RingManager:
                             subject_fill_kind: FillKind,
                             clip_fill_kind: FillKind,
                             scanline_y: Coordinate,
-                            scanbeams: List[Coordinate],
-                            active_bounds: List[Bound]) -> List[Bound]:
-        active_bounds = list(active_bounds)
+                            scanbeams: ScanbeamQueue,
+                            active_bounds: ActiveBounds) -> ActiveBounds:
+        active_bounds = ActiveBounds(active_bounds)
         index = 0
         while index < len(active_bounds):
             bound = active_bounds[index]
-            if bound is not None and bound.current_edge.is_horizontal:
+            if bound is not None and is_current_edge_horizontal(bound):
                 index = self.process_horizontal(
                         operation_kind, subject_fill_kind, clip_fill_kind,
                         scanline_y, scanbeams, index, active_bounds)
             else:
                 index += 1
-        return list(filter(partial(is_not, None), active_bounds))
+        return ActiveBounds(filter(partial(is_not, None), active_bounds))
 
     def process_horizontal_left_to_right(self,
                                          operation_kind: OperationKind,
                                          subject_fill_kind: FillKind,
                                          clip_fill_kind: FillKind,
                                          scanline_y: Coordinate,
-                                         scanbeams: List[Coordinate],
+                                         scanbeams: ScanbeamQueue,
                                          bound_index: int,
-                                         active_bounds: List[Optional[Bound]]
+                                         active_bounds: ActiveBounds
                                          ) -> int:
         shifted = False
         result = bound_index
         bound = active_bounds[bound_index]
+        edges, edge_index = bound.edges, bound.current_edge_index
+        top_x = edges.top_xs[edge_index]
         is_maxima_edge = bound.is_maxima(scanline_y)
         maximum_bound_index = len(active_bounds)
         if is_maxima_edge:
-            maximum_bound_index = find(bound.maximum_bound, active_bounds)
+            maximum_bound_index = active_bounds.find(bound.maximum_bound)
         hot_pixel_index = self.current_hot_pixel_index
         for hot_pixel_index in range(hot_pixel_index, len(self.hot_pixels)):
             hot_pixel = self.hot_pixels[hot_pixel_index]
-            if ((hot_pixel.y, bound.current_edge.bottom.x)
+            if ((hot_pixel.y, edges.bottom_xs[edge_index])
                     <= (scanline_y, hot_pixel.x)):
                 break
         else:
@@ -1454,20 +1452,21 @@ class RingManager:
                 hot_pixel = self.hot_pixels[hot_pixel_index]
                 if (hot_pixel.y != scanline_y
                         or hot_pixel.x >= round_half_up(next_bound.current_x)
-                        or hot_pixel.x >= bound.current_edge.top.x):
+                        or hot_pixel.x >= top_x):
                     break
                 if bound.ring is not None:
                     self.add_point_to_ring(bound, hot_pixel)
             else:
                 hot_pixel_index = len(self.hot_pixels)
             if are_floats_greater_than(next_bound.current_x,
-                                       float(bound.current_edge.top.x)):
+                                       float(top_x)):
                 break
             # break if we've got to the end of an intermediate horizontal edge,
             # smaller dx's are to the right of larger dx's above the horizontal
-            if (round_half_up(next_bound.current_x) == bound.current_edge.top.x
-                    and bound.next_edge_index < len(bound.edges)
-                    and bound.current_edge.slope < bound.next_edge.slope):
+            if (round_half_up(next_bound.current_x) == top_x
+                    and bound.next_edge_index < len(edges)
+                    and (edges.slopes[edge_index]
+                         < edges.slopes[bound.next_edge_index])):
                 break
             # may be done multiple times
             if bound.ring is not None:
@@ -1479,8 +1478,9 @@ class RingManager:
             # when matching with maximum bound
             if is_maxima_edge and next_bound_index == maximum_bound_index:
                 if bound.ring is not None and next_bound.ring is not None:
-                    self.add_local_maximum_point(bound.current_edge.top, bound,
-                                                 next_bound, active_bounds)
+                    self.add_local_maximum_point(edges.get_top(edge_index),
+                                                 bound, next_bound,
+                                                 active_bounds)
                 active_bounds[maximum_bound_index] = None
                 active_bounds[bound_index] = None
                 return result + (not shifted)
@@ -1498,11 +1498,11 @@ class RingManager:
                                          len(self.hot_pixels)):
                 hot_pixel = self.hot_pixels[hot_pixel_index]
                 if (hot_pixel.y != scanline_y
-                        or hot_pixel.x >= bound.current_edge.top.x):
+                        or hot_pixel.x >= top_x):
                     break
                 self.add_point_to_ring(bound, hot_pixel)
         if bound.ring is not None:
-            self.add_point_to_ring(bound, bound.current_edge.top)
+            self.add_point_to_ring(bound, edges.get_top(edge_index))
         if bound.next_edge_index < len(bound.edges):
             bound.to_next_edge(scanbeams)
         else:
@@ -1514,21 +1514,23 @@ class RingManager:
                                          subject_fill_kind: FillKind,
                                          clip_fill_kind: FillKind,
                                          scanline_y: Coordinate,
-                                         scanbeams: List[Coordinate],
+                                         scanbeams: ScanbeamQueue,
                                          bound_index: int,
-                                         active_bounds: List[Optional[Bound]]
+                                         active_bounds: ActiveBounds
                                          ) -> int:
         bound = active_bounds[bound_index]
+        edges, edge_index = bound.edges, bound.current_edge_index
+        top_x = edges.top_xs[edge_index]
         result = bound_index + 1
         is_maxima_edge = bound.is_maxima(scanline_y)
         maximum_bound_index = len(active_bounds)
         if is_maxima_edge:
-            maximum_bound_index = find(bound.maximum_bound, active_bounds)
+            maximum_bound_index = active_bounds.find(bound.maximum_bound)
         hot_pixel_index = self.current_hot_pixel_index
         for hot_pixel_index in range(hot_pixel_index, len(self.hot_pixels)):
             hot_pixel = self.hot_pixels[hot_pixel_index]
             if ((hot_pixel.y, hot_pixel.x)
-                    >= (scanline_y, bound.current_edge.top.x)):
+                    >= (scanline_y, top_x)):
                 break
         else:
             hot_pixel_index = len(self.hot_pixels)
@@ -1542,20 +1544,21 @@ class RingManager:
                 hot_pixel = self.hot_pixels[hot_pixel_index]
                 if (hot_pixel.y != scanline_y
                         or hot_pixel.x <= round_half_up(prev_bound.current_x)
-                        or hot_pixel.x <= bound.current_edge.top.x):
+                        or hot_pixel.x <= top_x):
                     break
                 if bound.ring is not None:
                     self.add_point_to_ring(bound, hot_pixel)
             else:
                 hot_pixel_index = -1
             if are_floats_less_than(prev_bound.current_x,
-                                    float(bound.current_edge.top.x)):
+                                    float(top_x)):
                 break
             # break if we've got to the end of an intermediate horizontal edge,
             # smaller dx's are to the right of larger dx's above the horizontal
-            if (round_half_up(prev_bound.current_x) == bound.current_edge.top.x
-                    and bound.next_edge_index < len(bound.edges)
-                    and bound.current_edge.slope < bound.next_edge.slope):
+            if (round_half_up(prev_bound.current_x) == top_x
+                    and bound.next_edge_index < len(edges)
+                    and (edges.slopes[edge_index]
+                         < edges.slopes[bound.next_edge_index])):
                 break
             # may be done multiple times
             if bound.ring is not None:
@@ -1567,8 +1570,9 @@ class RingManager:
             # when matching with maximum bound
             if is_maxima_edge and prev_bound_index == maximum_bound_index:
                 if bound.ring is not None and prev_bound.ring is not None:
-                    self.add_local_maximum_point(bound.current_edge.top, bound,
-                                                 prev_bound, active_bounds)
+                    self.add_local_maximum_point(edges.get_top(edge_index),
+                                                 bound, prev_bound,
+                                                 active_bounds)
                 active_bounds[prev_bound_index] = None
                 active_bounds[bound_index] = None
                 return result
@@ -1584,11 +1588,11 @@ class RingManager:
             for hot_pixel_index in range(hot_pixel_index, -1, -1):
                 hot_pixel = self.hot_pixels[hot_pixel_index]
                 if (hot_pixel.y != scanline_y
-                        or hot_pixel.x <= bound.current_edge.top.x):
+                        or hot_pixel.x <= top_x):
                     break
                 self.add_point_to_ring(bound, hot_pixel)
         if bound.ring is not None:
-            self.add_point_to_ring(bound, bound.current_edge.top)
+            self.add_point_to_ring(bound, edges.get_top(edge_index))
         if bound.next_edge_index < len(bound.edges):
             bound.to_next_edge(scanbeams)
         else:
@@ -1597,10 +1601,10 @@ class RingManager:
 
     def process_hot_pixel_edges_at_top_of_scanbeam(self,
                                                    top_y: Coordinate,
-                                                   scanbeams: List[Coordinate],
-                                                   active_bounds: List[Bound]
-                                                   ) -> List[Bound]:
-        active_bounds = list(active_bounds)
+                                                   scanbeams: ScanbeamQueue,
+                                                   active_bounds: ActiveBounds
+                                                   ) -> ActiveBounds:
+        active_bounds = ActiveBounds(active_bounds)
         index = 0
         while index < len(active_bounds):
             bound = active_bounds[index]
@@ -1609,11 +1613,12 @@ class RingManager:
                 continue
             shifted = False
             current_index = index
-            while (bound.current_edge_index < len(bound.edges)
-                   and bound.current_edge.top.y == top_y):
-                current_edge = bound.current_edge
-                self.hot_pixels.append(current_edge.top)
-                if current_edge.is_horizontal:
+            edges = bound.edges
+            while (bound.current_edge_index < len(edges)
+                   and edges.top_ys[bound.current_edge_index] == top_y):
+                edge_index = bound.current_edge_index
+                self.hot_pixels.append(edges.get_top(edge_index))
+                if edges.is_horizontal(edge_index):
                     current_index, shifted = self.horizontals_at_top_scanbeam(
                             top_y, active_bounds, current_index)
                 bound.to_next_edge(scanbeams)
@@ -1621,26 +1626,34 @@ class RingManager:
                 active_bounds[current_index] = None
             if not shifted:
                 index += 1
-        return list(filter(partial(is_not, None), active_bounds))
+        return ActiveBounds(filter(partial(is_not, None), active_bounds))
 
     def process_hot_pixel_intersections(self,
                                         top_y: Coordinate,
-                                        active_bounds: List[Bound]
-                                        ) -> List[Bound]:
+                                        active_bounds: ActiveBounds,
+                                        sorting_kind: SortingKind
+                                        = SortingKind.BUBBLE
+                                        ) -> ActiveBounds:
         update_current_x(active_bounds, top_y)
-        return bubble_sort(active_bounds, intersection_compare,
-                           self.hot_pixels_on_swap)
+        return ActiveBounds(sort_intersecting_bounds(active_bounds,
+                                                     self.hot_pixels_on_swap,
+                                                     sorting_kind))
 
     def process_intersections(self,
                               top_y: Coordinate,
                               operation_kind: OperationKind,
                               subject_fill_kind: FillKind,
                               clip_fill_kind: FillKind,
-                              active_bounds: List[Bound]) -> None:
+                              active_bounds: ActiveBounds,
+                              stats: Optional[ExecuteStats] = None,
+                              sorting_kind: SortingKind = SortingKind.BUBBLE
+                              ) -> None:
         if not active_bounds:
             return
         update_current_x(active_bounds, top_y)
-        _, intersections = build_intersect_list(active_bounds)
+        _, intersections = build_intersect_list(active_bounds, sorting_kind)
+        if stats is not None:
+            stats.intersections_count += len(intersections)
         if not intersections:
             return
         self.process_intersect_list(sorted(intersections), operation_kind,
@@ -1651,16 +1664,16 @@ class RingManager:
                                operation_kind: OperationKind,
                                subject_fill_kind: FillKind,
                                clip_fill_kind: FillKind,
-                               active_bounds: List[Bound]) -> None:
+                               active_bounds: ActiveBounds) -> None:
         for index in range(len(intersections)):
-            first_index = find_if(intersections[index].has_bound,
-                                  active_bounds)
+            first_index = find_intersect_node(intersections[index],
+                                              active_bounds)
             second_index = first_index + 1
             if not intersections[index].has_bound(active_bounds[second_index]):
                 for next_index in range(index + 1, len(intersections)):
                     next_node = intersections[next_index]
-                    candidate_first_index = find_if(next_node.has_bound,
-                                                    active_bounds)
+                    candidate_first_index = find_intersect_node(next_node,
+                                                                active_bounds)
                     candidate_second_index = candidate_first_index + 1
                     if next_node.has_bound(
                             active_bounds[candidate_second_index]):
@@ -1893,14 +1906,39 @@ class RingManager:
         children = (self.children
                     if sibling_ring is None
                     else sibling_ring.children)
+        new_rings_ids = set(map(id, new_rings))
         for child in children:
             if child is None:
                 continue
-            if find(child, new_rings) < len(new_rings):
+            if id(child) in new_rings_ids:
                 continue
             if child.inside_of(new_ring):
                 self.reassign_as_child(child, new_ring)
 
+    def release(self) -> None:
+        """
+        Unlinks owned point nodes and rings from each other,
+        so reference counting can free them all at once
+        without waiting for the cyclic garbage collector.
+        """
+        nodes = list(self.nodes)
+        for ring in self.rings:
+            if ring.node is not None:
+                nodes.extend(ring.node)
+        for node in nodes:
+            node.prev = node.next = node.ring = None
+        for ring in self.rings:
+            # bypassing ``Ring.parent`` setter
+            # since depths of released rings are not used
+            ring._parent = ring.node = ring.bottom_node = None
+            ring._orphans = []
+            ring.children = RingChildren()
+        self.children = RingChildren()
+        self.all_nodes, self.nodes, self.rings = [], [], []
+        self.hot_pixels, self.storage = [], []
+        self._current_hot_pixel_index = None
+        self._hot_pixels_index = None
+
     def remove_duplicate_points(self,
                                 first_node: PointNode,
                                 second_node: PointNode) -> bool:
@@ -1970,7 +2008,9 @@ class RingManager:
                 continue
             if remove_children:
                 self.remove_ring(child, True, False)
-            ring.children[index] = None
+                ring.children[index] = None
+            else:
+                detach_child(ring, index)
         if remove_from_parent:
             # Remove the old child relationship
             old_children = (self.children
@@ -1989,7 +2029,9 @@ class RingManager:
                 continue
             if remove_children:
                 self.remove_ring_and_points(child, True, False)
-            ring.children[index] = None
+                ring.children[index] = None
+            else:
+                detach_child(ring, index)
         if remove_from_parent:
             # remove the old child relationship
             remove_from_children(ring,
@@ -2027,11 +2069,10 @@ class RingManager:
         original.node = None
         original.reset_stats()
 
-    def set_hole_state(self, bound: Bound, active_bounds: List[Bound]) -> None:
-        bound_index = next(index
-                           for index in range(len(active_bounds) - 1, -1, -1)
-                           if active_bounds[index] is bound)
-        bound_index -= 1
+    def set_hole_state(self,
+                       bound: Bound,
+                       active_bounds: ActiveBounds) -> None:
+        bound_index = active_bounds.find(bound) - 1
         bound_temp = None
         while bound_index >= 0:
             current_bound = active_bounds[bound_index]
@@ -2052,16 +2093,91 @@ class RingManager:
         quicksort(self.hot_pixels,
                   hot_pixels_compare)
         self.hot_pixels = [key for key, _ in groupby(self.hot_pixels)]
+        self._hot_pixels_index = HotPixelsIndex(self.hot_pixels)
 
     def update_current_hot_pixel_index(self, scanline_y: Coordinate) -> None:
         while self.hot_pixels[self.current_hot_pixel_index].y > scanline_y:
             self.current_hot_pixel_index += 1
 
+    def _correct_chained_groups(self,
+                                groups: List[List[PointNode]]) -> None:
+        # setup connection map which is a map of rings
+        # and their connection point pairs with other rings
+        connection_map = defaultdict(list)
+
+        # now lets find and process any points that overlap,
+        # we should have solved all situations
+        # where these points would be self intersections of a ring
+        # with earlier processing
+        # so this should just be points where different rings are touching
+        for group in groups:
+            # nodes of the same ring are skipped by processing,
+            # so such groups are cheaply skipped as a whole
+            if not are_nodes_of_different_rings(group):
+                continue
+            self.correct_chained_repeats(group, 0, len(group), connection_map)
+
+    def _to_hot_pixels_rows(self,
+                            max_y: Coordinate,
+                            min_y: Coordinate
+                            ) -> Iterator[Tuple[Coordinate, int, int]]:
+        index = self.current_hot_pixel_index
+        for index in range(index, 0, -1):
+            if self.hot_pixels[index].y > max_y:
+                break
+        else:
+            index = 0
+        while index < len(self.hot_pixels):
+            y = self.hot_pixels[index].y
+            if y > max_y:
+                index += 1
+                continue
+            elif y < min_y:
+                break
+            first_index = index
+            for index in range(index, len(self.hot_pixels)):
+                if self.hot_pixels[index].y != y:
+                    break
+            else:
+                index = len(self.hot_pixels)
+            yield y, first_index, index
+
+
+def are_nodes_of_different_rings(nodes: List[PointNode]) -> bool:
+    ring = None
+    for node in nodes:
+        if node.ring is None:
+            continue
+        elif ring is None:
+            ring = node.ring
+        elif node.ring is not ring:
+            return True
+    return False
+
+
+def is_current_edge_horizontal(bound: Bound) -> bool:
+    return bound.edges.is_horizontal(bound.current_edge_index)
+
+
+def is_current_edge_ending_at(bound: Bound, y: Coordinate) -> bool:
+    edges, index = bound.edges, bound.current_edge_index
+    return edges.top_ys[index] == y or edges.bottom_ys[index] == y
+
+
+def find_intersect_node(node: IntersectNode,
+                        active_bounds: ActiveBounds) -> int:
+    """
+    Equivalent of C++'s ``std::find_if`` with the node's bounds predicate.
+    """
+    return min(active_bounds.find(node.first_bound),
+               active_bounds.find(node.second_bound))
+
 
-def update_current_x(active_bounds: List[Bound], top_y: Coordinate) -> None:
+def update_current_x(active_bounds: ActiveBounds, top_y: Coordinate) -> None:
     for position, bound in enumerate(active_bounds):
         bound.position = position
-        bound.current_x = bound.current_edge.get_current_x(top_y)
+        bound.current_x = bound.edges.get_current_x(bound.current_edge_index,
+                                                    top_y)
 
 
 def hot_pixels_compare(left: Point, right: Point) -> bool:
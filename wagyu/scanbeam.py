@@ -0,0 +1,70 @@
+from heapq import (heapify,
+                   heappop,
+                   heappush)
+from typing import (Dict,
+                    Iterable,
+                    Iterator,
+                    List)
+
+from .hints import Coordinate
+
+
+class ScanbeamQueue:
+    """
+    Max-priority queue of scanbeams' ordinates.
+
+    Pushing ordinate which is already queued has no effect,
+    initial ordinates keep their multiplicities like in sorted scanbeam list.
+    """
+    __slots__ = '_keys', '_counts'
+
+    def __init__(self, ys: Iterable[Coordinate] = ()) -> None:
+        # ordinates are negated to get the largest one first
+        self._keys = [-y for y in ys]  # type: List[Coordinate]
+        heapify(self._keys)
+        self._counts = {}  # type: Dict[Coordinate, int]
+        for key in self._keys:
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+    def __bool__(self) -> bool:
+        return bool(self._keys)
+
+    def __eq__(self, other: 'ScanbeamQueue') -> bool:
+        return (self._counts == other._counts
+                if isinstance(other, ScanbeamQueue)
+                else NotImplemented)
+
+    def __iter__(self) -> Iterator[Coordinate]:
+        """
+        Returns iterator over queued ordinates in ascending order.
+        """
+        return (-key for key in sorted(self._keys,
+                                       reverse=True))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return '{}.{}({!r})'.format(type(self).__module__,
+                                    type(self).__qualname__, list(self))
+
+    def pop(self) -> Coordinate:
+        """
+        Removes and returns the largest queued ordinate.
+        """
+        key = heappop(self._keys)
+        count = self._counts[key] - 1
+        if count:
+            self._counts[key] = count
+        else:
+            del self._counts[key]
+        return -key
+
+    def push(self, y: Coordinate) -> None:
+        """
+        Queues ordinate if it is not queued already.
+        """
+        key = -y
+        if key not in self._counts:
+            self._counts[key] = 1
+            heappush(self._keys, key)
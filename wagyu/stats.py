@@ -0,0 +1,53 @@
+import time
+from contextlib import contextmanager
+from typing import (Iterator,
+                    Optional)
+
+from reprit.base import generate_repr
+
+
+class ExecuteStats:
+    __slots__ = ('build_hot_pixels_time', 'execute_vatti_time',
+                 'correct_topology_time', 'build_result_time',
+                 'scanbeams_count', 'active_bounds_peak',
+                 'intersections_count', 'hot_pixels_count',
+                 'rings_created_count', 'rings_removed_count')
+
+    def __init__(self,
+                 build_hot_pixels_time: float = 0.,
+                 execute_vatti_time: float = 0.,
+                 correct_topology_time: float = 0.,
+                 build_result_time: float = 0.,
+                 scanbeams_count: int = 0,
+                 active_bounds_peak: int = 0,
+                 intersections_count: int = 0,
+                 hot_pixels_count: int = 0,
+                 rings_created_count: int = 0,
+                 rings_removed_count: int = 0) -> None:
+        self.build_hot_pixels_time = build_hot_pixels_time
+        self.execute_vatti_time = execute_vatti_time
+        self.correct_topology_time = correct_topology_time
+        self.build_result_time = build_result_time
+        self.scanbeams_count = scanbeams_count
+        self.active_bounds_peak = active_bounds_peak
+        self.intersections_count = intersections_count
+        self.hot_pixels_count = hot_pixels_count
+        self.rings_created_count = rings_created_count
+        self.rings_removed_count = rings_removed_count
+
+    __repr__ = generate_repr(__init__)
+
+
+@contextmanager
+def measure_phase(stats: Optional[ExecuteStats],
+                  time_attribute: str) -> Iterator[None]:
+    if stats is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        setattr(stats, time_attribute,
+                getattr(stats, time_attribute)
+                + time.perf_counter() - start)
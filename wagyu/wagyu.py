@@ -1,22 +1,41 @@
+from typing import (Iterable,
+                    List,
+                    Optional,
+                    Tuple,
+                    Type)
+
 from reprit.base import generate_repr
 
 from .box import Box
 from .enums import (FillKind,
                     OperationKind,
-                    PolygonKind)
+                    PolygonKind,
+                    SortingKind)
+from .hints import (Coordinate,
+                    MultipolygonArrays)
+from .interrupt import (Interrupter,
+                        interrupt_check)
 from .linear_ring import LinearRing
 from .local_minimum import LocalMinimumList
+from .numeric import to_int64
 from .point import Point
 from .polygon import (Multipolygon,
                       Polygon)
 from .ring_manager import RingManager
+from .stats import (ExecuteStats,
+                    measure_phase)
 
 
 class Wagyu:
-    __slots__ = 'minimums', 'reverse_output'
+    __slots__ = 'coordinate_kind', 'minimums', 'reverse_output'
 
     def __init__(self,
-                 reverse_output: bool = False) -> None:
+                 reverse_output: bool = False,
+                 coordinate_kind: Type[Coordinate] = float) -> None:
+        if coordinate_kind is not float and coordinate_kind is not int:
+            raise ValueError('Coordinate kind should be either float or int, '
+                             'but found {!r}.'.format(coordinate_kind))
+        self.coordinate_kind = coordinate_kind
         self.minimums = LocalMinimumList()
         self.reverse_output = reverse_output
 
@@ -25,6 +44,7 @@ class Wagyu:
     def __eq__(self, other: 'Wagyu') -> bool:
         return (self.minimums == other.minimums
                 and self.reverse_output is other.reverse_output
+                and self.coordinate_kind is other.coordinate_kind
                 if isinstance(other, Wagyu)
                 else NotImplemented)
 
@@ -35,39 +55,40 @@ class Wagyu:
             return Box(minimum, maximum)
         first_set = False
         for local_minimum in self.minimums:
-            left_bound = local_minimum.left_bound
-            if left_bound.edges:
+            left_edges = local_minimum.left_bound.edges
+            if left_edges:
                 if not first_set:
-                    minimum = left_bound.edges[0].top
-                    maximum = left_bound.edges[-1].bottom
+                    minimum = left_edges.get_top(0)
+                    maximum = left_edges.get_bottom(-1)
                     first_set = True
                 else:
-                    minimum.x = min(minimum.x, left_bound.edges[-1].top.x)
-                    minimum.y = min(minimum.y, left_bound.edges[0].top.y)
-                    maximum.x = max(maximum.x, left_bound.edges[-1].top.x)
-                    maximum.y = max(maximum.y, left_bound.edges[-1].bottom.y)
-                for edge in left_bound.edges:
-                    minimum.x = min(minimum.x, edge.bottom.x)
-                    maximum.x = max(maximum.x, edge.bottom.x)
-            right_bound = local_minimum.right_bound
-            if right_bound.edges:
+                    minimum.x = min(minimum.x, left_edges.top_xs[-1])
+                    minimum.y = min(minimum.y, left_edges.top_ys[0])
+                    maximum.x = max(maximum.x, left_edges.top_xs[-1])
+                    maximum.y = max(maximum.y, left_edges.bottom_ys[-1])
+                minimum.x = min(minimum.x, min(left_edges.bottom_xs))
+                maximum.x = max(maximum.x, max(left_edges.bottom_xs))
+            right_edges = local_minimum.right_bound.edges
+            if right_edges:
                 if not first_set:
-                    minimum = right_bound.edges[0].top
-                    maximum = right_bound.edges[-1].bottom
+                    minimum = right_edges.get_top(0)
+                    maximum = right_edges.get_bottom(-1)
                     first_set = True
                 else:
-                    minimum.x = min(minimum.x, right_bound.edges[-1].top.x)
-                    minimum.y = min(minimum.y, right_bound.edges[0].top.y)
-                    maximum.x = max(maximum.x, right_bound.edges[-1].top.x)
-                    maximum.y = max(maximum.y, right_bound.edges[-1].bottom.y)
-                for edge in right_bound.edges:
-                    minimum.x = min(minimum.x, edge.bottom.x)
-                    maximum.x = max(maximum.x, edge.bottom.x)
+                    minimum.x = min(minimum.x, right_edges.top_xs[-1])
+                    minimum.y = min(minimum.y, right_edges.top_ys[0])
+                    maximum.x = max(maximum.x, right_edges.top_xs[-1])
+                    maximum.y = max(maximum.y, right_edges.bottom_ys[-1])
+                minimum.x = min(minimum.x, min(right_edges.bottom_xs))
+                maximum.x = max(maximum.x, max(right_edges.bottom_xs))
         return Box(minimum, maximum)
 
     def add_linear_ring(self,
                         ring: LinearRing,
                         polygon_kind: PolygonKind) -> bool:
+        if self.coordinate_kind is int:
+            ring = LinearRing([Point(to_int64(point.x), to_int64(point.y))
+                               for point in ring])
         return self.minimums.add_linear_ring(ring, polygon_kind)
 
     def add_polygon(self,
@@ -85,15 +106,90 @@ class Wagyu:
     def execute(self,
                 operation_kind: OperationKind,
                 subject_fill_type: FillKind,
-                clip_fill_type: FillKind) -> Multipolygon:
-        if not self.minimums:
-            return Multipolygon([])
+                clip_fill_type: FillKind,
+                interrupter: Optional[Interrupter] = None,
+                stats: Optional[ExecuteStats] = None,
+                sorting_kind: SortingKind = SortingKind.BUBBLE
+                ) -> Multipolygon:
+        manager = RingManager()
+        try:
+            self._execute(manager, operation_kind, subject_fill_type,
+                          clip_fill_type, interrupter, stats, sorting_kind)
+            with measure_phase(stats, 'build_result_time'):
+                return manager.build_result(self.reverse_output)
+        finally:
+            manager.release()
+
+    def execute_to_arrays(self,
+                          operation_kind: OperationKind,
+                          subject_fill_type: FillKind,
+                          clip_fill_type: FillKind,
+                          interrupter: Optional[Interrupter] = None,
+                          stats: Optional[ExecuteStats] = None,
+                          sorting_kind: SortingKind = SortingKind.BUBBLE
+                          ) -> MultipolygonArrays:
         manager = RingManager()
-        manager.build_hot_pixels(self.minimums)
-        manager.execute_vatti(self.minimums, operation_kind, subject_fill_type,
-                              clip_fill_type)
-        manager.correct_topology()
-        return manager.build_result(self.reverse_output)
+        try:
+            self._execute(manager, operation_kind, subject_fill_type,
+                          clip_fill_type, interrupter, stats, sorting_kind)
+            with measure_phase(stats, 'build_result_time'):
+                return manager.build_result_arrays(
+                        self.reverse_output,
+                        'q' if self.coordinate_kind is int else 'd')
+        finally:
+            manager.release()
+
+    def _execute(self,
+                 manager: RingManager,
+                 operation_kind: OperationKind,
+                 subject_fill_type: FillKind,
+                 clip_fill_type: FillKind,
+                 interrupter: Optional[Interrupter],
+                 stats: Optional[ExecuteStats],
+                 sorting_kind: SortingKind) -> None:
+        if not self.minimums:
+            return
+        interrupt_check(interrupter)
+        with measure_phase(stats, 'build_hot_pixels_time'):
+            manager.build_hot_pixels(self.minimums, interrupter,
+                                     sorting_kind)
+        interrupt_check(interrupter)
+        with measure_phase(stats, 'execute_vatti_time'):
+            manager.execute_vatti(self.minimums, operation_kind,
+                                  subject_fill_type, clip_fill_type,
+                                  interrupter, stats, sorting_kind)
+        interrupt_check(interrupter)
+        if stats is None:
+            manager.correct_topology(interrupter)
+            return
+        stats.hot_pixels_count += len(manager.hot_pixels)
+        rings_count, alive_rings_indices = manager.index, {
+            ring.index for ring in manager.rings if ring.node is not None}
+        with measure_phase(stats, 'correct_topology_time'):
+            manager.correct_topology(interrupter)
+        stats.rings_created_count += manager.index - rings_count
+        stats.rings_removed_count += sum(
+                ring.node is None and (ring.index >= rings_count
+                                       or ring.index in alive_rings_indices)
+                for ring in manager.rings)
+
+    @classmethod
+    def execute_many(cls,
+                     pairs: Iterable[Tuple[Polygon, Polygon]],
+                     operation_kind: OperationKind,
+                     subject_fill_type: FillKind = FillKind.EVEN_ODD,
+                     clip_fill_type: FillKind = FillKind.EVEN_ODD,
+                     reverse_output: bool = False,
+                     coordinate_kind: Type[Coordinate] = float
+                     ) -> List[Multipolygon]:
+        result = []
+        for subject, clip in pairs:
+            wagyu = cls(reverse_output, coordinate_kind)
+            wagyu.add_polygon(subject, PolygonKind.SUBJECT)
+            wagyu.add_polygon(clip, PolygonKind.CLIP)
+            result.append(wagyu.execute(operation_kind, subject_fill_type,
+                                        clip_fill_type))
+        return result
 
     def intersect(self,
                   subject_fill_type: FillKind = FillKind.EVEN_ODD,